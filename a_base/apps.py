@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ABaseConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'a_base'
+
+    def ready(self):
+        import a_base.signals
@@ -0,0 +1,3 @@
+from .generators import PRESETS, seed_data
+from .imports import run_import_benchmark
+from .runner import ENDPOINTS, run_benchmarks, compare_results
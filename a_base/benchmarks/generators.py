@@ -0,0 +1,351 @@
+"""
+Генераторы данных для нагрузочных замеров API и стендов.
+Данные создаются пачками через bulk_create (в PostgreSQL - через COPY) и не держатся в памяти целиком.
+Все созданные пользователи имеют телефоны с префиксом BENCHMARK_PHONE_PREFIX.
+"""
+import csv
+import io
+import math
+import random
+from datetime import date, datetime, time, timedelta
+from itertools import islice
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+from faker import Faker
+
+from a_base.models import AppointmentStatus, District, Gender, Region, Specialty
+from appointments.models import Appointment, Review
+from appointments.stats import rebuild_stats
+from appointments.statuses import STATUS_CANCELLED, STATUS_COMPLETED, STATUS_NO_SHOW, STATUS_UPCOMING
+from chat.models import Chat, Message
+from clinics.models import Clinic, ClinicType
+from doctors.availability import refresh_all
+from doctors.models import Doctor, Workplace, WorkplaceSchedule
+from patients.models import Patient
+
+User = get_user_model()
+
+BENCHMARK_PHONE_PREFIX = '+9929'
+ADMIN_PHONE = '+992999999999'
+ADMIN_PASSWORD = 'benchmark'
+
+# Объемы данных: врачи, пациенты, клиники, записи на прием, сообщения в чатах
+PRESETS = {
+    'small': {'doctors': 100, 'patients': 1_000, 'clinics': 20,
+              'appointments': 10_000, 'messages': 50_000},
+    'medium': {'doctors': 1_000, 'patients': 10_000, 'clinics': 100,
+               'appointments': 100_000, 'messages': 500_000},
+    'large': {'doctors': 10_000, 'patients': 100_000, 'clinics': 500,
+              'appointments': 1_000_000, 'messages': 5_000_000},
+    'xlarge': {'doctors': 50_000, 'patients': 1_000_000, 'clinics': 2_000,
+               'appointments': 10_000_000, 'messages': 20_000_000},
+}
+VOLUME_KEYS = ('doctors', 'patients', 'clinics', 'appointments', 'messages')
+
+# Слоты приема: 16 получасовых интервалов с 8:00 в рабочие дни мест работы (пн, ср, пт)
+SLOTS_PER_DAY = 16
+WORKING_WEEKDAYS = (0, 2, 4)
+MESSAGES_PER_CHAT = 100
+REVIEW_PROBABILITY = 0.3
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def phone_number(kind, index):
+    """Телефон вида +9929KNNNNNNN, где K - тип пользователя (0 - врач, 1 - пациент)"""
+    return f'{BENCHMARK_PHONE_PREFIX}{kind}{index:07d}'
+
+
+def is_seeded():
+    return User.objects.filter(phone_number__startswith=BENCHMARK_PHONE_PREFIX).exists()
+
+
+class DataGenerator:
+    """
+    Создает связанный набор данных заданного объема.
+    Генерация детерминирована для одинакового seed.
+    """
+
+    def __init__(self, volumes, seed=0, batch_size=5000, stdout=None, copy=False):
+        self.volumes = volumes
+        self.batch_size = batch_size
+        # COPY доступен только в PostgreSQL, в остальных базах используется bulk_create
+        self.copy = copy and connection.vendor == 'postgresql'
+        self.random = random.Random(seed)
+        self.stdout = stdout
+
+        fake = Faker('ru_RU')
+        fake.seed_instance(seed)
+        # Faker медленный, поэтому значения берутся из заранее сгенерированных наборов
+        self.first_names = [fake.first_name() for _ in range(200)]
+        self.last_names = [fake.last_name() for _ in range(200)]
+        self.middle_names = [fake.middle_name() for _ in range(200)]
+        self.addresses = [fake.street_address() for _ in range(200)]
+        self.sentences = [fake.sentence(nb_words=12) for _ in range(500)]
+        self.texts = [fake.text(max_nb_chars=200) for _ in range(200)]
+
+        # Один хэш пароля на всех пользователей: хэширование - самая дорогая часть создания
+        self.password = make_password(ADMIN_PASSWORD)
+
+    def log(self, message):
+        if self.stdout:
+            self.stdout.write(message)
+
+    def bulk_insert(self, model, objects, returning=True):
+        """
+        Сохраняет объекты пачками, возвращает список первичных ключей.
+        Если ключи не нужны (returning=False), в PostgreSQL данные загружаются через COPY.
+        """
+        if not returning and self.copy:
+            self.copy_insert(model, objects)
+            return []
+        pks = []
+        for chunk in chunked(objects, self.batch_size):
+            created = model.objects.bulk_create(chunk, batch_size=self.batch_size)
+            if returning:
+                pks.extend(obj.pk for obj in created)
+        return pks
+
+    def copy_insert(self, model, objects):
+        """COPY ... FROM STDIN в формате CSV. Значения готовятся теми же методами полей, что и в bulk_create."""
+        fields = [field for field in model._meta.local_concrete_fields if field is not model._meta.auto_field]
+        quote = connection.ops.quote_name
+        sql = "COPY {} ({}) FROM STDIN WITH (FORMAT csv, NULL '\\N')".format(
+            quote(model._meta.db_table), ', '.join(quote(field.column) for field in fields)
+        )
+        for chunk in chunked(objects, self.batch_size):
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            for obj in chunk:
+                row = []
+                for field in fields:
+                    value = field.get_db_prep_save(field.pre_save(obj, True), connection)
+                    row.append('\\N' if value is None else value)
+                writer.writerow(row)
+            buffer.seek(0)
+            with connection.cursor() as cursor:
+                cursor.copy_expert(sql, buffer)
+
+    def generate(self):
+        with transaction.atomic():
+            self.prepare_references()
+            self.create_admin()
+            clinic_ids = self.create_clinics()
+            doctor_user_ids, doctor_ids = self.create_doctors(clinic_ids)
+            patient_user_ids, patient_ids = self.create_patients()
+        self.create_appointments(doctor_ids, patient_ids)
+        self.create_appointment_stats()
+        self.create_next_available()
+        self.create_chats(doctor_user_ids, patient_user_ids)
+
+    def prepare_references(self):
+        """Минимальные справочники, если база пустая"""
+        region, _ = Region.objects.get_or_create(code='99', defaults={'name': 'Бенчмарк'})
+        self.districts = list(District.objects.values_list('id', flat=True)) or [
+            District.objects.create(name='Бенчмарк', region=region).id
+        ]
+        self.genders = list(Gender.objects.values_list('id', flat=True)) or [
+            Gender.objects.create(name='Мужской').id, Gender.objects.create(name='Женский').id
+        ]
+        self.specialties = list(Specialty.objects.values_list('id', flat=True)) or [
+            Specialty.objects.create(name=f'Специальность {index}').id for index in range(20)
+        ]
+        self.clinic_type, _ = ClinicType.objects.get_or_create(name='Поликлиника')
+        self.statuses = {
+            name: AppointmentStatus.objects.get_or_create(name=name)[0].id
+            for name in (STATUS_UPCOMING, STATUS_COMPLETED, STATUS_CANCELLED, STATUS_NO_SHOW)
+        }
+
+    def create_admin(self):
+        User.objects.filter(phone_number=ADMIN_PHONE).delete()
+        User.objects.create_superuser(
+            phone_number=ADMIN_PHONE, first_name='Benchmark', last_name='Admin',
+            password=ADMIN_PASSWORD, date_of_birth=date(1990, 1, 1)
+        )
+
+    def create_clinics(self):
+        count = self.volumes['clinics']
+        self.log(f'Клиники: {count}')
+        return self.bulk_insert(Clinic, (
+            Clinic(
+                name=f'Клиника {index}', clinic_type=self.clinic_type,
+                address=self.random.choice(self.addresses),
+                district_id=self.random.choice(self.districts),
+                latitude=38.5 + self.random.random(), longitude=68.7 + self.random.random(),
+            )
+            for index in range(count)
+        ))
+
+    def build_users(self, kind, count):
+        for index in range(count):
+            yield User(
+                phone_number=phone_number(kind, index),
+                password=self.password,
+                first_name=self.random.choice(self.first_names),
+                last_name=self.random.choice(self.last_names),
+                middle_name=self.random.choice(self.middle_names),
+                date_of_birth=date(1950, 1, 1) + timedelta(days=self.random.randint(0, 20000)),
+                gender_id=self.random.choice(self.genders),
+                district_id=self.random.choice(self.districts),
+            )
+
+    def create_doctors(self, clinic_ids):
+        count = self.volumes['doctors']
+        self.log(f'Врачи: {count}')
+        user_ids = self.bulk_insert(User, self.build_users(0, count))
+        doctor_ids = self.bulk_insert(Doctor, (
+            Doctor(
+                user_id=user_id,
+                about_ru=self.random.choice(self.texts),
+                about_tg=self.random.choice(self.texts),
+                titles_and_merits_ru=self.random.choice(self.texts),
+                titles_and_merits_tg=self.random.choice(self.texts),
+            )
+            for user_id in user_ids
+        ))
+
+        specialties = Doctor.specialties.through
+        self.bulk_insert(specialties, (
+            specialties(doctor_id=doctor_id, specialty_id=specialty_id)
+            for doctor_id in doctor_ids
+            for specialty_id in self.random.sample(self.specialties, min(2, len(self.specialties)))
+        ), returning=False)
+        workplace_ids = self.bulk_insert(Workplace, (
+            Workplace(
+                doctor_id=doctor_id, clinic_id=self.random.choice(clinic_ids), position='Врач',
+                monday_start=time(8), monday_end=time(16),
+                wednesday_start=time(8), wednesday_end=time(16),
+                friday_start=time(8), friday_end=time(16),
+            )
+            for doctor_id in doctor_ids
+        ))
+        self.bulk_insert(WorkplaceSchedule, (
+            WorkplaceSchedule(workplace_id=workplace_id, weekday=weekday, start_time=time(8), end_time=time(16))
+            for workplace_id in workplace_ids
+            for weekday in (0, 2, 4)
+        ), returning=False)
+        # У каждого врача одно место работы, записи на прием привязываются к нему
+        self.workplaces = dict(zip(doctor_ids, workplace_ids))
+        return user_ids, doctor_ids
+
+    def create_patients(self):
+        count = self.volumes['patients']
+        self.log(f'Пациенты: {count}')
+        user_ids = self.bulk_insert(User, self.build_users(1, count))
+        patient_ids = self.bulk_insert(Patient, (Patient(user_id=user_id) for user_id in user_ids))
+        return user_ids, patient_ids
+
+    def build_appointment(self, index, doctor_ids, patient_ids, first_day, today):
+        # Каждый врач получает слоты подряд, поэтому пара (врач, дата, время) уникальна.
+        # Слоты идут только по рабочим дням, как в расписании мест работы.
+        slot = index // len(doctor_ids)
+        day = slot // SLOTS_PER_DAY
+        appointment_date = first_day + timedelta(
+            weeks=day // len(WORKING_WEEKDAYS), days=WORKING_WEEKDAYS[day % len(WORKING_WEEKDAYS)]
+        )
+        start = datetime.combine(appointment_date, time(8)) + timedelta(minutes=30 * (slot % SLOTS_PER_DAY))
+
+        if appointment_date >= today:
+            status = STATUS_UPCOMING
+        else:
+            status = self.random.choices(
+                [STATUS_COMPLETED, STATUS_CANCELLED, STATUS_NO_SHOW], weights=[70, 20, 10]
+            )[0]
+
+        patient = self.random.randrange(len(patient_ids))
+        doctor_id = doctor_ids[index % len(doctor_ids)]
+        return Appointment(
+            doctor_id=doctor_id,
+            workplace_id=self.workplaces[doctor_id],
+            patient_id=patient_ids[patient],
+            appointment_date=appointment_date,
+            start_time=start.time(),
+            end_time=(start + timedelta(minutes=30)).time(),
+            status_id=self.statuses[status],
+            phone_number=phone_number(1, patient),
+            problem_description=self.random.choice(self.texts) if self.random.random() < 0.7 else None,
+        )
+
+    def create_appointments(self, doctor_ids, patient_ids):
+        count = self.volumes['appointments']
+        self.log(f'Записи на прием: {count}')
+        today = date.today()
+        # Понедельник недели, в которую попадает дата месяц назад
+        first_day = today - timedelta(days=30)
+        first_day -= timedelta(days=first_day.weekday())
+        completed = self.statuses[STATUS_COMPLETED]
+
+        appointments = (
+            self.build_appointment(index, doctor_ids, patient_ids, first_day, today) for index in range(count)
+        )
+        for chunk in chunked(appointments, self.batch_size):
+            with transaction.atomic():
+                # Ключи записей нужны для отзывов, поэтому записи всегда создаются через bulk_create
+                Appointment.objects.bulk_create(chunk)
+                self.bulk_insert(Review, [
+                    Review(
+                        appointment_id=appointment.pk,
+                        doctor_id=appointment.doctor_id,
+                        rating=self.random.choices([1, 2, 3, 4, 5], weights=[5, 5, 15, 35, 40])[0],
+                        comment=self.random.choice(self.sentences),
+                    )
+                    for appointment in chunk
+                    if appointment.status_id == completed and self.random.random() < REVIEW_PROBABILITY
+                ], returning=False)
+
+    def create_appointment_stats(self):
+        # Записи созданы через bulk_create без сигналов, дневная статистика считается одним пересчетом
+        self.log(f'Статистика записей: {rebuild_stats(batch_size=self.batch_size)} строк')
+
+    def create_next_available(self):
+        # Места работы и записи созданы без сигналов, ближайшие свободные слоты считаются одним обходом
+        total, changed = refresh_all(batch_size=self.batch_size)
+        self.log(f'Ближайшие свободные слоты: {changed} из {total} врачей')
+
+    def create_chats(self, doctor_user_ids, patient_user_ids):
+        messages = self.volumes['messages']
+        # Пары (врач, пациент) различны, пока номер чата меньше НОК количеств врачей и пациентов
+        chats_count = min(
+            max(messages // MESSAGES_PER_CHAT, 1),
+            math.lcm(len(doctor_user_ids), len(patient_user_ids))
+        )
+        self.log(f'Чаты: {chats_count}, сообщения: {messages}')
+
+        chats = self.bulk_insert(Chat, (
+            Chat(
+                participant1_id=doctor_user_ids[index % len(doctor_user_ids)],
+                participant2_id=patient_user_ids[index % len(patient_user_ids)],
+            )
+            for index in range(chats_count)
+        ))
+        participants = dict(zip(chats, (
+            (doctor_user_ids[index % len(doctor_user_ids)], patient_user_ids[index % len(patient_user_ids)])
+            for index in range(chats_count)
+        )))
+
+        def build_messages():
+            for index in range(messages):
+                chat_id = chats[index % chats_count]
+                yield Message(
+                    chat_id=chat_id,
+                    sender_id=participants[chat_id][index % 2],
+                    content=self.random.choice(self.sentences),
+                )
+
+        self.bulk_insert(Message, build_messages(), returning=False)
+
+
+def seed_data(volumes, seed=0, batch_size=5000, stdout=None, copy=False):
+    """Заполняет базу данными для замеров. Повторно не заполняет, если данные уже есть."""
+    if is_seeded():
+        if stdout:
+            stdout.write('Данные для замеров уже созданы, генерация пропущена')
+        return False
+    DataGenerator(volumes, seed=seed, batch_size=batch_size, stdout=stdout, copy=copy).generate()
+    return True
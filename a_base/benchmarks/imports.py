@@ -0,0 +1,108 @@
+"""
+Замер импорта анкет врачей: однопроцессная подготовка против пула процессов.
+Каждый прогон выполняется в транзакции, которая откатывается, поэтому база не меняется.
+"""
+import random
+import time
+
+import pandas as pd
+from django.db import transaction
+
+from a_base.models import District, ExperienceLevel, Gender, Language, LanguageLevel, Region
+from clinics.models import ClinicType
+from doctors.importers import DEFAULT_CLINIC_TYPE_ID, LANGUAGE_COLUMNS, SERVICE_COLUMNS, SOURCE_COLUMNS, DoctorImporter
+
+# Телефоны анкет не пересекаются с пользователями генератора данных API (+9929...)
+IMPORT_PHONE_PREFIX = '+9928'
+
+
+def prepare_references():
+    """Справочники, на которые ссылаются анкеты. В пустой базе создаются минимальные значения."""
+    if not Gender.objects.exists():
+        Gender.objects.create(name_ru='Мужской')
+    if not District.objects.exists():
+        region, _ = Region.objects.get_or_create(code='99', defaults={'name': 'Бенчмарк'})
+        District.objects.create(name_ru='Бенчмарк', region=region)
+    if not ExperienceLevel.objects.exists():
+        ExperienceLevel.objects.create(level_ru='0-3 года')
+    if not LanguageLevel.objects.exists():
+        LanguageLevel.objects.create(level_ru='Свободно')
+    for name in LANGUAGE_COLUMNS.values():
+        Language.objects.get_or_create(name_ru=name)
+    ClinicType.objects.get_or_create(id=DEFAULT_CLINIC_TYPE_ID, defaults={'name': 'Бенчмарк'})
+
+    return {
+        'genders': list(Gender.objects.values_list('name_ru', flat=True)),
+        'districts': list(District.objects.values_list('name_ru', flat=True)),
+        'experience_levels': list(ExperienceLevel.objects.values_list('level_ru', flat=True)),
+        'language_levels': list(LanguageLevel.objects.values_list('level_ru', flat=True)),
+    }
+
+
+def build_sheet(count, references, seed=0):
+    """Анкеты в формате read_excel (столбцы уже переименованы), значения - строки"""
+    rng = random.Random(seed)
+    rows = []
+    for index in range(count):
+        row = dict.fromkeys(SOURCE_COLUMNS)
+        row.update({
+            'last_name_ru': f'Фамилия {index % 500}',
+            'first_name_ru': f'Имя {index % 300}',
+            'middle_name_ru': f'Отчество {index % 300}',
+            'date_of_birth': f'{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/{rng.randint(1950, 1998)}',
+            'gender': rng.choice(references['genders']),
+            'district': rng.choice(references['districts']),
+            'inn': f'{100000000 + index}',
+            'work_phone_number': f'{IMPORT_PHONE_PREFIX}{index:08d}',
+            'whatsapp': f'{IMPORT_PHONE_PREFIX}{index:08d}',
+            'telegram': f'@doctor{index}',
+            'email': f'doctor{index}@example.com',
+            'university_name_ru': f'Университет {index % 40}',
+            'university_city_ru': 'Душанбе',
+            'university_country_ru': 'Таджикистан',
+            'graduation_year': str(rng.randint(1975, 2020)),
+            'experience_level': rng.choice(references['experience_levels']),
+            'specialty_ru': f'Специальность {index % 60}',
+            'specialty_tg': f'Ихтисос {index % 60}',
+            'about_ru': 'Врач с большим опытом работы. ' * rng.randint(1, 5),
+            'strength_ru': 'Внимательность, терпение, ответственность',
+            'clinic_name_ru': f'Клиника {index % 200}',
+            'position_ru': 'Врач',
+        })
+        for column in rng.sample(list(LANGUAGE_COLUMNS), 2):
+            row[column] = rng.choice(references['language_levels'])
+        for column in SERVICE_COLUMNS:
+            row[column] = rng.choice(['Да', 'Нет'])
+        rows.append(row)
+    return pd.DataFrame(rows, columns=SOURCE_COLUMNS, dtype=str)
+
+
+def run_import_benchmark(count, workers=(1,), batch_size=1000, seed=0, stdout=None):
+    """
+    Импортирует одни и те же анкеты с разным количеством процессов подготовки.
+    Возвращает словарь {количество процессов: длительность этапов и скорость}.
+    """
+    results = {}
+    sheet = None
+    for worker_count in workers:
+        with transaction.atomic():
+            references = prepare_references()
+            if sheet is None:
+                sheet = build_sheet(count, references, seed=seed)
+
+            started = time.perf_counter()
+            result = DoctorImporter(batch_size=batch_size, workers=worker_count).run(sheet, full=True)
+            total = time.perf_counter() - started
+            transaction.set_rollback(True)
+
+        results[worker_count] = {
+            'rows': count,
+            'prepare_s': round(result.timings['prepare'], 3),
+            'write_s': round(result.timings.get('write', 0.0), 3),
+            'total_s': round(total, 3),
+            'rows_per_s': round(count / total, 1) if total else None,
+            'errors': len(result.errors),
+        }
+        if stdout:
+            stdout.write(f'workers={worker_count}: {results[worker_count]}')
+    return results
@@ -0,0 +1,126 @@
+"""
+Замеры времени ответа, количества запросов к БД и памяти для основных эндпоинтов API.
+Запросы выполняются тестовым клиентом DRF в том же процессе, без сети.
+"""
+import statistics
+import time
+import tracemalloc
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import Count
+from django.test.utils import override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from a_base.benchmarks.generators import ADMIN_PHONE
+from a_base.instrumentation import QueryRecorder
+from doctors.models import Doctor
+from patients.models import Patient
+
+User = get_user_model()
+
+
+def _admin():
+    return User.objects.get(phone_number=ADMIN_PHONE)
+
+
+def _busiest_patient():
+    patient = Patient.objects.annotate(total=Count('appointments')).order_by('-total').first()
+    return patient.user if patient else None
+
+
+# Эндпоинт: (функция построения URL, функция выбора пользователя или None для анонимного запроса)
+ENDPOINTS = {
+    'doctor_list': (lambda: reverse('doctor-list'), _admin),
+    'doctor_retrieve': (lambda: reverse('doctor-detail', args=[Doctor.objects.values_list('id', flat=True).first()]),
+                        _admin),
+    'clinic_list': (lambda: reverse('clinic-list'), _admin),
+    'appointment_list': (lambda: reverse('appointment-list'), _busiest_patient),
+    'chat_inbox': (lambda: reverse('chat-list'), _admin),
+    'bootstrap': (lambda: reverse('bootstrap'), None),
+}
+
+
+def percentile(values, percent):
+    """Процентиль с линейной интерполяцией"""
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    position = (len(ordered) - 1) * percent / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def measure_endpoint(client, url, iterations, warmup):
+    for _ in range(warmup):
+        client.get(url)
+
+    timings = []
+    queries = []
+    for _ in range(iterations):
+        recorder = QueryRecorder()
+        with connection.execute_wrapper(recorder):
+            started = time.perf_counter()
+            response = client.get(url)
+            timings.append(time.perf_counter() - started)
+        queries.append(recorder.count)
+
+    # Память замеряется отдельным запросом: tracemalloc заметно замедляет выполнение
+    tracemalloc.start()
+    try:
+        client.get(url)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'status': response.status_code,
+        'p50_ms': round(percentile(timings, 50) * 1000, 2),
+        'p95_ms': round(percentile(timings, 95) * 1000, 2),
+        'mean_ms': round(statistics.mean(timings) * 1000, 2),
+        'queries': max(queries),
+        'peak_memory_kb': round(peak_memory / 1024, 1),
+        'response_bytes': len(response.content),
+    }
+
+
+def run_benchmarks(names=None, iterations=20, warmup=2, stdout=None):
+    """Возвращает словарь с результатами замеров по каждому эндпоинту"""
+    results = {}
+    with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+        for name in names or ENDPOINTS:
+            build_url, get_user = ENDPOINTS[name]
+            client = APIClient()
+            if get_user is not None:
+                user = get_user()
+                if user is None:
+                    if stdout:
+                        stdout.write(f'{name}: нет данных для замера, пропущено')
+                    continue
+                client.force_authenticate(user=user)
+
+            results[name] = measure_endpoint(client, build_url(), iterations, warmup)
+            if stdout:
+                stdout.write(f'{name}: {results[name]}')
+    return results
+
+
+def compare_results(baseline, current):
+    """
+    Сравнивает два набора результатов.
+    Возвращает строки (эндпоинт, метрика, было, стало, изменение в процентах).
+    """
+    rows = []
+    for name, metrics in current.items():
+        if name not in baseline:
+            continue
+        for metric in ('p50_ms', 'p95_ms', 'queries', 'peak_memory_kb', 'response_bytes'):
+            before, after = baseline[name].get(metric), metrics.get(metric)
+            if before is None or after is None:
+                continue
+            change = (after - before) / before * 100 if before else 0.0
+            rows.append((name, metric, before, after, round(change, 1)))
+    return rows
@@ -0,0 +1,82 @@
+import gzip
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import translation
+
+from a_base.cache import build_response_key, get_cache_timeout, get_catalog_versions
+from a_base.models import (
+    Region, District, Subscription, Gender, AppointmentStatus,
+    Specialty, AcademicDegree, MedicalCategory, Service,
+    Language, LanguageLevel, ExperienceLevel,
+    SocialStatus, CancelReason, University
+)
+from a_base.serializers import (
+    RegionSerializer, DistrictSerializer, SubscriptionSerializer, GenderSerializer,
+    AppointmentStatusSerializer, SpecialtySerializer, AcademicDegreeSerializer,
+    MedicalCategorySerializer, ServiceSerializer, LanguageSerializer, LanguageLevelSerializer,
+    ExperienceLevelSerializer, SocialStatusSerializer, CancelReasonSerializer, UniversitySerializer
+)
+from a_base.signals import CATALOG_MODELS
+
+# Справочники, которые отдаются одним ответом /api/bootstrap/: ключ -> (queryset, сериализатор)
+BOOTSTRAP_CATALOGS = {
+    'genders': (Gender.objects.all(), GenderSerializer),
+    'regions': (Region.objects.all(), RegionSerializer),
+    'districts': (District.objects.select_related('region'), DistrictSerializer),
+    'specialties': (Specialty.objects.all(), SpecialtySerializer),
+    'medical_categories': (MedicalCategory.objects.all(), MedicalCategorySerializer),
+    'academic_degrees': (AcademicDegree.objects.all(), AcademicDegreeSerializer),
+    'experience_levels': (ExperienceLevel.objects.all(), ExperienceLevelSerializer),
+    'languages': (Language.objects.all(), LanguageSerializer),
+    'language_levels': (LanguageLevel.objects.all(), LanguageLevelSerializer),
+    'services': (Service.objects.select_related('service_place'), ServiceSerializer),
+    'universities': (University.objects.all(), UniversitySerializer),
+    'social_statuses': (SocialStatus.objects.all(), SocialStatusSerializer),
+    'cancel_reasons': (CancelReason.objects.all(), CancelReasonSerializer),
+    'appointment_statuses': (AppointmentStatus.objects.all(), AppointmentStatusSerializer),
+    'subscriptions': (Subscription.objects.filter(is_active=True).prefetch_related('advantages'),
+                      SubscriptionSerializer),
+}
+
+
+def build_bootstrap_payload(language):
+    """
+    Сериализует все справочники на указанном языке.
+    Возвращает словарь с хэшем содержимого, JSON и его gzip-версией.
+    """
+    with translation.override(language):
+        catalogs = {
+            name: serializer_class(queryset.all(), many=True).data
+            for name, (queryset, serializer_class) in BOOTSTRAP_CATALOGS.items()
+        }
+
+    content = json.dumps(catalogs, cls=DjangoJSONEncoder, ensure_ascii=False, separators=(',', ':'))
+    content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    body = json.dumps(
+        {'hash': content_hash, 'language': language, 'catalogs': catalogs},
+        cls=DjangoJSONEncoder, ensure_ascii=False, separators=(',', ':')
+    ).encode('utf-8')
+
+    return {
+        'hash': content_hash,
+        'content': body,
+        # mtime=0 делает сжатый ответ детерминированным
+        'compressed': gzip.compress(body, compresslevel=9, mtime=0),
+    }
+
+
+def get_bootstrap_payload(language):
+    """
+    Возвращает готовый ответ из кэша. Ответ пересобирается,
+    как только меняется версия любого из справочников.
+    """
+    key = build_response_key('bootstrap', language, *get_catalog_versions(CATALOG_MODELS))
+    payload = cache.get(key)
+    if payload is None:
+        payload = build_bootstrap_payload(language)
+        cache.set(key, payload, get_cache_timeout())
+    return payload
@@ -0,0 +1,61 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+VERSION_KEY_PREFIX = 'catalog_version'
+RESPONSE_KEY_PREFIX = 'catalog_response'
+
+
+def _version_key(model):
+    return f'{VERSION_KEY_PREFIX}:{model._meta.label_lower}'
+
+
+def get_version(key):
+    """
+    Возвращает версию по ключу кэша (время последнего изменения, unix timestamp).
+    Если версия еще не сохранена в кэше, она создается.
+    """
+    version = cache.get(key)
+    if version is None:
+        version = time.time()
+        # add() не перезапишет версию, если ее успел сохранить другой процесс
+        if not cache.add(key, version, timeout=None):
+            version = cache.get(key, version)
+    return version
+
+
+def bump_version(key):
+    """Сдвигает версию по ключу кэша"""
+    version = time.time()
+    cache.set(key, version, timeout=None)
+    return version
+
+
+def get_catalog_version(model):
+    """Возвращает текущую версию справочника"""
+    return get_version(_version_key(model))
+
+
+def get_catalog_versions(models):
+    """Возвращает версии сразу для нескольких справочников"""
+    return [get_catalog_version(model) for model in models]
+
+
+def bump_catalog_version(model):
+    """
+    Сдвигает версию справочника. Все закэшированные ответы, построенные
+    на старой версии, перестают использоваться.
+    """
+    return bump_version(_version_key(model))
+
+
+def build_response_key(*parts):
+    """Собирает ключ кэша ответа из произвольных частей (путь, язык, версии и т.д.)"""
+    raw = '|'.join(str(part) for part in parts)
+    return f'{RESPONSE_KEY_PREFIX}:{hashlib.md5(raw.encode("utf-8")).hexdigest()}'
+
+
+def get_cache_timeout():
+    return getattr(settings, 'CATALOG_CACHE_TIMEOUT', 60 * 60)
@@ -0,0 +1,104 @@
+"""
+Быстрая очистка таблиц проекта.
+
+QuerySet.delete() перед удалением собирает в память все связанные объекты для каскада и сигналов,
+поэтому на большой базе работает очень долго. Здесь таблицы очищаются SQL-командами:
+в PostgreSQL - одним TRUNCATE ... CASCADE, в остальных базах (SQLite) - DELETE FROM по каждой таблице
+в порядке зависимостей. Сигналы post_delete при этом не отправляются.
+"""
+from django.apps import apps
+from django.conf import settings
+from django.core.management.color import no_style
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from a_base.cache import bump_catalog_version
+from a_base.signals import CATALOG_MODELS
+
+# Приложения со справочниками, которые загружаются из фикстур init_data
+REFERENCE_APPS = ('a_base', 'clinics')
+
+
+def related_models(model):
+    """Модели, на которые ссылаются внешние ключи модели"""
+    return {field.related_model for field in model._meta.concrete_fields if field.is_relation}
+
+
+def stored_models():
+    """Все модели с собственными таблицами, включая промежуточные таблицы ManyToMany"""
+    return [
+        model for model in apps.get_models(include_auto_created=True)
+        if model._meta.managed and not model._meta.proxy
+    ]
+
+
+def project_models(keep_reference=False):
+    """Модели приложений проекта (без django.contrib и сторонних пакетов)"""
+    base_dir = str(settings.BASE_DIR)
+    return [
+        model for model in stored_models()
+        if model._meta.app_config.path.startswith(base_dir)
+        and not (keep_reference and model._meta.app_label in REFERENCE_APPS)
+    ]
+
+
+def with_referencing(models):
+    """Добавляет модели, которые ссылаются на очищаемые: их тоже очищает TRUNCATE ... CASCADE"""
+    result = list(dict.fromkeys(models))
+    selected = set(result)
+    added = True
+    while added:
+        added = False
+        for model in stored_models():
+            if model not in selected and related_models(model) & selected:
+                result.append(model)
+                selected.add(model)
+                added = True
+    return result
+
+
+def delete_order(models):
+    """Сначала модели, которые ссылаются на другие, затем модели, на которые ссылаются"""
+    remaining = list(models)
+    ordered = []
+    while remaining:
+        referenced = {
+            related for model in remaining for related in related_models(model) if related is not model
+        }
+        # Циклические ссылки разрываются произвольно: ограничения внешних ключей проверяются в конце транзакции
+        ready = [model for model in remaining if model not in referenced] or remaining[:1]
+        ordered.extend(ready)
+        remaining = [model for model in remaining if model not in ready]
+    return ordered
+
+
+def truncate_models(models, reset_sequences=True, using=DEFAULT_DB_ALIAS):
+    """
+    Очищает таблицы моделей и всех моделей, которые на них ссылаются.
+    Возвращает список очищенных таблиц в порядке удаления.
+    """
+    connection = connections[using]
+    models = delete_order(with_referencing(models))
+    tables = [model._meta.db_table for model in models]
+    if not tables:
+        return []
+
+    if connection.vendor == 'postgresql':
+        sql = connection.ops.sql_flush(no_style(), tables, reset_sequences=reset_sequences, allow_cascade=True)
+    else:
+        sql = [f'DELETE FROM {connection.ops.quote_name(table)}' for table in tables]
+        if reset_sequences:
+            sql.extend(connection.ops.sequence_reset_by_name_sql(
+                no_style(), [{'table': table, 'column': None} for table in tables]
+            ))
+    connection.ops.execute_sql_flush(sql)
+
+    # Сигналы не отправлялись, поэтому закэшированные ответы справочников сбрасываются явно
+    for model in CATALOG_MODELS:
+        if model in models:
+            bump_catalog_version(model)
+    return tables
+
+
+def reset_database(keep_reference=False, reset_sequences=True, using=DEFAULT_DB_ALIAS):
+    """Очищает все таблицы проекта, по желанию оставляя справочники"""
+    return truncate_models(project_models(keep_reference), reset_sequences=reset_sequences, using=using)
@@ -0,0 +1,237 @@
+import json
+import logging
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+
+logger = logging.getLogger('rating.instrumentation')
+
+# Границы гистограммы времени ответа (в секундах)
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+# Границы гистограммы времени рендеринга ответа (в секундах)
+RENDER_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5)
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_IN_LIST_RE = re.compile(r'IN \((?:%s, )*%s\)')
+
+
+def get_n_plus_one_threshold():
+    return getattr(settings, 'INSTRUMENTATION_N_PLUS_ONE_THRESHOLD', 5)
+
+
+def query_signature(sql):
+    """
+    Приводит SQL к виду, не зависящему от параметров:
+    'IN (%s, %s, %s)' -> 'IN (...)', лишние пробелы удаляются.
+    """
+    return _IN_LIST_RE.sub('IN (...)', _WHITESPACE_RE.sub(' ', sql).strip())
+
+
+class QueryRecorder:
+    """Обертка connection.execute_wrapper: считает запросы и время, проведенное в БД"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.signatures = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+            self.count += 1
+            self.signatures[query_signature(sql)] += 1
+
+    def duplicates(self, threshold=2):
+        """Сигнатуры запросов, выполненных не меньше threshold раз"""
+        return {sql: count for sql, count in self.signatures.items() if count >= threshold}
+
+
+class MetricsRegistry:
+    """
+    Накопительные метрики по эндпоинтам в памяти процесса.
+    Каждый воркер отдает свои значения, суммирование выполняет Prometheus.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = defaultdict(self._empty_endpoint)
+
+    @staticmethod
+    def _empty_endpoint():
+        return {
+            'requests': 0,
+            'duration': 0.0,
+            'db_queries': 0,
+            'db_duration': 0.0,
+            'non_db_duration': 0.0,
+            'response_bytes': 0,
+            'n_plus_one': 0,
+            'buckets': [0] * len(LATENCY_BUCKETS),
+            'rendered': 0,
+            'render_duration': 0.0,
+            'render_buckets': [0] * len(RENDER_BUCKETS),
+        }
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+    def observe(self, record):
+        key = (record['view'], record['method'], str(record['status']))
+        with self._lock:
+            endpoint = self._endpoints[key]
+            endpoint['requests'] += 1
+            endpoint['duration'] += record['duration']
+            endpoint['db_queries'] += record['db_queries']
+            endpoint['db_duration'] += record['db_duration']
+            endpoint['non_db_duration'] += record['non_db_duration']
+            endpoint['response_bytes'] += record['response_bytes']
+            endpoint['n_plus_one'] += int(bool(record['n_plus_one']))
+            for index, bound in enumerate(LATENCY_BUCKETS):
+                if record['duration'] <= bound:
+                    endpoint['buckets'][index] += 1
+            if record['render_duration'] is not None:
+                endpoint['rendered'] += 1
+                endpoint['render_duration'] += record['render_duration']
+                for index, bound in enumerate(RENDER_BUCKETS):
+                    if record['render_duration'] <= bound:
+                        endpoint['render_buckets'][index] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                key: dict(value, buckets=list(value['buckets']), render_buckets=list(value['render_buckets']))
+                for key, value in self._endpoints.items()
+            }
+
+    def render_prometheus(self):
+        """Текстовый формат экспозиции Prometheus"""
+        counters = (
+            ('http_requests_total', 'requests', 'counter', 'Количество запросов'),
+            ('http_db_queries_total', 'db_queries', 'counter', 'Количество запросов к БД'),
+            ('http_db_duration_seconds_total', 'db_duration', 'counter', 'Время выполнения запросов к БД'),
+            ('http_non_db_duration_seconds_total', 'non_db_duration', 'counter',
+             'Время работы view и рендеринга ответа без учета запросов к БД'),
+            ('http_response_bytes_total', 'response_bytes', 'counter', 'Размер ответов'),
+            ('http_n_plus_one_suspected_total', 'n_plus_one', 'counter',
+             'Запросы с повторяющимся SQL (возможная проблема N+1)'),
+        )
+        snapshot = self.snapshot()
+        lines = []
+
+        for metric, field, metric_type, description in counters:
+            lines.append(f'# HELP {metric} {description}')
+            lines.append(f'# TYPE {metric} {metric_type}')
+            for key, endpoint in snapshot.items():
+                lines.append(f'{metric}{{{self._labels(key)}}} {endpoint[field]}')
+
+        histograms = (
+            ('http_request_duration_seconds', LATENCY_BUCKETS, 'buckets', 'duration', 'requests',
+             'Время обработки запроса'),
+            ('http_render_duration_seconds', RENDER_BUCKETS, 'render_buckets', 'render_duration', 'rendered',
+             'Время рендеринга ответа (response.render(), для DRF - сериализация в JSON)'),
+        )
+        for metric, bounds, buckets, total, count, description in histograms:
+            lines.append(f'# HELP {metric} {description}')
+            lines.append(f'# TYPE {metric} histogram')
+            for key, endpoint in snapshot.items():
+                if not endpoint[count]:
+                    continue
+                labels = self._labels(key)
+                for bound, observed in zip(bounds, endpoint[buckets]):
+                    lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {observed}')
+                lines.append(f'{metric}_bucket{{{labels},le="+Inf"}} {endpoint[count]}')
+                lines.append(f'{metric}_sum{{{labels}}} {endpoint[total]}')
+                lines.append(f'{metric}_count{{{labels}}} {endpoint[count]}')
+
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _labels(key):
+        view, method, status = key
+        view = view.replace('\\', '\\\\').replace('"', '\\"')
+        return f'view="{view}",method="{method}",status="{status}"'
+
+
+registry = MetricsRegistry()
+
+
+class InstrumentationMiddleware:
+    """
+    Для каждого запроса собирает имя view, количество и время запросов к БД,
+    повторяющиеся запросы, время работы вне БД и размер ответа.
+    Результат пишется в лог 'rating.instrumentation' (JSON) и в метрики (см. a_base.views.metrics).
+
+    non_db_duration - время от вызова view до возврата ответа за вычетом запросов к БД: сериализация,
+    рендеринг и остальная работа Python. render_duration - его часть, время response.render()
+    для TemplateResponse и DRF Response (рендеринг данных сериализатора в JSON); для остальных ответов None.
+    Включается настройкой INSTRUMENTATION_ENABLED (например, только на staging).
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'INSTRUMENTATION_ENABLED', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        recorder = QueryRecorder()
+        request._instrumentation_view_started = None
+        request._instrumentation_render_duration = None
+
+        started = time.perf_counter()
+        with connection.execute_wrapper(recorder):
+            response = self.get_response(request)
+        duration = time.perf_counter() - started
+
+        record = self.build_record(request, response, recorder, started, duration)
+        registry.observe(record)
+
+        if record['n_plus_one']:
+            logger.warning(json.dumps(record, ensure_ascii=False))
+        else:
+            logger.info(json.dumps(record, ensure_ascii=False))
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request._instrumentation_view_started = time.perf_counter()
+        return None
+
+    def process_template_response(self, request, response):
+        # Django вызывает response.render() сразу после process_template_response всех middleware
+        started = time.perf_counter()
+
+        def rendered(response):
+            request._instrumentation_render_duration = time.perf_counter() - started
+
+        response.add_post_render_callback(rendered)
+        return response
+
+    def build_record(self, request, response, recorder, started, duration):
+        view_started = request._instrumentation_view_started or started
+        view_duration = started + duration - view_started
+        render_duration = request._instrumentation_render_duration
+        threshold = get_n_plus_one_threshold()
+
+        match = getattr(request, 'resolver_match', None)
+        return {
+            'view': match.view_name if match and match.view_name else 'unknown',
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'duration': round(duration, 6),
+            'db_queries': recorder.count,
+            'db_duration': round(recorder.duration, 6),
+            'non_db_duration': round(max(view_duration - recorder.duration, 0.0), 6),
+            'render_duration': None if render_duration is None else round(render_duration, 6),
+            'response_bytes': 0 if response.streaming else len(response.content),
+            'duplicate_queries': recorder.duplicates(),
+            'n_plus_one': sorted(recorder.duplicates(threshold)),
+        }
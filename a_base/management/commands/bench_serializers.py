@@ -0,0 +1,60 @@
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import translation
+from rest_framework import serializers
+
+from a_base.models import Specialty
+from a_base.serializers import SpecialtySerializer
+
+
+class MethodFieldSpecialtySerializer(serializers.ModelSerializer):
+    """Прежняя реализация: язык и перевод определяются заново для каждого объекта"""
+    name = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Specialty
+        fields = ['id', 'name']
+
+    def get_name(self, obj):
+        lang = translation.get_language()
+        fallback_lang = settings.FALLBACK_LANGUAGES.get(lang, 'ru')
+        return getattr(obj, f'name_{lang}', getattr(obj, f'name_{fallback_lang}', 'Нет перевода'))
+
+
+class Command(BaseCommand):
+    help = 'Сравнивает скорость сериализации переводимых полей (TranslatedField и SerializerMethodField)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--count', type=int, default=10000, help='Количество объектов в списке')
+        parser.add_argument('--repeat', type=int, default=5, help='Количество повторов замера')
+        parser.add_argument('--language', default='tg', help='Язык сериализации')
+
+    def handle(self, *args, **options):
+        count = options['count']
+        repeat = options['repeat']
+
+        # Объекты не сохраняются в БД: замеряется только сериализация
+        specialties = [Specialty(id=i, name_ru=f'Специальность {i}', name_tg=f'Ихтисос {i}') for i in range(count)]
+        self.stdout.write(f'Сериализация {count} объектов, язык {options["language"]}, повторов {repeat}')
+
+        with translation.override(options['language']):
+            baseline = self.measure(MethodFieldSpecialtySerializer, specialties, repeat)
+            current = self.measure(SpecialtySerializer, specialties, repeat)
+
+        self.report('SerializerMethodField', baseline, count)
+        self.report('TranslatedField', current, count)
+        self.stdout.write(self.style.SUCCESS(f'Ускорение: {baseline / current:.2f}x'))
+
+    def measure(self, serializer_class, objects, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            serializer_class(objects, many=True).data
+            timings.append(time.perf_counter() - started)
+        return statistics.median(timings)
+
+    def report(self, title, seconds, count):
+        self.stdout.write(f'{title}: {seconds * 1000:.1f} мс ({seconds / count * 1e6:.2f} мкс на объект)')
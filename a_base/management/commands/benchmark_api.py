@@ -0,0 +1,69 @@
+import json
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from a_base.benchmarks import ENDPOINTS, PRESETS, compare_results, run_benchmarks, seed_data
+
+
+class Command(BaseCommand):
+    help = (
+        'Замеряет p50/p95 времени ответа, количество запросов к БД и память для основных эндпоинтов API. '
+        'Запускать только на отдельной базе данных: --seed создает большой объем тестовых данных.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seed', choices=PRESETS, help='Создать данные указанного объема перед замером')
+        parser.add_argument('--random-seed', type=int, default=0, help='Seed генератора данных')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Размер пачки при создании данных')
+        parser.add_argument('--endpoints', nargs='+', choices=ENDPOINTS, help='Эндпоинты для замера (по умолчанию все)')
+        parser.add_argument('--iterations', type=int, default=20, help='Количество запросов к каждому эндпоинту')
+        parser.add_argument('--warmup', type=int, default=2, help='Количество прогревочных запросов')
+        parser.add_argument('--output', help='Путь к JSON-файлу для сохранения результатов')
+        parser.add_argument('--compare', help='JSON-файл предыдущего запуска для сравнения')
+
+    def handle(self, *args, **options):
+        if options['seed']:
+            self.stdout.write(f'Создание данных ({options["seed"]})...')
+            seed_data(
+                PRESETS[options['seed']], seed=options['random_seed'],
+                batch_size=options['batch_size'], stdout=self.stdout
+            )
+
+        results = run_benchmarks(
+            names=options['endpoints'], iterations=options['iterations'],
+            warmup=options['warmup'], stdout=self.stdout
+        )
+        report = {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'database': connection.vendor,
+            'preset': options['seed'],
+            'iterations': options['iterations'],
+            'results': results,
+        }
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as file:
+                json.dump(report, file, ensure_ascii=False, indent=2)
+            self.stdout.write(self.style.SUCCESS(f'Результаты сохранены в {options["output"]}'))
+
+        if options['compare']:
+            self.print_comparison(options['compare'], results)
+
+    def print_comparison(self, path, results):
+        try:
+            with open(path, encoding='utf-8') as file:
+                baseline = json.load(file)['results']
+        except (OSError, ValueError, KeyError) as e:
+            raise CommandError(f'Не удалось прочитать результаты {path}: {e}')
+
+        self.stdout.write(f'{"Эндпоинт":<20} {"Метрика":<16} {"Было":>12} {"Стало":>12} {"Изм., %":>9}')
+        for name, metric, before, after, change in compare_results(baseline, results):
+            line = f'{name:<20} {metric:<16} {before:>12} {after:>12} {change:>+9.1f}'
+            # Рост времени, запросов или памяти больше чем на 10% выделяется как регрессия
+            if change > 10:
+                line = self.style.ERROR(line)
+            elif change < -10:
+                line = self.style.SUCCESS(line)
+            self.stdout.write(line)
@@ -0,0 +1,48 @@
+import json
+import os
+from datetime import datetime
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from a_base.benchmarks import run_import_benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        'Сравнивает импорт анкет врачей с подготовкой данных в одном процессе и в пуле процессов. '
+        'Анкеты генерируются, а все изменения в базе откатываются после каждого прогона.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10_000, help='Количество анкет')
+        parser.add_argument('--workers', type=int, nargs='+', default=[1, os.cpu_count() or 1],
+                            help='Количества процессов подготовки для сравнения')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Количество строк в одной пачке записи')
+        parser.add_argument('--random-seed', type=int, default=0, help='Seed генератора анкет')
+        parser.add_argument('--output', help='Путь к JSON-файлу для сохранения результатов')
+
+    def handle(self, *args, **options):
+        results = run_import_benchmark(
+            options['rows'], workers=list(dict.fromkeys(options['workers'])),
+            batch_size=options['batch_size'], seed=options['random_seed'], stdout=self.stdout
+        )
+
+        baseline = results.get(1)
+        self.stdout.write(f'{"Процессы":>9} {"Подготовка, с":>14} {"Запись, с":>10} {"Всего, с":>9} {"Строк/с":>9} {"Ускорение":>10}')
+        for workers, metrics in results.items():
+            speedup = baseline['total_s'] / metrics['total_s'] if baseline and metrics['total_s'] else 1.0
+            self.stdout.write(
+                f'{workers:>9} {metrics["prepare_s"]:>14} {metrics["write_s"]:>10} {metrics["total_s"]:>9} '
+                f'{metrics["rows_per_s"]:>9} {speedup:>9.2f}x'
+            )
+
+        if options['output']:
+            report = {
+                'created_at': datetime.now().isoformat(timespec='seconds'),
+                'database': connection.vendor,
+                'results': results,
+            }
+            with open(options['output'], 'w', encoding='utf-8') as file:
+                json.dump(report, file, ensure_ascii=False, indent=2)
+            self.stdout.write(self.style.SUCCESS(f'Результаты сохранены в {options["output"]}'))
@@ -0,0 +1,89 @@
+import asyncio
+import json
+import resource
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import AccessToken
+
+from chat.loadtest import MESSAGE_PREFIX, ChatLoadTest, LoadTestClient
+from chat.models import Chat, Message
+
+
+class Command(BaseCommand):
+    help = (
+        'Нагрузочный тест WebSocket-чата: открывает много авторизованных соединений к запущенному '
+        'серверу (например, daphne rating.asgi:application), отправляет сообщения с заданной частотой '
+        'и замеряет задержки подключения и доставки, потерянные сообщения и память сервера. '
+        'Сервер сохраняет сообщения теста в чаты, после завершения они удаляются.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default='ws://127.0.0.1:8000', help='Адрес сервера')
+        parser.add_argument('--connections', type=int, default=1000,
+                            help='Количество соединений (по два участника на чат)')
+        parser.add_argument('--rate', type=float, default=0.2, help='Сообщений в секунду от каждого соединения')
+        parser.add_argument('--duration', type=int, default=30, help='Длительность отправки сообщений, с')
+        parser.add_argument('--connect-concurrency', type=int, default=100,
+                            help='Сколько соединений устанавливать одновременно')
+        parser.add_argument('--drain', type=int, default=5, help='Ожидание доставки после отправки, с')
+        parser.add_argument('--server-pid', type=int, help='PID процесса сервера для замера памяти (Linux)')
+        parser.add_argument('--output', help='Путь к JSON-файлу для сохранения результатов')
+        parser.add_argument('--keep-messages', action='store_true',
+                            help='Не удалять сообщения, сохраненные сервером во время теста')
+
+    def handle(self, *args, **options):
+        clients = self.build_clients(options['connections'])
+        if not clients:
+            raise CommandError('Нет чатов для теста. Создайте данные, например: benchmark_api --seed small')
+
+        self.raise_open_files_limit(len(clients))
+        load_test = ChatLoadTest(
+            options['url'], clients,
+            rate=options['rate'], duration=options['duration'],
+            connect_concurrency=options['connect_concurrency'], drain=options['drain'],
+            server_pid=options['server_pid'], stdout=self.stdout,
+        )
+        started = timezone.now()
+        try:
+            report = asyncio.run(load_test.run())
+        finally:
+            if not options['keep_messages']:
+                deleted = self.delete_messages({client.chat_id for client in clients}, started)
+                self.stdout.write(f'Удалено сообщений теста: {deleted}')
+
+        self.stdout.write(json.dumps(report, ensure_ascii=False, indent=2))
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as file:
+                json.dump(report, file, ensure_ascii=False, indent=2)
+
+        if report['dropped']:
+            self.stdout.write(self.style.WARNING(f'Потеряно сообщений: {report["dropped"]}'))
+
+    def build_clients(self, connections):
+        """Оба участника каждого чата подключаются к нему со своими токенами"""
+        chats = Chat.objects.select_related('participant1', 'participant2').order_by('id')[:(connections + 1) // 2]
+        tokens = {}
+        clients = []
+        for chat in chats:
+            for user in (chat.participant1, chat.participant2):
+                if user.id not in tokens:
+                    tokens[user.id] = str(AccessToken.for_user(user))
+                clients.append(LoadTestClient(chat_id=chat.id, user_id=user.id, token=tokens[user.id]))
+        return clients[:connections]
+
+    def delete_messages(self, chat_ids, started):
+        """Сообщения, которые ChatConsumer сохранил в тестовые чаты во время прогона"""
+        deleted, _ = Message.objects.filter(
+            chat_id__in=chat_ids, timestamp__gte=started, content__startswith=f'{MESSAGE_PREFIX}:'
+        ).delete()
+        return deleted
+
+    def raise_open_files_limit(self, connections):
+        """Каждое соединение занимает файловый дескриптор: поднимаем мягкий лимит до жесткого"""
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if soft < connections + 100 and soft != hard:
+            try:
+                resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+            except (ValueError, OSError):
+                self.stdout.write(self.style.WARNING(f'Не удалось поднять лимит открытых файлов ({soft})'))
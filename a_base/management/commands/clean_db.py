@@ -1,16 +1,23 @@
 from django.core.management.base import BaseCommand
-from django.apps import apps
-from django.contrib.auth import get_user_model
 
-User = get_user_model()
+from a_base.cleanup import reset_database
+
 
 class Command(BaseCommand):
-    help = 'Очищает базу данных для всех приложений'
+    help = 'Очищает таблицы всех приложений проекта (TRUNCATE ... CASCADE в PostgreSQL, DELETE в SQLite)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--keep-reference', action='store_true',
+                            help='Оставить справочники (приложения a_base и clinics)')
+        parser.add_argument('--keep-sequences', action='store_true',
+                            help='Не сбрасывать счетчики первичных ключей')
 
-    def handle(self, *args, **kwargs):
+    def handle(self, *args, **options):
         self.stdout.write("Очистка базы данных для всех приложений...")
-        for app_config in apps.get_app_configs():
-            self.stdout.write(f"Обработка приложения: {app_config.verbose_name}")
-            for model in app_config.get_models():
-                self.stdout.write(f"Удаление всех объектов модели {model.__name__}...")
-                model.objects.all().delete()
\ No newline at end of file
+        tables = reset_database(
+            keep_reference=options['keep_reference'],
+            reset_sequences=not options['keep_sequences'],
+        )
+        for table in tables:
+            self.stdout.write(f"Очищена таблица {table}")
+        self.stdout.write(self.style.SUCCESS(f"База данных очищена, таблиц: {len(tables)}"))
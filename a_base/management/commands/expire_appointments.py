@@ -0,0 +1,35 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+from appointments.statuses import STATUS_COMPLETED, STATUS_NO_SHOW
+from appointments.transitions import DEFAULT_BATCH_SIZE, DEFAULT_GRACE, expire_appointments
+
+
+class Command(BaseCommand):
+    help = (
+        'Переводит прошедшие предстоящие записи в статус "Завершен" (есть посещение) или "Пациент не явился". '
+        'С --loop работает как постоянный процесс и повторяет проверку каждые --interval секунд.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--loop', action='store_true', help='Работать постоянно')
+        parser.add_argument('--interval', type=int, default=300, help='Пауза между проверками в секундах')
+        parser.add_argument('--grace-minutes', type=int, default=int(DEFAULT_GRACE.total_seconds() // 60),
+                            help='Сколько минут после окончания приема ждать отметки о посещении')
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                            help='Количество записей в одном UPDATE')
+
+    def handle(self, *args, **options):
+        if options['interval'] < 1:
+            raise CommandError('Интервал должен быть не меньше секунды')
+
+        while True:
+            result = expire_appointments(
+                grace=timedelta(minutes=options['grace_minutes']), batch_size=options['batch_size']
+            )
+            self.stdout.write(f'Завершено: {result[STATUS_COMPLETED]}, неявок: {result[STATUS_NO_SHOW]}')
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,43 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from a_base.benchmarks import PRESETS, seed_data
+from a_base.benchmarks.generators import VOLUME_KEYS
+
+
+class Command(BaseCommand):
+    help = (
+        'Генерирует согласованный набор данных для стендов и замеров: пользователей, врачей, места работы, '
+        'записи на прием, отзывы, чаты и сообщения. Для одинакового --random-seed данные совпадают.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--preset', choices=PRESETS, default='small', help='Объем данных')
+        for key in VOLUME_KEYS:
+            parser.add_argument(f'--{key}', type=int, help=f'Переопределить количество ({key}) из пресета')
+        parser.add_argument('--random-seed', type=int, default=0, help='Seed генератора данных')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Размер пачки при создании данных')
+        parser.add_argument('--copy', action='store_true',
+                            help='Загружать таблицы без обратных ссылок через COPY (только PostgreSQL)')
+
+    def handle(self, *args, **options):
+        volumes = dict(PRESETS[options['preset']])
+        for key in VOLUME_KEYS:
+            if options[key] is not None:
+                volumes[key] = options[key]
+        if min(volumes['doctors'], volumes['patients'], volumes['clinics']) < 1:
+            raise CommandError('Нужен хотя бы один врач, пациент и клиника')
+
+        started = time.perf_counter()
+        created = seed_data(
+            volumes, seed=options['random_seed'], batch_size=options['batch_size'],
+            stdout=self.stdout, copy=options['copy']
+        )
+        if not created:
+            raise CommandError('Данные уже сгенерированы. Очистите базу командой clean_db и повторите запуск.')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Данные созданы за {time.perf_counter() - started:.1f} с: '
+            + ', '.join(f'{key}={volumes[key]}' for key in VOLUME_KEYS)
+        ))
@@ -1,6 +1,7 @@
 from django.core.management.base import BaseCommand
 from django.core.management import call_command
-from django.apps import apps
+
+from a_base.cleanup import reset_database
 
 
 class Command(BaseCommand):
@@ -15,11 +16,7 @@ class Command(BaseCommand):
     def clean_database(self):
         """Очищает всю базу данных"""
         self.stdout.write("Очистка базы данных...")
-        
-        for app_config in apps.get_app_configs():
-            for model in app_config.get_models():
-                model.objects.all().delete()
-                
+        reset_database()
         self.stdout.write(self.style.SUCCESS("База данных успешно очищена!"))
 
     def init_data(self):
@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from appointments.waitlist import expire_offers
+
+
+class Command(BaseCommand):
+    help = (
+        'Снимает истекшие предложения листа ожидания и передает слоты следующим пациентам в очереди. '
+        'С --loop работает как постоянный процесс и повторяет проверку каждые --interval секунд.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--loop', action='store_true', help='Работать постоянно')
+        parser.add_argument('--interval', type=int, default=60, help='Пауза между проверками в секундах')
+
+    def handle(self, *args, **options):
+        if options['interval'] < 1:
+            raise CommandError('Интервал должен быть не меньше секунды')
+
+        while True:
+            self.stdout.write(f'Истекших предложений: {expire_offers()}')
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
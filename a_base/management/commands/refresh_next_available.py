@@ -0,0 +1,30 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from doctors.availability import DEFAULT_BATCH_SIZE, refresh_all
+
+
+class Command(BaseCommand):
+    help = (
+        'Пересчитывает ближайший свободный слот (next_available_at) всех врачей и мест работы. '
+        'С --loop работает как постоянный процесс и повторяет пересчет каждые --interval секунд.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--loop', action='store_true', help='Работать постоянно')
+        parser.add_argument('--interval', type=int, default=300, help='Пауза между пересчетами в секундах')
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='Врачей в одной пачке')
+
+    def handle(self, *args, **options):
+        if options['interval'] < 1:
+            raise CommandError('Интервал должен быть не меньше секунды')
+        if options['batch_size'] < 1:
+            raise CommandError('Размер пачки должен быть положительным')
+
+        while True:
+            total, changed = refresh_all(batch_size=options['batch_size'])
+            self.stdout.write(f'Врачей: {total}, изменилось: {changed}')
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
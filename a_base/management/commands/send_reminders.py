@@ -0,0 +1,38 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from appointments.models import AppointmentReminder
+from appointments.reminders import DEFAULT_BATCH_SIZE, ReminderScheduler
+
+
+class Command(BaseCommand):
+    help = (
+        'Планирует и отправляет напоминания о приемах за 24 и за 2 часа. '
+        'С --loop работает как постоянный процесс и повторяет цикл каждые --interval секунд.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--loop', action='store_true', help='Работать постоянно')
+        parser.add_argument('--interval', type=int, default=60, help='Пауза между циклами в секундах')
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                            help='Количество записей и напоминаний в одной пачке')
+        parser.add_argument('--channels', nargs='+', choices=AppointmentReminder.Channel.values,
+                            help='Каналы отправки (по умолчанию settings.APPOINTMENT_REMINDER_CHANNELS)')
+
+    def handle(self, *args, **options):
+        if options['interval'] < 1:
+            raise CommandError('Интервал должен быть не меньше секунды')
+
+        scheduler = ReminderScheduler(
+            channels=options['channels'], batch_size=options['batch_size'], stdout=self.stdout
+        )
+        while True:
+            result = scheduler.run_once()
+            self.stdout.write(
+                f'В очередь: {result["queued"]}, отправлено: {result["sent"]}, ошибок: {result["failed"]}, '
+                f'пропущено: {result["skipped"]}'
+            )
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,51 @@
+from functools import lru_cache
+
+from django.conf import settings
+from django.utils import translation
+from django.utils.cache import patch_vary_headers
+from django.utils.translation.trans_real import parse_accept_lang_header
+
+
+@lru_cache(maxsize=512)
+def negotiate_language(accept_language):
+    """
+    Выбирает язык ответа по заголовку Accept-Language (например, 'ru-RU,ru;q=0.9').
+    Учитываются только языки из settings.LANGUAGES, иначе возвращается LANGUAGE_CODE.
+    Результат кэшируется для каждого уникального значения заголовка.
+    """
+    supported = {code for code, _ in settings.LANGUAGES}
+    for language, _ in parse_accept_lang_header(accept_language):
+        if language == '*':
+            break
+        if language in supported:
+            return language
+        # 'ru-ru' -> 'ru'
+        base_language = language.split('-')[0]
+        if base_language in supported:
+            return base_language
+    return settings.LANGUAGE_CODE
+
+
+class RequestLanguageMiddleware:
+    """
+    Определяет язык запроса один раз и сохраняет его в request.LANGUAGE_CODE.
+    Язык активируется только на время обработки запроса и затем сбрасывается,
+    чтобы не переходить в следующие запросы того же потока.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        language = negotiate_language(request.META.get('HTTP_ACCEPT_LANGUAGE', ''))
+        request.LANGUAGE_CODE = language
+
+        translation.activate(language)
+        try:
+            response = self.get_response(request)
+        finally:
+            translation.deactivate()
+
+        patch_vary_headers(response, ('Accept-Language',))
+        response.headers.setdefault('Content-Language', language)
+        return response
@@ -1,16 +1,10 @@
-from django.utils import translation
 from rest_framework import serializers
 from a_base.models import CancelReason
-from django.conf import settings
+from a_base.serializers.fields import TranslatedField
 
 class CancelReasonSerializer(serializers.ModelSerializer):
-    name = serializers.SerializerMethodField()
+    name = TranslatedField()
     
     class Meta:
         model = CancelReason
         fields = ['id', 'name']
-    
-    def get_name(self, obj):
-        lang = translation.get_language()
-        fallback_lang = settings.FALLBACK_LANGUAGES.get(lang, 'ru')
-        return getattr(obj, f'name_{lang}', getattr(obj, f'name_{fallback_lang}', 'Нет перевода'))
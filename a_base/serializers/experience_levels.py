@@ -1,16 +1,10 @@
-from django.utils import translation
 from rest_framework import serializers
 from a_base.models import ExperienceLevel
-from django.conf import settings
+from a_base.serializers.fields import TranslatedField
 
 class ExperienceLevelSerializer(serializers.ModelSerializer):
-    level = serializers.SerializerMethodField()
+    level = TranslatedField()
     
     class Meta:
         model = ExperienceLevel
-        fields = ['id', 'level']
-    
-    def get_level(self, obj):
-        lang = translation.get_language()
-        fallback_lang = settings.FALLBACK_LANGUAGES.get(lang, 'ru')
-        return getattr(obj, f'level_{lang}', getattr(obj, f'level_{fallback_lang}', 'Нет перевода'))
\ No newline at end of file
+        fields = ['id', 'level']
\ No newline at end of file
@@ -0,0 +1,59 @@
+from django.conf import settings
+from django.utils import translation
+from rest_framework import serializers
+
+NO_TRANSLATION = 'Нет перевода'
+
+
+def get_context_language(context):
+    """
+    Язык сериализации: request.LANGUAGE_CODE (см. a_base.middleware.RequestLanguageMiddleware),
+    а без запроса - активный язык.
+    """
+    request = context.get('request')
+    return getattr(request, 'LANGUAGE_CODE', None) or translation.get_language()
+
+
+def resolve_translation_attribute(model, field_name, language):
+    """
+    Имя колонки перевода поля field_name для языка language, а если такой колонки нет -
+    для резервного языка из settings.FALLBACK_LANGUAGES. None, если перевода нет совсем.
+    """
+    fallback_language = settings.FALLBACK_LANGUAGES.get(language, 'ru')
+    for lang in (language, fallback_language):
+        attribute = f'{field_name}_{lang}'
+        if hasattr(model, attribute):
+            return attribute
+    return None
+
+
+class TranslatedField(serializers.Field):
+    """
+    Поле только для чтения, которое отдает значение переводимого поля модели
+    (name_ru, name_tg, ...) на языке запроса, а если такой колонки нет - на резервном языке.
+
+    Колонка выбирается один раз на экземпляр поля, то есть один раз за сериализацию
+    списка, после чего значение читается напрямую из атрибута объекта.
+    По умолчанию имя поля модели совпадает с именем поля сериализатора.
+    """
+
+    def __init__(self, field_name=None, **kwargs):
+        kwargs['source'] = '*'
+        kwargs['read_only'] = True
+        self.translated_field = field_name
+        self._attribute = None
+        super().__init__(**kwargs)
+
+    def bind(self, field_name, parent):
+        super().bind(field_name, parent)
+        if self.translated_field is None:
+            self.translated_field = field_name
+
+    def to_representation(self, instance):
+        if self._attribute is None:
+            self._attribute = resolve_translation_attribute(
+                type(instance), self.translated_field, get_context_language(self.context)
+            ) or ''
+        if not self._attribute:
+            return NO_TRANSLATION
+        return getattr(instance, self._attribute)
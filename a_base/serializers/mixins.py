@@ -0,0 +1,49 @@
+from rest_framework.permissions import SAFE_METHODS
+
+
+def parse_fields_param(value):
+    """'id,name, photo' -> {'id', 'name', 'photo'}"""
+    return {name.strip() for name in value.split(',') if name.strip()}
+
+
+class SparseFieldsetMixin:
+    """
+    Позволяет клиенту управлять составом ответа через параметры запроса:
+    ?fields=id,name - вернуть только перечисленные поля,
+    ?expand=services - добавить вложенные поля из Meta.expandable_fields.
+
+    Meta.expandable_fields: имя поля -> (класс сериализатора, аргументы сериализатора).
+    Параметры применяются только к сериализатору верхнего уровня и только при чтении.
+    """
+
+    def get_requested_fields(self):
+        """Возвращает (fields, expand) из параметров запроса или (None, set()), если они не применимы"""
+        request = self.context.get('request')
+        if request is None or request.method not in SAFE_METHODS or not self._is_top_level():
+            return None, set()
+
+        params = getattr(request, 'query_params', request.GET)
+        fields = parse_fields_param(params['fields']) if params.get('fields') else None
+        expand = parse_fields_param(params.get('expand', ''))
+        return fields, expand
+
+    def _is_top_level(self):
+        parent = self.parent
+        if parent is None:
+            return True
+        # Элемент списка: many=True на верхнем уровне
+        return parent.parent is None and getattr(parent, 'child', None) is self
+
+    def get_fields(self):
+        fields = super().get_fields()
+        requested, expand = self.get_requested_fields()
+
+        expandable = getattr(self.Meta, 'expandable_fields', {})
+        for name in expand & set(expandable):
+            serializer_class, kwargs = expandable[name]
+            fields[name] = serializer_class(**{'read_only': True, **kwargs})
+
+        if requested is not None:
+            for name in set(fields) - requested - expand:
+                fields.pop(name)
+        return fields
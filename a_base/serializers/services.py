@@ -1,10 +1,9 @@
-from django.utils import translation
 from rest_framework import serializers
 from a_base.models import Service, ServicePlace
-from django.conf import settings
+from a_base.serializers.fields import TranslatedField
 
 class ServicePlaceSerializer(serializers.ModelSerializer):
-    name = serializers.SerializerMethodField()
+    name = TranslatedField()
 
     name_ru = serializers.CharField(write_only=True, required=True)
     name_tg = serializers.CharField(write_only=True, required=False)
@@ -12,11 +11,6 @@ class ServicePlaceSerializer(serializers.ModelSerializer):
     class Meta:
         model = ServicePlace
         fields = ['id', 'name', 'name_ru', 'name_tg']
-
-    def get_name(self, obj):
-        lang = translation.get_language()
-        fallback_lang = settings.FALLBACK_LANGUAGES.get(lang, 'ru')
-        return getattr(obj, f'name_{lang}', getattr(obj, f'name_{fallback_lang}', 'Нет перевода'))
     
 
 class ServiceSerializer(serializers.ModelSerializer):
@@ -27,8 +21,8 @@ class ServiceSerializer(serializers.ModelSerializer):
         write_only=True
     )
 
-    name = serializers.SerializerMethodField()
-    description = serializers.SerializerMethodField()
+    name = TranslatedField()
+    description = TranslatedField()
 
     name_ru = serializers.CharField(write_only=True, required=True)
     name_tg = serializers.CharField(write_only=True, required=False)
@@ -40,16 +34,6 @@ class ServiceSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'description', 'name_ru', 'name_tg', 'description_ru', 'description_tg', 
                   'service_place', 'service_place_id', 'price']
     
-    def get_name(self, obj):
-        lang = translation.get_language()
-        fallback_lang = settings.FALLBACK_LANGUAGES.get(lang, 'ru')
-        return getattr(obj, f'name_{lang}', getattr(obj, f'name_{fallback_lang}', 'Нет перевода'))
-    
-    def get_description(self, obj):
-        lang = translation.get_language()
-        fallback_lang = settings.FALLBACK_LANGUAGES.get(lang, 'ru')
-        return getattr(obj, f'description_{lang}', getattr(obj, f'description_{fallback_lang}', 'Нет перевода'))
-    
     def create(self, validated_data):
         """Создает услугу с переводами"""
         service_place = validated_data.pop('service_place')
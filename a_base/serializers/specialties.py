@@ -1,10 +1,9 @@
-from django.utils import translation
 from rest_framework import serializers
 from a_base.models import Specialty
-from django.conf import settings
+from a_base.serializers.fields import TranslatedField
 
 class SpecialtySerializer(serializers.ModelSerializer):
-    name = serializers.SerializerMethodField()
+    name = TranslatedField()
     name_ru = serializers.CharField(write_only=True, required=False)
     name_tg = serializers.CharField(write_only=True, required=False)
     
@@ -12,11 +11,6 @@ class SpecialtySerializer(serializers.ModelSerializer):
         model = Specialty
         fields = ['id', 'name', 'name_ru', 'name_tg']
     
-    def get_name(self, obj):
-        lang = translation.get_language()
-        fallback_lang = settings.FALLBACK_LANGUAGES.get(lang, 'ru')
-        return getattr(obj, f'name_{lang}', getattr(obj, f'name_{fallback_lang}', 'Нет перевода'))
-    
     def create(self, validated_data):
         name_ru = validated_data.pop('name_ru', None)
         name_tg = validated_data.pop('name_tg', None)
@@ -1,12 +1,11 @@
-from django.utils import translation
 from rest_framework import serializers
 from a_base.models import University
-from django.conf import settings
+from a_base.serializers.fields import TranslatedField
 
 class UniversitySerializer(serializers.ModelSerializer):
-    name = serializers.SerializerMethodField()
-    city = serializers.SerializerMethodField()
-    country = serializers.SerializerMethodField()
+    name = TranslatedField()
+    city = TranslatedField()
+    country = TranslatedField()
 
     name_ru = serializers.CharField(write_only=True, required=True)
     name_tg = serializers.CharField(write_only=True, required=False)
@@ -20,21 +19,6 @@ class UniversitySerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'name_ru', 'name_tg',
                   'city', 'city_ru', 'city_tg',
                   'country', 'country_ru', 'country_tg']
-
-    def get_name(self, obj):
-        lang = translation.get_language()
-        fallback_lang = settings.FALLBACK_LANGUAGES.get(lang, 'ru')
-        return getattr(obj, f'name_{lang}', getattr(obj, f'name_{fallback_lang}', 'Нет перевода'))
-    
-    def get_city(self, obj):
-        lang = translation.get_language()
-        fallback_lang = settings.FALLBACK_LANGUAGES.get(lang, 'ru')
-        return getattr(obj, f'city_{lang}', getattr(obj, f'city_{fallback_lang}', 'Нет перевода'))
-    
-    def get_country(self, obj):
-        lang = translation.get_language()
-        fallback_lang = settings.FALLBACK_LANGUAGES.get(lang, 'ru')
-        return getattr(obj, f'country_{lang}', getattr(obj, f'country_{fallback_lang}', 'Нет перевода'))
     
     
     def create(self, validated_data):
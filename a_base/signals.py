@@ -0,0 +1,44 @@
+from django.db.models.signals import post_save, post_delete, m2m_changed
+
+from a_base.cache import bump_catalog_version
+from a_base.models import (
+    Region, District,
+    Advantage, Subscription, Gender, AppointmentStatus,
+    Specialty, AcademicDegree, MedicalCategory, Service, ServicePlace,
+    Language, LanguageLevel, ExperienceLevel,
+    SocialStatus, CancelReason, University
+)
+
+# Справочники, ответы которых кэшируются (см. a_base.views.mixins.CachedCatalogMixin)
+CATALOG_MODELS = (
+    Region, District,
+    Advantage, Subscription, Gender, AppointmentStatus,
+    Specialty, AcademicDegree, MedicalCategory, Service, ServicePlace,
+    Language, LanguageLevel, ExperienceLevel,
+    SocialStatus, CancelReason, University,
+)
+
+
+def invalidate_catalog(sender, **kwargs):
+    """
+    При изменении или удалении записи справочника сдвигает его версию,
+    чтобы закэшированные ответы больше не использовались.
+    """
+    bump_catalog_version(sender)
+
+
+def invalidate_subscription_advantages(sender, action, **kwargs):
+    """Изменение набора преимуществ подписки также меняет ответ /subscriptions/"""
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        bump_catalog_version(Subscription)
+
+
+for model in CATALOG_MODELS:
+    post_save.connect(invalidate_catalog, sender=model, dispatch_uid=f'catalog_save_{model._meta.label_lower}')
+    post_delete.connect(invalidate_catalog, sender=model, dispatch_uid=f'catalog_delete_{model._meta.label_lower}')
+
+m2m_changed.connect(
+    invalidate_subscription_advantages,
+    sender=Subscription.advantages.through,
+    dispatch_uid='catalog_subscription_advantages'
+)
@@ -19,4 +19,14 @@ from .languages import (LanguageModelTest, LanguageLevelModelTest, LanguageSeria
 
 from .experience_levels import (ExperienceLevelModelTest, ExperienceLevelSerializerTest, ExperienceLevelViewSetTest)
 
-from .social_statuses import (SocialStatusModelTest,)
\ No newline at end of file
+from .social_statuses import (SocialStatusModelTest,)
+
+from .catalog_cache import (CatalogCacheTest,)
+from .bootstrap import (BootstrapAPITest,)
+from .middleware import (RequestLanguageMiddlewareTest,)
+from .translated_fields import (TranslatedFieldTest,)
+from .instrumentation import (InstrumentationTest,)
+from .benchmarks import (BenchmarkHarnessTest,)
+
+from .cleanup import (CleanupTest,)
+from .chat_loadtest import (ChatLoadTestCommandTest,)
\ No newline at end of file
@@ -0,0 +1,61 @@
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from a_base.benchmarks import compare_results, run_benchmarks, run_import_benchmark, seed_data
+from a_base.benchmarks.generators import WORKING_WEEKDAYS
+from appointments.models import Appointment, Review
+from chat.models import Message
+from doctors.models import Doctor
+
+
+class BenchmarkHarnessTest(TestCase):
+    volumes = {'doctors': 3, 'patients': 5, 'clinics': 2, 'appointments': 40, 'messages': 30}
+
+    def test_seed_is_deterministic_and_idempotent(self):
+        """Данные создаются в заданном объеме и не дублируются при повторном запуске"""
+        self.assertTrue(seed_data(self.volumes, batch_size=7))
+        self.assertFalse(seed_data(self.volumes))
+
+        self.assertEqual(Doctor.objects.count(), 3)
+        self.assertEqual(Appointment.objects.count(), 40)
+        self.assertEqual(Message.objects.count(), 30)
+
+    def test_run_and_compare(self):
+        """Результаты замеров содержат метрики и сравниваются между запусками"""
+        seed_data(self.volumes)
+        results = run_benchmarks(names=['doctor_list', 'appointment_list'], iterations=2, warmup=0)
+
+        self.assertEqual(results['doctor_list']['status'], 200)
+        self.assertEqual(results['appointment_list']['status'], 200)
+        self.assertGreater(results['doctor_list']['queries'], 0)
+
+        slower = {name: dict(metrics, p50_ms=metrics['p50_ms'] * 2) for name, metrics in results.items()}
+        rows = compare_results(results, slower)
+        self.assertIn(('doctor_list', 'p50_ms'), [(name, metric) for name, metric, *_ in rows])
+        self.assertTrue(all(change == 100.0 for _, metric, _, _, change in rows if metric == 'p50_ms'))
+
+    def test_import_benchmark_rolls_back(self):
+        """Замер импорта не оставляет данных в базе"""
+        results = run_import_benchmark(5, workers=(1, 2), batch_size=2)
+
+        self.assertEqual(set(results), {1, 2})
+        self.assertEqual(results[1]['errors'], 0)
+        self.assertFalse(Doctor.objects.exists())
+
+    def test_generate_data_command(self):
+        """Объемы пресета переопределяются, записи попадают в рабочие дни, повторный запуск отклоняется"""
+        call_command('generate_data', doctors=2, patients=4, clinics=1, appointments=50, messages=10,
+                     batch_size=8, stdout=StringIO())
+
+        self.assertEqual(Appointment.objects.count(), 50)
+        self.assertEqual(Message.objects.count(), 10)
+        self.assertTrue(Review.objects.exists())
+        weekdays = {day.weekday() for day in Appointment.objects.values_list('appointment_date', flat=True)}
+        self.assertLessEqual(weekdays, set(WORKING_WEEKDAYS))
+        for appointment in Appointment.objects.select_related('patient__user'):
+            self.assertEqual(appointment.phone_number, appointment.patient.user.phone_number)
+
+        with self.assertRaises(CommandError):
+            call_command('generate_data', doctors=1, patients=1, clinics=1, stdout=StringIO())
@@ -0,0 +1,71 @@
+import gzip
+import json
+
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from a_base.models import Region, District, Gender
+
+
+class BootstrapAPITest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.region = Region.objects.create(code='01', name_ru='Душанбе', name_tg='Душанбе (tg)')
+        District.objects.create(code='01', name_ru='Центральный', name_tg='Марказӣ', region=self.region)
+        Gender.objects.create(name_ru='Мужской', name_tg='Мард')
+        self.url = reverse('bootstrap')
+
+    def test_bootstrap_contains_catalogs(self):
+        """Ответ содержит все справочники на запрошенном языке"""
+        response = self.client.get(self.url, HTTP_ACCEPT_LANGUAGE='tg')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = json.loads(response.content)
+        self.assertEqual(data['language'], 'tg')
+        self.assertEqual(data['hash'], response['ETag'].strip('"'))
+        self.assertEqual(data['catalogs']['regions'][0]['name'], 'Душанбе (tg)')
+        self.assertEqual(data['catalogs']['districts'][0]['name'], 'Марказӣ')
+        self.assertEqual(data['catalogs']['genders'][0]['name'], 'Мард')
+        self.assertIn('cancel_reasons', data['catalogs'])
+
+    def test_gzip_response(self):
+        """Клиент, поддерживающий gzip, получает сжатый ответ"""
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip, deflate')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        data = json.loads(gzip.decompress(response.content))
+        self.assertEqual(data['catalogs']['regions'][0]['code'], '01')
+
+    def test_not_modified_by_hash(self):
+        """Неизменившиеся данные не загружаются повторно"""
+        response = self.client.get(self.url)
+        content_hash = response['X-Content-Hash']
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=f'"{content_hash}"')
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        response = self.client.get(self.url, {'hash': content_hash})
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_not_modified_by_weak_etag_list(self):
+        """Слабый ETag от прокси и список ETag сравниваются без учета W/"""
+        content_hash = self.client.get(self.url)['X-Content-Hash']
+
+        for header in (f'W/"{content_hash}"', f'"other", W/"{content_hash}"', '*'):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=header)
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED, header)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH='W/"other"')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_payload_rebuilt_after_change(self):
+        """Изменение справочника меняет хэш ответа"""
+        first_hash = self.client.get(self.url)['X-Content-Hash']
+
+        self.region.name_ru = 'Душанбе (новое)'
+        self.region.save()
+
+        response = self.client.get(self.url)
+        self.assertNotEqual(response['X-Content-Hash'], first_hash)
+        self.assertEqual(json.loads(response.content)['catalogs']['regions'][0]['name'], 'Душанбе (новое)')
@@ -0,0 +1,69 @@
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from a_base.models import Region, District
+
+
+class CatalogCacheTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.region = Region.objects.create(
+            code='01',
+            name_ru='Душанбе',
+            name_tg='Душанбе (tg)'
+        )
+        self.url_list = reverse('region-list')
+
+    # Кэш в памяти процесса: обращения к кэшу в базе данных не смешиваются с запросами к справочникам
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_second_request_served_from_cache(self):
+        """Повторный запрос не обращается к базе данных"""
+        self.client.get(self.url_list, HTTP_ACCEPT_LANGUAGE='ru')
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url_list, HTTP_ACCEPT_LANGUAGE='ru')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]['name'], 'Душанбе')
+
+    def test_cache_is_separated_by_language(self):
+        """Для разных языков кэшируются разные ответы"""
+        response_ru = self.client.get(self.url_list, HTTP_ACCEPT_LANGUAGE='ru')
+        response_tg = self.client.get(self.url_list, HTTP_ACCEPT_LANGUAGE='tg')
+        self.assertEqual(response_ru.data[0]['name'], 'Душанбе')
+        self.assertEqual(response_tg.data[0]['name'], 'Душанбе (tg)')
+        self.assertNotEqual(response_ru['ETag'], response_tg['ETag'])
+
+    def test_not_modified_by_etag(self):
+        """Ответ 304 при совпадении ETag"""
+        response = self.client.get(self.url_list)
+        self.assertIn('ETag', response)
+        self.assertIn('Last-Modified', response)
+
+        response = self.client.get(self.url_list, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_save_invalidates_cache(self):
+        """Изменение записи сбрасывает кэш и меняет ETag"""
+        response = self.client.get(self.url_list, HTTP_ACCEPT_LANGUAGE='ru')
+        etag = response['ETag']
+
+        self.region.name_ru = 'Душанбе (новое)'
+        self.region.save()
+
+        response = self.client.get(self.url_list, HTTP_ACCEPT_LANGUAGE='ru', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]['name'], 'Душанбе (новое)')
+
+    def test_related_model_invalidates_cache(self):
+        """Изменение региона сбрасывает кэш районов"""
+        District.objects.create(code='01', name_ru='Центральный', region=self.region)
+        url = reverse('district-list')
+        self.client.get(url)
+
+        self.region.name_ru = 'Душанбе (новое)'
+        self.region.save()
+
+        response = self.client.get(url)
+        self.assertEqual(response.data[0]['region']['name'], 'Душанбе (новое)')
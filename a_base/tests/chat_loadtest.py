@@ -0,0 +1,96 @@
+import asyncio
+import threading
+from io import StringIO
+
+from aiohttp import WSMsgType, web
+from channels.routing import URLRouter
+from channels.testing import WebsocketCommunicator
+from django.core.management import call_command
+from django.test import TransactionTestCase
+
+from a_base.benchmarks import seed_data
+from chat.loadtest import MESSAGE_PREFIX
+from chat.models import Message
+from chat.routing import websocket_urlpatterns
+
+application = URLRouter(websocket_urlpatterns)
+
+
+class ChatServer(threading.Thread):
+    """
+    WebSocket-сервер в отдельном потоке: каждое соединение передается настоящему ChatConsumer
+    через WebsocketCommunicator, так что сообщения сохраняются в тестовую базу как на сервере.
+    """
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.loop = asyncio.new_event_loop()
+        self.ready = threading.Event()
+        self.port = None
+
+    def run(self):
+        asyncio.set_event_loop(self.loop)
+        app = web.Application()
+        app.router.add_get('/ws/chat/{chat_id}/', self.handle)
+        runner = web.AppRunner(app)
+        self.loop.run_until_complete(runner.setup())
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        self.loop.run_until_complete(site.start())
+        self.port = runner.addresses[0][1]
+        self.ready.set()
+        self.loop.run_forever()
+        self.loop.run_until_complete(runner.cleanup())
+
+    def stop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.join()
+
+    async def handle(self, request):
+        communicator = WebsocketCommunicator(application, request.path_qs)
+        connected, _ = await communicator.connect()
+        if not connected:
+            raise web.HTTPForbidden()
+
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+
+        async def forward():
+            while True:
+                await ws.send_str(await communicator.receive_from(timeout=None))
+
+        forwarder = asyncio.create_task(forward())
+        async for message in ws:
+            if message.type == WSMsgType.TEXT:
+                await communicator.send_to(text_data=message.data)
+        forwarder.cancel()
+        await communicator.disconnect()
+        return ws
+
+
+class ChatLoadTestCommandTest(TransactionTestCase):
+    volumes = {'doctors': 1, 'patients': 1, 'clinics': 1, 'appointments': 0, 'messages': 2}
+
+    def setUp(self):
+        seed_data(self.volumes)
+        self.server = ChatServer()
+        self.server.start()
+        self.server.ready.wait(5)
+        self.addCleanup(self.server.stop)
+
+    def run_command(self, **options):
+        out = StringIO()
+        call_command('chat_loadtest', url=f'ws://127.0.0.1:{self.server.port}', connections=2,
+                     rate=5, duration=1, drain=1, stdout=out, **options)
+        return out.getvalue()
+
+    def test_messages_deleted_after_run(self):
+        """Сообщения теста доставляются участникам и удаляются после прогона, остальные остаются"""
+        output = self.run_command()
+
+        self.assertIn('"connected": 2', output)
+        self.assertNotIn('"received": 0', output)
+        self.assertIn('Удалено сообщений теста', output)
+        self.assertEqual(Message.objects.count(), self.volumes['messages'])
+
+        self.run_command(keep_messages=True)
+        self.assertTrue(Message.objects.filter(content__startswith=f'{MESSAGE_PREFIX}:').exists())
@@ -0,0 +1,46 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.management import call_command
+from django.test import TestCase
+
+from a_base.benchmarks import seed_data
+from a_base.cache import get_catalog_version
+from a_base.cleanup import reset_database
+from a_base.models import Specialty
+from appointments.models import Appointment, Review
+from chat.models import Message
+from clinics.models import Clinic
+from doctors.models import Doctor
+
+User = get_user_model()
+
+
+class CleanupTest(TestCase):
+    volumes = {'doctors': 2, 'patients': 3, 'clinics': 2, 'appointments': 30, 'messages': 10}
+
+    def setUp(self):
+        seed_data(self.volumes)
+        Group.objects.get_or_create(name='Doctor')
+
+    def test_keep_reference(self):
+        """Справочники и группы остаются, данные пользователей удаляются в порядке зависимостей"""
+        tables = reset_database(keep_reference=True)
+
+        for model in (User, Doctor, Appointment, Review, Message):
+            self.assertFalse(model.objects.exists(), model.__name__)
+        self.assertTrue(Specialty.objects.exists())
+        self.assertEqual(Clinic.objects.count(), 2)
+        self.assertTrue(Group.objects.exists())
+        self.assertLess(tables.index(Message._meta.db_table), tables.index(User._meta.db_table))
+        self.assertLess(tables.index(Review._meta.db_table), tables.index(Appointment._meta.db_table))
+
+    def test_full_reset_invalidates_catalogs(self):
+        """Полная очистка удаляет справочники и сбрасывает их кэш"""
+        version = get_catalog_version(Specialty)
+        call_command('clean_db', stdout=StringIO())
+
+        self.assertFalse(Specialty.objects.exists())
+        self.assertFalse(Clinic.objects.exists())
+        self.assertNotEqual(get_catalog_version(Specialty), version)
@@ -169,8 +169,8 @@ class ExperienceLevelViewSetTest(TestCase):
         self.assertEqual(response.data[0]['level'], "1-3 сол (тг)")
         self.assertEqual(response.data[1]['level'], "4-6 сол (тг)")
         
-        # Проверяем, что язык действительно активирован
-        self.assertEqual(translation.get_language(), 'tg')
+        # Проверяем, что ответ отдан на языке из заголовка
+        self.assertEqual(response['Content-Language'], 'tg')
 
     def test_retrieve_with_language_header(self):
         """Тест детального просмотра с языком из заголовка"""
@@ -231,32 +231,15 @@ class ExperienceLevelViewSetTest(TestCase):
         })
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
-    def test_activate_language_method(self):
-        """Тест метода activate_language_from_header"""
-        from a_base.views import ExperienceLevelViewSet
-        
-        # Создаем фейковый запрос с заголовком
-        request = self.factory.get('/', HTTP_ACCEPT_LANGUAGE='tg')
-        view = ExperienceLevelViewSet()
-        view.request = request
-        
-        # Вызываем метод
-        view.activate_language_from_header(request)
-        
-        # Проверяем результат
-        self.assertEqual(translation.get_language(), 'tg')
+    def test_negotiate_language(self):
+        """Тест определения языка из заголовка"""
+        from a_base.middleware import negotiate_language
+
+        self.assertEqual(negotiate_language('tg'), 'tg')
+
+    def test_negotiate_language_default(self):
+        """Тест определения языка без заголовка"""
+        from a_base.middleware import negotiate_language
 
-    def test_activate_language_default(self):
-        """Тест метода activate_language_from_header с заголовком по умолчанию"""
-        from a_base.views import ExperienceLevelViewSet
-        
-        # Создаем запрос без заголовка
-        request = self.factory.get('/')
-        view = ExperienceLevelViewSet()
-        view.request = request
-        
-        # Вызываем метод
-        view.activate_language_from_header(request)
-        
         # Проверяем, что используется язык по умолчанию ('ru')
-        self.assertEqual(translation.get_language(), 'ru')
\ No newline at end of file
+        self.assertEqual(negotiate_language(''), 'ru')
\ No newline at end of file
@@ -0,0 +1,78 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from a_base.instrumentation import QueryRecorder, query_signature, registry
+from a_base.models import Gender
+
+
+@override_settings(INSTRUMENTATION_ENABLED=True, INSTRUMENTATION_METRICS_TOKEN=None,
+                   INSTRUMENTATION_N_PLUS_ONE_THRESHOLD=2)
+class InstrumentationTest(APITestCase):
+    def setUp(self):
+        registry.reset()
+        Gender.objects.create(name_ru='Мужской', name_tg='Мард')
+        self.url = reverse('gender-list')
+        self.staff = get_user_model().objects.create_user(
+            first_name='AdminTestUser',
+            date_of_birth='2002-08-08',
+            phone_number='+992123456789',
+            password='adminpass',
+            is_staff=True
+        )
+
+    def test_query_signature(self):
+        """Сигнатура не зависит от количества параметров в IN"""
+        self.assertEqual(
+            query_signature('SELECT * FROM t WHERE id IN (%s, %s)'),
+            query_signature('SELECT  *  FROM t WHERE id IN (%s, %s, %s)')
+        )
+
+    def test_duplicate_queries_detected(self):
+        """Повторяющиеся одинаковые запросы отмечаются как возможная проблема N+1"""
+        recorder = QueryRecorder()
+        with connection.execute_wrapper(recorder):
+            for _ in range(3):
+                list(Gender.objects.filter(id=1))
+        self.assertEqual(recorder.count, 3)
+        self.assertEqual(list(recorder.duplicates(3).values()), [3])
+
+    def test_request_is_recorded(self):
+        """Запрос попадает в структурированный лог и в метрики"""
+        with self.assertLogs('rating.instrumentation', level='INFO') as logs:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('"view": "gender-list"', logs.output[0])
+        self.assertIn('"db_queries"', logs.output[0])
+        self.assertIn('"non_db_duration"', logs.output[0])
+        self.assertNotIn('"render_duration": null', logs.output[0])
+
+        self.client.force_login(self.staff)
+        with self.assertLogs('rating.instrumentation', level='INFO'):
+            metrics = self.client.get(reverse('metrics')).content.decode()
+        self.assertIn('http_requests_total{view="gender-list",method="GET",status="200"} 1', metrics)
+        self.assertIn('http_request_duration_seconds_count{view="gender-list"', metrics)
+        self.assertIn('# TYPE http_render_duration_seconds histogram', metrics)
+        self.assertIn('http_render_duration_seconds_count{view="gender-list",method="GET",status="200"} 1', metrics)
+
+    @override_settings(INSTRUMENTATION_ENABLED=False)
+    def test_metrics_disabled(self):
+        """Без включенной инструментации метрики недоступны"""
+        response = self.client.get(reverse('metrics'))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_metrics_hidden_without_token(self):
+        """Без токена метрики видны только сотрудникам"""
+        response = self.client.get(reverse('metrics'))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(INSTRUMENTATION_METRICS_TOKEN='secret')
+    def test_metrics_token(self):
+        response = self.client.get(reverse('metrics'))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        response = self.client.get(reverse('metrics'), HTTP_AUTHORIZATION='Bearer secret')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
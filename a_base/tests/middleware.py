@@ -0,0 +1,31 @@
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import translation
+
+from a_base.middleware import negotiate_language
+from a_base.models import Gender
+
+
+class RequestLanguageMiddlewareTest(TestCase):
+    def setUp(self):
+        Gender.objects.create(name_ru='Мужской', name_tg='Мард')
+        self.url = reverse('gender-list')
+
+    def test_negotiate_language(self):
+        """Язык выбирается из списка поддерживаемых с учетом приоритетов"""
+        self.assertEqual(negotiate_language('tg'), 'tg')
+        self.assertEqual(negotiate_language('ru-RU,ru;q=0.9,en;q=0.8'), 'ru')
+        self.assertEqual(negotiate_language('en-US,tg;q=0.5'), 'tg')
+        self.assertEqual(negotiate_language('en'), 'ru')
+        self.assertEqual(negotiate_language(''), 'ru')
+
+    def test_response_language(self):
+        """Ответ отдается на языке из заголовка, язык не переходит в следующий запрос"""
+        response = self.client.get(self.url, HTTP_ACCEPT_LANGUAGE='tg-TJ,tg;q=0.9')
+        self.assertEqual(response.json()[0]['name'], 'Мард')
+        self.assertEqual(response['Content-Language'], 'tg')
+        self.assertIn('Accept-Language', response['Vary'])
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.json()[0]['name'], 'Мужской')
+        self.assertEqual(translation.get_language(), 'ru')
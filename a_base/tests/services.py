@@ -5,7 +5,7 @@ from rest_framework.test import APIRequestFactory, APITestCase
 from a_base.serializers import ServiceSerializer
 from django.urls import reverse
 from rest_framework import status
-from a_base.views import ServiceViewSet
+from a_base.middleware import negotiate_language
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
@@ -435,19 +435,12 @@ class ServiceViewSetTest(APITestCase):
 
     # Тесты языка
     def test_activate_language_header(self):
-        """Тест активации языка из заголовка"""
-        view = ServiceViewSet()
-        request = self.factory.get('/')
-        
-        # Проверяем установку языка из заголовка
-        request.META['HTTP_ACCEPT_LANGUAGE'] = 'tg'
-        view.activate_language_from_header(request)
-        self.assertEqual(translation.get_language(), 'tg')
-        
+        """Тест определения языка из заголовка"""
+        # Проверяем выбор языка из заголовка
+        self.assertEqual(negotiate_language('tg'), 'tg')
+
         # Проверяем fallback при отсутствии заголовка
-        del request.META['HTTP_ACCEPT_LANGUAGE']
-        view.activate_language_from_header(request)
-        self.assertEqual(translation.get_language(), 'ru')
+        self.assertEqual(negotiate_language(''), 'ru')
 
     def test_invalid_language_header(self):
         """Тест с некорректным языком в заголовке"""
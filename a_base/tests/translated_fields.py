@@ -0,0 +1,76 @@
+from django.test import TestCase
+from django.utils import translation
+from rest_framework import serializers
+from rest_framework.test import APIRequestFactory
+
+from a_base.models import Specialty
+from a_base.serializers import SpecialtySerializer
+from a_base.serializers.fields import TranslatedField
+from a_base.views.mixins import DeferTranslationsMixin
+from doctors.models import Doctor
+
+
+class TranslatedFieldTest(TestCase):
+    def setUp(self):
+        Specialty.objects.create(name_ru='Кардиолог', name_tg='Кардиолог (тг)')
+        Specialty.objects.create(name_ru='Хирург', name_tg='Ҷарроҳ')
+        self.factory = APIRequestFactory()
+
+    def test_language_from_request(self):
+        """Язык берется из request.LANGUAGE_CODE"""
+        request = self.factory.get('/')
+        request.LANGUAGE_CODE = 'tg'
+        data = SpecialtySerializer(Specialty.objects.order_by('id'), many=True, context={'request': request}).data
+        self.assertEqual([item['name'] for item in data], ['Кардиолог (тг)', 'Ҷарроҳ'])
+
+    def test_fallback_language(self):
+        """Для языка без колонки используется резервный язык"""
+        with translation.override('en'):
+            data = SpecialtySerializer(Specialty.objects.order_by('id'), many=True).data
+        self.assertEqual(data[0]['name'], 'Кардиолог')
+
+    def test_missing_translation(self):
+        """Для поля без колонок перевода возвращается заглушка"""
+        class PhilosophySerializer(serializers.ModelSerializer):
+            philosophy = TranslatedField()
+
+            class Meta:
+                model = Specialty
+                fields = ['id', 'philosophy']
+
+        data = PhilosophySerializer(Specialty.objects.first()).data
+        self.assertEqual(data['philosophy'], 'Нет перевода')
+
+    def test_defer_inactive_languages(self):
+        """Колонки неиспользуемых языков не загружаются из БД"""
+        class BaseView:
+            def get_queryset(self):
+                return Specialty.objects.all()
+
+        class View(DeferTranslationsMixin, BaseView):
+            deferred_translation_fields = ('name',)
+
+        view = View()
+        view.request = self.factory.get('/')
+        view.request.LANGUAGE_CODE = 'tg'
+
+        specialty = view.get_queryset().first()
+        self.assertEqual(specialty.get_deferred_fields(), {'name_ru'})
+
+    def test_defer_registered_translation_fields(self):
+        """Без явного списка откладываются все переводимые поля модели из modeltranslation"""
+        class BaseView:
+            def get_queryset(self):
+                return Doctor.objects.all()
+
+        class View(DeferTranslationsMixin, BaseView):
+            pass
+
+        view = View()
+        view.request = self.factory.get('/')
+        view.request.LANGUAGE_CODE = 'ru'
+
+        deferred, is_defer = view.get_queryset().query.deferred_loading
+        self.assertTrue(is_defer)
+        self.assertTrue({'about_tg', 'titles_and_merits_tg'} <= deferred)
+        self.assertFalse({'about_ru', 'titles_and_merits_ru'} & deferred)
@@ -3,7 +3,8 @@ from rest_framework.routers import DefaultRouter
 from .views import (DistrictViewSet, RegionViewSet, SubscriptionViewSet, GroupViewSet, AppointmentStatusViewSet,
                     AcademicDegreeViewSet, SpecialtyViewSet, MedicalCategoryViewSet, ServiceViewSet,
                     LanguageViewSet, LanguageLevelViewSet, GenderViewSet, ExperienceLevelViewSet,
-                    SocialStatusViewSet, CancelReasonViewSet, UniversityViewSet)
+                    SocialStatusViewSet, CancelReasonViewSet, UniversityViewSet,
+                    BootstrapView)
 
 router = DefaultRouter()
 router.register(r'regions', RegionViewSet, basename='region')
@@ -27,5 +28,6 @@ router.register(r'social_statuses', SocialStatusViewSet, basename='social_status
 router.register(r'cancel_reasons', CancelReasonViewSet, basename='cancel_reason')
 
 urlpatterns = [
+    path('bootstrap/', BootstrapView.as_view(), name='bootstrap'),
     path('', include(router.urls)),
 ]
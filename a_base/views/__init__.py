@@ -13,4 +13,7 @@ from .experience_levels import ExperienceLevelViewSet
 from .universities import UniversityViewSet
 
 from .social_statuses import SocialStatusViewSet
-from .cancel_reasons import CancelReasonViewSet
\ No newline at end of file
+from .cancel_reasons import CancelReasonViewSet
+from .bootstrap import BootstrapView
+from .metrics import metrics_view
+
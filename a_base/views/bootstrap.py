@@ -0,0 +1,40 @@
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils import translation
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import quote_etag
+from rest_framework.permissions import AllowAny
+from rest_framework.views import APIView
+
+from a_base.bootstrap import get_bootstrap_payload
+from a_base.views.mixins import etag_matches
+
+
+class BootstrapView(APIView):
+    """
+    Возвращает все справочники одним ответом на языке из заголовка Accept-Language.
+    Ответ заранее собран и сжат. Хэш содержимого передается в поле hash и в ETag:
+    клиент может прислать его в If-None-Match (или ?hash=) и получить 304, если данные не изменились.
+    """
+    permission_classes = [AllowAny]
+
+    def get(self, request, *args, **kwargs):
+        payload = get_bootstrap_payload(
+            getattr(request, 'LANGUAGE_CODE', None) or translation.get_language()
+        )
+        etag = quote_etag(payload['hash'])
+
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+        client_has_payload = if_none_match and etag_matches(if_none_match, etag)
+        if client_has_payload or request.query_params.get('hash') == payload['hash']:
+            response = HttpResponseNotModified()
+        elif 'gzip' in request.META.get('HTTP_ACCEPT_ENCODING', ''):
+            response = HttpResponse(payload['compressed'], content_type='application/json; charset=utf-8')
+            response['Content-Encoding'] = 'gzip'
+        else:
+            response = HttpResponse(payload['content'], content_type='application/json; charset=utf-8')
+
+        response['ETag'] = etag
+        response['X-Content-Hash'] = payload['hash']
+        patch_cache_control(response, max_age=0)
+        patch_vary_headers(response, ('Accept-Language', 'Accept-Encoding'))
+        return response
@@ -1,41 +1,16 @@
-from django.utils import translation
 from rest_framework import viewsets
 from a_base.models import Language, LanguageLevel
 from a_base.serializers import LanguageSerializer, LanguageLevelSerializer
 from a_base.permissions import ReadOnlyOrAdmin
+from a_base.views.mixins import CachedCatalogMixin
 
-class LanguageViewSet(viewsets.ModelViewSet):
+class LanguageViewSet(CachedCatalogMixin, viewsets.ModelViewSet):
     queryset = Language.objects.all()
     serializer_class = LanguageSerializer
     permission_classes = [ReadOnlyOrAdmin]
 
-    def list(self, request, *args, **kwargs):
-        # Принудительно активируем язык из заголовка
-        self.activate_language_from_header(request)
-        return super().list(request, *args, **kwargs)
-    
-    def retrieve(self, request, *args, **kwargs):
-        self.activate_language_from_header(request)
-        return super().retrieve(request, *args, **kwargs)
-    
-    def activate_language_from_header(self, request):
-        lang = request.META.get('HTTP_ACCEPT_LANGUAGE', 'ru')
-        translation.activate(lang)
 
-class LanguageLevelViewSet(viewsets.ModelViewSet):
+class LanguageLevelViewSet(CachedCatalogMixin, viewsets.ModelViewSet):
     queryset = LanguageLevel.objects.all()
     serializer_class = LanguageLevelSerializer
     permission_classes = [ReadOnlyOrAdmin]
-
-    def list(self, request, *args, **kwargs):
-        # Принудительно активируем язык из заголовка
-        self.activate_language_from_header(request)
-        return super().list(request, *args, **kwargs)
-    
-    def retrieve(self, request, *args, **kwargs):
-        self.activate_language_from_header(request)
-        return super().retrieve(request, *args, **kwargs)
-    
-    def activate_language_from_header(self, request):
-        lang = request.META.get('HTTP_ACCEPT_LANGUAGE', 'ru')
-        translation.activate(lang)
\ No newline at end of file
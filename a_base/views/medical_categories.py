@@ -1,32 +1,18 @@
-from django.utils import translation
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 from a_base.models import MedicalCategory
 from a_base.serializers import MedicalCategorySerializer
 from a_base.permissions import ReadOnlyOrAdmin
+from a_base.views.mixins import CachedCatalogMixin
 
-class MedicalCategoryViewSet(viewsets.ModelViewSet):
+class MedicalCategoryViewSet(CachedCatalogMixin, viewsets.ModelViewSet):
     queryset = MedicalCategory.objects.all()
     serializer_class = MedicalCategorySerializer
     permission_classes = [ReadOnlyOrAdmin]
 
-    def list(self, request, *args, **kwargs):
-        # Принудительно активируем язык из заголовка
-        self.activate_language_from_header(request)
-        return super().list(request, *args, **kwargs)
-    
-    def retrieve(self, request, *args, **kwargs):
-        self.activate_language_from_header(request)
-        return super().retrieve(request, *args, **kwargs)
-    
-    def activate_language_from_header(self, request):
-        lang = request.META.get('HTTP_ACCEPT_LANGUAGE', 'ru')
-        translation.activate(lang)
 
     def create(self, request, *args, **kwargs):
         """Создание новой медицинской категории с переводами"""
-        self.activate_language_from_header(request)
-        
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
@@ -51,7 +37,6 @@ class MedicalCategoryViewSet(viewsets.ModelViewSet):
 
     def update(self, request, *args, **kwargs):
         """Обновление медицинской категории с переводами"""
-        self.activate_language_from_header(request)
         partial = kwargs.pop('partial', False)
         instance = self.get_object()
         
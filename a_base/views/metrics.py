@@ -0,0 +1,24 @@
+from django.conf import settings
+from django.http import Http404, HttpResponse, HttpResponseForbidden
+
+from a_base.instrumentation import registry
+
+
+def metrics_view(request):
+    """
+    Метрики эндпоинтов в формате Prometheus.
+    Доступны только при включенной инструментации; если задан INSTRUMENTATION_METRICS_TOKEN,
+    запрос должен содержать заголовок 'Authorization: Bearer <token>', иначе метрики видны
+    только сотрудникам (сессия админки), остальным отвечает 404.
+    """
+    if not getattr(settings, 'INSTRUMENTATION_ENABLED', False):
+        raise Http404
+
+    token = getattr(settings, 'INSTRUMENTATION_METRICS_TOKEN', None)
+    if token:
+        if request.META.get('HTTP_AUTHORIZATION') != f'Bearer {token}':
+            return HttpResponseForbidden()
+    elif not request.user.is_staff:
+        raise Http404
+
+    return HttpResponse(registry.render_prometheus(), content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -0,0 +1,117 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import translation
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, parse_etags, parse_http_date_safe, quote_etag
+from modeltranslation.translator import NotRegistered, translator
+from rest_framework import status
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
+
+from a_base.cache import build_response_key, get_cache_timeout, get_catalog_versions
+from a_base.serializers.fields import get_context_language, resolve_translation_attribute
+
+
+def etag_matches(if_none_match, etag):
+    """
+    Слабое сравнение ETag из If-None-Match (RFC 9110): список через запятую, префикс W/ не учитывается.
+    Прокси добавляют W/ к ETag после сжатия ответа.
+    """
+    etags = [tag[2:] if tag.startswith('W/') else tag for tag in parse_etags(if_none_match)]
+    return etag in etags or '*' in etags
+
+class CachedCatalogMixin:
+    """
+    Кэширует ответы list/retrieve справочников отдельно для каждого языка и строки запроса.
+    Поддерживает ETag/Last-Modified и ответ 304 Not Modified.
+    Кэш сбрасывается сдвигом версии справочника при сохранении/удалении записей (см. a_base.signals).
+    """
+    # Модели, от которых зависит ответ. По умолчанию - модель queryset
+    cache_models = None
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(super().retrieve, request, *args, **kwargs)
+
+    def get_cache_models(self):
+        if self.cache_models is not None:
+            return self.cache_models
+        return [self.queryset.model]
+
+    def get_cache_language(self, request):
+        return getattr(request, 'LANGUAGE_CODE', None) or translation.get_language()
+
+    def cached_response(self, handler, request, *args, **kwargs):
+        versions = get_catalog_versions(self.get_cache_models())
+        key = build_response_key(
+            request.path,
+            self.get_cache_language(request),
+            request.META.get('QUERY_STRING', ''),
+            *versions
+        )
+        etag = quote_etag(key.rsplit(':', 1)[-1])
+        last_modified = int(max(versions))
+
+        if self._is_not_modified(request, etag, last_modified):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            data = cache.get(key)
+            if data is None:
+                response = handler(request, *args, **kwargs)
+                if response.status_code != status.HTTP_200_OK:
+                    return response
+                cache.set(key, response.data, get_cache_timeout())
+            else:
+                response = Response(data)
+
+        response['ETag'] = f'W/{etag}'
+        response['Last-Modified'] = http_date(last_modified)
+        # Клиент обязан перепроверять ответ, но может использовать If-None-Match
+        patch_cache_control(response, max_age=0)
+        patch_vary_headers(response, ('Accept-Language',))
+        return response
+
+    def _is_not_modified(self, request, etag, last_modified):
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+        if if_none_match:
+            return etag_matches(if_none_match, etag)
+
+        if_modified_since = parse_http_date_safe(request.META.get('HTTP_IF_MODIFIED_SINCE', ''))
+        return if_modified_since is not None and last_modified <= if_modified_since
+
+
+class DeferTranslationsMixin:
+    """
+    При чтении не загружает из БД колонки переводимых полей на неиспользуемых языках
+    (например, about_tg для русскоязычного запроса). По умолчанию откладываются все поля модели,
+    зарегистрированные в modeltranslation; deferred_translation_fields ограничивает их список.
+    """
+    deferred_translation_fields = None
+
+    def get_translation_fields(self, model):
+        if self.deferred_translation_fields is not None:
+            return self.deferred_translation_fields
+        try:
+            return tuple(translator.get_options_for_model(model).get_field_names())
+        except NotRegistered:
+            return ()
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.request.method not in SAFE_METHODS:
+            return queryset
+        fields = self.get_translation_fields(queryset.model)
+        if not fields:
+            return queryset
+
+        language = get_context_language({'request': self.request})
+        deferred = []
+        for field_name in fields:
+            used = resolve_translation_attribute(queryset.model, field_name, language)
+            deferred.extend(
+                f'{field_name}_{code}' for code, _ in settings.LANGUAGES
+                if f'{field_name}_{code}' != used
+            )
+        return queryset.defer(*deferred)
@@ -1,28 +1,17 @@
-from django.utils import translation
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
 from a_base.models import Service, ServicePlace
 from a_base.serializers import ServiceSerializer
+from a_base.views.mixins import CachedCatalogMixin
 
 
-class ServiceViewSet(viewsets.ModelViewSet):
+class ServiceViewSet(CachedCatalogMixin, viewsets.ModelViewSet):
     queryset = Service.objects.all()
     serializer_class = ServiceSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    cache_models = [Service, ServicePlace]
 
-    def list(self, request, *args, **kwargs):
-        # Принудительно активируем язык из заголовка
-        self.activate_language_from_header(request)
-        return super().list(request, *args, **kwargs)
-    
-    def retrieve(self, request, *args, **kwargs):
-        self.activate_language_from_header(request)
-        return super().retrieve(request, *args, **kwargs)
-    
-    def activate_language_from_header(self, request):
-        lang = request.META.get('HTTP_ACCEPT_LANGUAGE', 'ru')
-        translation.activate(lang)
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -45,7 +34,6 @@ class ServiceViewSet(viewsets.ModelViewSet):
 
     def update(self, request, *args, **kwargs):
         """Обновление услуги с переводами"""
-        self.activate_language_from_header(request)
         partial = kwargs.pop('partial', False)
         instance = self.get_object()
         
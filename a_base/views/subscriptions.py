@@ -1,28 +1,20 @@
 from rest_framework import viewsets, status
-from django.utils import translation
 from a_base.permissions import ReadOnlyOrAdmin
 from rest_framework.response import Response
 from rest_framework.decorators import action
-from a_base.models import Subscription
+from a_base.models import Subscription, Advantage
 from a_base.serializers import SubscriptionSerializer
+from a_base.views.mixins import CachedCatalogMixin
 
-class SubscriptionViewSet(viewsets.ReadOnlyModelViewSet):
+class SubscriptionViewSet(CachedCatalogMixin, viewsets.ReadOnlyModelViewSet):
     """
     API для получения списка доступных подписок.
     """
     queryset = Subscription.objects.filter(is_active=True)
     serializer_class = SubscriptionSerializer
     permission_classes = [ReadOnlyOrAdmin]
+    cache_models = [Subscription, Advantage]
 
-    def list(self, request, *args, **kwargs):
-        # Принудительно активируем язык из заголовка
-        self.activate_language_from_header(request)
-        return super().list(request, *args, **kwargs)
-    
-    def retrieve(self, request, *args, **kwargs):
-        self.activate_language_from_header(request)
-        return super().retrieve(request, *args, **kwargs)
-    
     @action(detail=True, methods=['post'])
     def subscribe(self, request, pk=None):
         """Активация подписки для текущего пользователя"""
@@ -31,7 +23,3 @@ class SubscriptionViewSet(viewsets.ReadOnlyModelViewSet):
         request.user.activate_subscription()
         request.user.save()
         return Response({'status': 'subscription activated'}, status=status.HTTP_201_CREATED)
-    
-    def activate_language_from_header(self, request):
-        lang = request.META.get('HTTP_ACCEPT_LANGUAGE', 'ru')
-        translation.activate(lang)
\ No newline at end of file
@@ -1,28 +1,16 @@
-from django.utils import translation
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 from doctors.permissions import IsDoctorOrAdminOrReadOnly
 from a_base.models import University
 from a_base.serializers import UniversitySerializer
+from a_base.views.mixins import CachedCatalogMixin
 
 
-class UniversityViewSet(viewsets.ModelViewSet):
+class UniversityViewSet(CachedCatalogMixin, viewsets.ModelViewSet):
     queryset = University.objects.all()
     serializer_class = UniversitySerializer
     permission_classes = [IsDoctorOrAdminOrReadOnly]
 
-    def list(self, request, *args, **kwargs):
-        # Принудительно активируем язык из заголовка
-        self.activate_language_from_header(request)
-        return super().list(request, *args, **kwargs)
-    
-    def retrieve(self, request, *args, **kwargs):
-        self.activate_language_from_header(request)
-        return super().retrieve(request, *args, **kwargs)
-    
-    def activate_language_from_header(self, request):
-        lang = request.META.get('HTTP_ACCEPT_LANGUAGE', 'ru')
-        translation.activate(lang)
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -45,7 +33,6 @@ class UniversityViewSet(viewsets.ModelViewSet):
 
     def update(self, request, *args, **kwargs):
         """Обновление услуги с переводами"""
-        self.activate_language_from_header(request)
         partial = kwargs.pop('partial', False)
         instance = self.get_object()
         
@@ -1,5 +1,7 @@
 from django.contrib import admin
 from django.utils.translation import gettext_lazy as _
-from .models import Appointment
+from .models import Appointment, AppointmentReminder, WaitlistEntry
 
-admin.site.register(Appointment)
\ No newline at end of file
+admin.site.register(Appointment)
+admin.site.register(AppointmentReminder)
+admin.site.register(WaitlistEntry)
\ No newline at end of file
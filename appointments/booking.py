@@ -0,0 +1,143 @@
+"""
+Пакетное создание записей на прием: серии повторных приемов и импорт записей из систем клиник.
+
+Все слоты проверяются за один проход. Места работы врача с расписанием и исключениями, пациенты
+и занятые интервалы врача на затронутые даты загружаются пятью запросами, дальше проверка идет в памяти,
+включая пересечения слотов внутри пакета. Прошедшие проверку слоты создаются одним bulk_create, по остальным возвращаются ошибки
+с номером элемента запроса.
+"""
+from datetime import datetime, timedelta
+
+from django.db import transaction
+from django.db.models import Prefetch
+from django.utils import timezone
+
+from appointments.models import Appointment
+from appointments.stats import record_created
+from appointments.statuses import STATUS_UPCOMING, get_status_ids
+from doctors.availability import in_horizon, schedule_refresh
+from doctors.models import ScheduleException, Workplace
+from patients.models import Patient
+
+# Максимум слотов в одном запросе после разворачивания повторов
+MAX_BULK_SLOTS = 500
+
+
+def expand_item(index, item):
+    """Слоты элемента запроса: repeat_weeks приемов с шагом в неделю"""
+    fields = {key: value for key, value in item.items() if key != 'repeat_weeks'}
+    for week in range(item.get('repeat_weeks', 1)):
+        yield {**fields, 'index': index, 'appointment_date': item['appointment_date'] + timedelta(weeks=week)}
+
+
+def overlaps(start, end, intervals):
+    return any(busy_start < end and start < busy_end for busy_start, busy_end in intervals)
+
+
+def slot_errors(slot, workplaces, patients, busy, local_now):
+    """Проверяет слот и дополняет его местом работы и временем окончания. Возвращает {поле: [ошибки]}."""
+    if slot['patient'] not in patients:
+        return {'patient': ['Пациент не найден']}
+
+    workplace_id = slot.get('workplace')
+    if workplace_id is None and len(workplaces) == 1:
+        workplace_id = next(iter(workplaces))
+    workplace = workplaces.get(workplace_id)
+    if workplace is None:
+        return {'workplace': ['Укажите место работы врача' if workplace_id is None else 'Место работы врача не найдено']}
+
+    day, start_time = slot['appointment_date'], slot['start_time']
+    start = datetime.combine(day, start_time)
+    end_time = slot.get('end_time') or (start + timedelta(minutes=workplace.appointment_interval)).time()
+    if end_time <= start_time:
+        return {'end_time': ['Время окончания должно быть позже начала']}
+    if start <= local_now:
+        return {'appointment_date': ['Время приема уже прошло']}
+
+    intervals = workplace.working_intervals(day)
+    if not intervals:
+        return {'appointment_date': ['Нерабочий день врача']}
+    if not any(start <= start_time and end_time <= end for start, end in intervals):
+        hours = ', '.join(f'{start:%H:%M}-{end:%H:%M}' for start, end in intervals)
+        return {'start_time': [f'Прием вне рабочего времени {hours}']}
+    if overlaps(start_time, end_time, busy.get(day, ())):
+        return {'start_time': ['Время уже занято']}
+
+    slot.update(workplace=workplace_id, end_time=end_time)
+    return None
+
+
+def validate_slots(doctor_id, slots, now=None):
+    """Разделяет слоты на подходящие и ошибочные, слоты внутри пакета тоже не должны пересекаться"""
+    local_now = timezone.localtime(now or timezone.now()).replace(tzinfo=None)
+    days = {slot['appointment_date'] for slot in slots}
+    workplaces = {
+        workplace.id: workplace
+        for workplace in Workplace.objects.filter(doctor_id=doctor_id).prefetch_related(
+            'schedule',
+            Prefetch('schedule_exceptions', queryset=ScheduleException.objects.filter(
+                date_from__lte=max(days), date_to__gte=min(days)
+            )),
+        )
+    }
+    patients = dict(Patient.objects.filter(
+        id__in={slot['patient'] for slot in slots}
+    ).values_list('id', 'user__phone_number'))
+
+    busy = {}
+    for day, start_time, end_time in Appointment.objects.filter(
+        doctor_id=doctor_id, cancelled_at__isnull=True,
+        appointment_date__in=days,
+    ).values_list('appointment_date', 'start_time', 'end_time').order_by():
+        busy.setdefault(day, []).append((start_time, end_time))
+
+    valid, failed = [], []
+    for slot in slots:
+        errors = slot_errors(slot, workplaces, patients, busy, local_now)
+        if errors:
+            failed.append({
+                'index': slot['index'], 'appointment_date': slot['appointment_date'],
+                'start_time': slot['start_time'], 'errors': errors,
+            })
+            continue
+        busy.setdefault(slot['appointment_date'], []).append((slot['start_time'], slot['end_time']))
+        slot.setdefault('phone_number', patients[slot['patient']])
+        valid.append(slot)
+    return valid, failed
+
+
+def book_appointments(doctor_id, items, now=None):
+    """
+    Создает записи по проверенным элементам запроса (см. BulkAppointmentItemSerializer).
+    Возвращает (созданные записи с номерами элементов, ошибки). IntegrityError означает, что слот
+    заняли параллельно, пакет тогда не создается целиком.
+    """
+    slots = [slot for index, item in enumerate(items) for slot in expand_item(index, item)]
+    if not slots:
+        return [], []
+    valid, failed = validate_slots(doctor_id, slots, now)
+    if not valid:
+        return [], failed
+
+    status_id = get_status_ids(STATUS_UPCOMING)[STATUS_UPCOMING]
+    appointments = [
+        Appointment(
+            doctor_id=doctor_id,
+            patient_id=slot['patient'],
+            workplace_id=slot['workplace'],
+            appointment_date=slot['appointment_date'],
+            start_time=slot['start_time'],
+            end_time=slot['end_time'],
+            status_id=status_id,
+            phone_number=slot['phone_number'],
+            problem_description=slot.get('problem_description'),
+        )
+        for slot in valid
+    ]
+    with transaction.atomic():
+        Appointment.objects.bulk_create(appointments)
+        record_created(appointments)
+        # bulk_create не отправляет post_save, ближайший свободный слот врача пересчитывается явно
+        if any(in_horizon(appointment.appointment_date, now) for appointment in appointments):
+            schedule_refresh([doctor_id])
+    return [(slot['index'], appointment) for slot, appointment in zip(valid, appointments)], failed
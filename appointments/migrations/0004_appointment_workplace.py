@@ -0,0 +1,20 @@
+# Generated by Django 5.1.6 on 2026-10-19 18:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0003_alter_appointment_another_patient_gender_and_more'),
+        ('doctors', '0002_doctor_import_record'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='appointment',
+            name='workplace',
+            field=models.ForeignKey(blank=True, help_text='Клиника, в которой проходит прием', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='appointments', to='doctors.workplace', verbose_name='Место работы'),
+        ),
+    ]
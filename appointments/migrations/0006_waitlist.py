@@ -0,0 +1,80 @@
+# Generated by Django 5.1.6 on 2026-10-19 18:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('a_base', '0004_alter_appointmentstatus_options_and_more'),
+        ('appointments', '0005_appointment_reminders'),
+        ('doctors', '0002_doctor_import_record'),
+        ('patients', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WaitlistEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='Дата приема')),
+                ('earliest_time', models.TimeField(blank=True, help_text='Самое раннее подходящее время начала приема', null=True, verbose_name='Не раньше')),
+                ('latest_time', models.TimeField(blank=True, help_text='Самое позднее подходящее время окончания приема', null=True, verbose_name='Не позже')),
+                ('status', models.CharField(choices=[('waiting', 'Ожидает'), ('offered', 'Предложен слот'), ('booked', 'Записан'), ('expired', 'Предложение не принято'), ('cancelled', 'Отменено пациентом')], default='waiting', max_length=10, verbose_name='Статус')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Дата создания')),
+                ('offer_start_time', models.TimeField(blank=True, null=True, verbose_name='Начало предложенного слота')),
+                ('offer_end_time', models.TimeField(blank=True, null=True, verbose_name='Окончание предложенного слота')),
+                ('offer_expires_at', models.DateTimeField(blank=True, null=True, verbose_name='Предложение действует до')),
+            ],
+            options={
+                'verbose_name': 'Запись в листе ожидания',
+                'verbose_name_plural': 'Лист ожидания',
+                'ordering': ['created_at', 'id'],
+            },
+        ),
+        migrations.RemoveConstraint(
+            model_name='appointment',
+            name='unique_doctor_time_slot',
+        ),
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['doctor', 'appointment_date', 'start_time'], name='appointment_doctor_time_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='appointment',
+            constraint=models.UniqueConstraint(condition=models.Q(('cancelled_at__isnull', True)), fields=('doctor', 'appointment_date', 'start_time'), name='unique_doctor_time_slot'),
+        ),
+        migrations.AddField(
+            model_name='waitlistentry',
+            name='appointment',
+            field=models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='waitlist_entry', to='appointments.appointment', verbose_name='Созданная запись'),
+        ),
+        migrations.AddField(
+            model_name='waitlistentry',
+            name='doctor',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='waitlist_entries', to='doctors.doctor', verbose_name='Врач'),
+        ),
+        migrations.AddField(
+            model_name='waitlistentry',
+            name='offer_workplace',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='doctors.workplace', verbose_name='Место работы предложенного слота'),
+        ),
+        migrations.AddField(
+            model_name='waitlistentry',
+            name='patient',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='waitlist_entries', to='patients.patient', verbose_name='Пациент'),
+        ),
+        migrations.AddIndex(
+            model_name='waitlistentry',
+            index=models.Index(fields=['doctor', 'date', 'status', 'created_at'], name='waitlist_match_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='waitlistentry',
+            index=models.Index(fields=['status', 'offer_expires_at'], name='waitlist_offer_expiry_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='waitlistentry',
+            constraint=models.UniqueConstraint(condition=models.Q(('status__in', ['waiting', 'offered'])), fields=('patient', 'doctor', 'date'), name='unique_active_waitlist_entry'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.1.6 on 2026-10-19 19:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('a_base', '0004_alter_appointmentstatus_options_and_more'),
+        ('appointments', '0006_waitlist'),
+        ('clinics', '0001_initial'),
+        ('doctors', '0002_doctor_import_record'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AppointmentDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='Дата приема')),
+                ('count', models.IntegerField(default=0, verbose_name='Количество записей')),
+                ('cancellation_reason', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='a_base.cancelreason', verbose_name='Причина отмены')),
+                ('clinic', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='clinics.clinic', verbose_name='Клиника')),
+                ('district', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='a_base.district', verbose_name='Район')),
+                ('doctor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='doctors.doctor', verbose_name='Врач')),
+                ('status', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='a_base.appointmentstatus', verbose_name='Статус')),
+            ],
+            options={
+                'verbose_name': 'Статистика записей за день',
+                'verbose_name_plural': 'Статистика записей по дням',
+                'indexes': [models.Index(fields=['date', 'doctor'], name='appointment_stats_doctor_idx'), models.Index(fields=['date', 'clinic'], name='appointment_stats_clinic_idx'), models.Index(fields=['date', 'district'], name='appointment_stats_district_idx')],
+            },
+        ),
+    ]
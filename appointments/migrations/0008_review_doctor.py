@@ -0,0 +1,39 @@
+# Generated by Django 5.1.6 on 2026-10-19 19:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def fill_review_doctor(apps, schema_editor):
+    Appointment = apps.get_model('appointments', 'Appointment')
+    Review = apps.get_model('appointments', 'Review')
+    Review.objects.update(
+        doctor_id=Subquery(Appointment.objects.filter(pk=OuterRef('appointment_id')).values('doctor_id')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0007_appointment_daily_stats'),
+        ('doctors', '0002_doctor_import_record'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='review',
+            name='doctor',
+            field=models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='reviews', to='doctors.doctor', verbose_name='Врач'),
+        ),
+        migrations.RunPython(fill_review_doctor, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='review',
+            name='doctor',
+            field=models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='reviews', to='doctors.doctor', verbose_name='Врач'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['doctor', 'is_published', 'created_at', 'id'], name='review_doctor_feed_idx'),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.1.6 on 2026-10-19 21:10
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def fill_reminder_time(apps, schema_editor):
+    Appointment = apps.get_model('appointments', 'Appointment')
+    AppointmentReminder = apps.get_model('appointments', 'AppointmentReminder')
+    appointment = Appointment.objects.filter(pk=OuterRef('appointment_id'))
+    AppointmentReminder.objects.update(
+        appointment_date=Subquery(appointment.values('appointment_date')[:1]),
+        start_time=Subquery(appointment.values('start_time')[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0008_review_doctor'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='appointmentreminder',
+            name='unique_appointment_reminder',
+        ),
+        migrations.AddField(
+            model_name='appointmentreminder',
+            name='appointment_date',
+            field=models.DateField(null=True, verbose_name='Дата приема'),
+        ),
+        migrations.AddField(
+            model_name='appointmentreminder',
+            name='start_time',
+            field=models.TimeField(null=True, verbose_name='Время начала приема'),
+        ),
+        migrations.RunPython(fill_reminder_time, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='appointmentreminder',
+            name='appointment_date',
+            field=models.DateField(verbose_name='Дата приема'),
+        ),
+        migrations.AlterField(
+            model_name='appointmentreminder',
+            name='start_time',
+            field=models.TimeField(verbose_name='Время начала приема'),
+        ),
+        migrations.AlterField(
+            model_name='appointmentreminder',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Ожидает отправки'), ('sending', 'Отправляется'), ('sent', 'Отправлено'), ('failed', 'Ошибка'), ('skipped', 'Не отправлено: запись отменена или перенесена')], default='pending', max_length=8, verbose_name='Статус'),
+        ),
+        migrations.AddConstraint(
+            model_name='appointmentreminder',
+            constraint=models.UniqueConstraint(fields=('appointment', 'window', 'channel', 'appointment_date', 'start_time'), name='unique_appointment_reminder'),
+        ),
+    ]
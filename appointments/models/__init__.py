@@ -1,2 +1,5 @@
 from .appointments import Appointment
-from .review import Review
\ No newline at end of file
+from .reminders import AppointmentReminder
+from .review import Review
+from .waitlist import WaitlistEntry
+from .stats import AppointmentDailyStats
\ No newline at end of file
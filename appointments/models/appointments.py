@@ -1,10 +1,11 @@
-from django.db import models
+from django.db import models, transaction
 from django.core.validators import MinValueValidator, MaxValueValidator, RegexValidator
 from django.utils.translation import gettext_lazy as _
 from django.utils import timezone
 from a_base.models import AppointmentStatus, Gender, CancelReason
 from patients.models import Patient
-from doctors.models import Doctor
+from doctors.models import Doctor, Workplace
+from appointments.signals import send_status_changed
  
 class Appointment(models.Model):
     """Модель записи на прием к врачу с встроенным временем приема."""
@@ -24,6 +25,16 @@ class Appointment(models.Model):
         related_name="appointments"
     )
 
+    workplace = models.ForeignKey(
+        Workplace,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        verbose_name="Место работы",
+        related_name="appointments",
+        help_text="Клиника, в которой проходит прием"
+    )
+
     # Время приема
     appointment_date = models.DateField(
         verbose_name="Дата приема",
@@ -134,11 +145,31 @@ class Appointment(models.Model):
         verbose_name_plural = "Записи на прием"
         ordering = ['appointment_date', 'start_time']
         constraints = [
+            # Отмененная запись (cancelled_at заполнен) не занимает слот, его можно занять повторно
             models.UniqueConstraint(
                 fields=['doctor', 'appointment_date', 'start_time'],
+                condition=models.Q(cancelled_at__isnull=True),
                 name='unique_doctor_time_slot'
             )
         ]
+        indexes = [
+            # Расписание врача (уникальный индекс частичный и подходит не для всех запросов)
+            models.Index(fields=['doctor', 'appointment_date', 'start_time'], name='appointment_doctor_time_idx'),
+            # Поиск предстоящих записей в окне времени для напоминаний (см. appointments.reminders)
+            models.Index(fields=['appointment_date', 'start_time', 'status'], name='appointment_time_status_idx'),
+        ]
+
+    # Поля записи, по которым ведется дневная статистика (см. appointments.stats)
+    STATS_FIELDS = ('appointment_date', 'doctor_id', 'workplace_id', 'status_id', 'cancellation_reason_id')
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Запоминает значения полей статистики на момент загрузки, чтобы при сохранении учесть изменение"""
+        instance = super().from_db(db, field_names, values)
+        loaded = dict(zip(field_names, values))
+        if all(field in loaded for field in cls.STATS_FIELDS):
+            instance._stats_key = tuple(loaded[field] for field in cls.STATS_FIELDS)
+        return instance
 
     def __str__(self):
         patient_name = self.another_patient_name if self.is_another_patient else self.patient.user.get_full_name
@@ -168,16 +199,25 @@ class Appointment(models.Model):
         if self.status == AppointmentStatus.objects.get(name_ru="Отменен"):
             raise ValueError("Запись уже отменена")
             
+        previous_status_id = self.status_id
         self.status = AppointmentStatus.objects.get(name_ru="Отменен")
         self.cancellation_reason = reason
         self.cancellation_notes = notes
         self.cancelled_at = timezone.now()
         self.save()
+        self._status_changed(previous_status_id)
 
     def complete(self):
         """Метод для отметки о завершении приема."""
+        previous_status_id = self.status_id
         self.status = AppointmentStatus.objects.get(name_ru="Завершен")
         self.save()
+        self._status_changed(previous_status_id)
+
+    def _status_changed(self, previous_status_id):
+        """Сообщает подписчикам appointments_status_changed о смене статуса после фиксации транзакции"""
+        if previous_status_id != self.status_id:
+            transaction.on_commit(lambda: send_status_changed([self.pk], previous_status_id, self.status_id))
 
     def reschedule(self, new_date, new_start, new_end):
         """Метод для переноса записи."""
@@ -188,9 +228,13 @@ class Appointment(models.Model):
 
     @property
     def is_upcoming(self):
-        """Проверяет, является ли запись предстоящей."""
+        """
+        Проверяет, является ли запись предстоящей.
+        Прошедшие записи переводятся в другой статус задачей expire_appointments (appointments.transitions),
+        поэтому достаточно сохраненного статуса; время проверяется на случай, если задача еще не отработала.
+        """
         now = timezone.now()
         appointment_datetime = timezone.make_aware(
             timezone.datetime.combine(self.appointment_date, self.start_time)
         )
-        return self.status == AppointmentStatus.objects.get(name_ru="Предстоящий") and appointment_datetime > now
\ No newline at end of file
+        return self.status.name_ru == "Предстоящий" and appointment_datetime > now
\ No newline at end of file
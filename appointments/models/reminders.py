@@ -0,0 +1,64 @@
+from django.db import models
+
+
+class AppointmentReminder(models.Model):
+    """
+    Напоминание пациенту о предстоящем приеме.
+    Запись создается до отправки и уникальна для (запись на прием, окно, канал, дата и время приема),
+    поэтому после перезапуска планировщика напоминание не отправляется повторно.
+    Дата и время приема запоминаются при планировании: если запись перенесли или отменили,
+    напоминание не отправляется, а для нового времени планируется новое.
+    """
+
+    class Window(models.TextChoices):
+        DAY = '24h', 'За 24 часа'
+        HOURS = '2h', 'За 2 часа'
+
+    class Channel(models.TextChoices):
+        PUSH = 'push', 'Push'
+        SMS = 'sms', 'SMS'
+        EMAIL = 'email', 'Email'
+
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'Ожидает отправки'
+        SENDING = 'sending', 'Отправляется'
+        SENT = 'sent', 'Отправлено'
+        FAILED = 'failed', 'Ошибка'
+        SKIPPED = 'skipped', 'Не отправлено: запись отменена или перенесена'
+
+    appointment = models.ForeignKey(
+        'Appointment',
+        on_delete=models.CASCADE,
+        related_name='reminders',
+        verbose_name='Запись на прием'
+    )
+    window = models.CharField(max_length=8, choices=Window.choices, verbose_name='Окно напоминания')
+    channel = models.CharField(max_length=8, choices=Channel.choices, verbose_name='Канал')
+    appointment_date = models.DateField(verbose_name='Дата приема')
+    start_time = models.TimeField(verbose_name='Время начала приема')
+    status = models.CharField(
+        max_length=8,
+        choices=Status.choices,
+        default=Status.PENDING,
+        verbose_name='Статус'
+    )
+    error = models.TextField(blank=True, default='', verbose_name='Ошибка отправки')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='Дата создания')
+    sent_at = models.DateTimeField(null=True, blank=True, verbose_name='Дата отправки')
+
+    class Meta:
+        verbose_name = 'Напоминание о приеме'
+        verbose_name_plural = 'Напоминания о приеме'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['appointment', 'window', 'channel', 'appointment_date', 'start_time'],
+                name='unique_appointment_reminder'
+            )
+        ]
+        indexes = [
+            # Очередь отправки: ожидающие напоминания в порядке создания
+            models.Index(fields=['status', 'id'], name='appointment_reminder_queue'),
+        ]
+
+    def __str__(self):
+        return f"Напоминание {self.window} ({self.channel}) к записи {self.appointment_id}: {self.status}"
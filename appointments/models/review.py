@@ -13,6 +13,15 @@ class Review(models.Model):
         verbose_name=_('Запись на прием'),
         help_text=_('Запись на прием, к которой относится отзыв')
     )
+
+    # Копия appointment.doctor: лента и рейтинг врача читаются по индексу без соединения с записями
+    doctor = models.ForeignKey(
+        'doctors.Doctor',
+        on_delete=models.CASCADE,
+        related_name='reviews',
+        verbose_name=_('Врач'),
+        editable=False
+    )
     
     RATING_CHOICES = [
         (1, '1 - Очень плохо'),
@@ -59,6 +68,15 @@ class Review(models.Model):
         verbose_name = _('Отзыв')
         verbose_name_plural = _('Отзывы')
         ordering = ['-created_at']
+        indexes = [
+            # Лента опубликованных отзывов врача (см. appointments.reviews) и рейтинг врача
+            models.Index(fields=['doctor', 'is_published', 'created_at', 'id'], name='review_doctor_feed_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        if self.doctor_id is None:
+            self.doctor_id = self.appointment.doctor_id
+        super().save(*args, **kwargs)
     
     def __str__(self):
         return f"Отзыв {self.id} к записи {self.appointment.id} ({self.rating}/5)"
\ No newline at end of file
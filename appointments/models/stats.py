@@ -0,0 +1,56 @@
+from django.db import models
+
+from a_base.models import AppointmentStatus, CancelReason, District
+from clinics.models import Clinic
+from doctors.models import Doctor
+
+
+class AppointmentDailyStats(models.Model):
+    """
+    Количество записей на прием за день в разрезе врача, клиники, района, статуса и причины отмены.
+    Ведется инкрементально при изменении записей (см. appointments.stats), аналитика читает только эту таблицу.
+    Уникального ограничения нет: ключ содержит NULL (запись без места работы, без причины отмены),
+    поэтому строки с одинаковым ключом допустимы, а чтения суммируют count.
+    """
+
+    date = models.DateField(verbose_name='Дата приема')
+    doctor = models.ForeignKey(Doctor, on_delete=models.CASCADE, related_name='+', verbose_name='Врач')
+    clinic = models.ForeignKey(
+        Clinic,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name='Клиника'
+    )
+    district = models.ForeignKey(
+        District,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name='Район'
+    )
+    status = models.ForeignKey(AppointmentStatus, on_delete=models.CASCADE, related_name='+', verbose_name='Статус')
+    cancellation_reason = models.ForeignKey(
+        CancelReason,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name='Причина отмены'
+    )
+    count = models.IntegerField(default=0, verbose_name='Количество записей')
+
+    class Meta:
+        verbose_name = 'Статистика записей за день'
+        verbose_name_plural = 'Статистика записей по дням'
+        indexes = [
+            # Срезы по периоду: врач (и обновление строки по ключу), клиника, район
+            models.Index(fields=['date', 'doctor'], name='appointment_stats_doctor_idx'),
+            models.Index(fields=['date', 'clinic'], name='appointment_stats_clinic_idx'),
+            models.Index(fields=['date', 'district'], name='appointment_stats_district_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.date} врач {self.doctor_id}, статус {self.status_id}: {self.count}'
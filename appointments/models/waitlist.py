@@ -0,0 +1,96 @@
+from django.db import models
+from django.db.models import Q
+
+from doctors.models import Doctor, Workplace
+from patients.models import Patient
+
+
+class WaitlistEntry(models.Model):
+    """
+    Пациент в листе ожидания к врачу на конкретную дату.
+    Освободившийся слот предлагается записям по порядку создания, каждой - на время удержания
+    (см. appointments.waitlist). Поля offer_* описывают слот, предложенный записи в статусе offered.
+    """
+
+    class Status(models.TextChoices):
+        WAITING = 'waiting', 'Ожидает'
+        OFFERED = 'offered', 'Предложен слот'
+        BOOKED = 'booked', 'Записан'
+        EXPIRED = 'expired', 'Предложение не принято'
+        CANCELLED = 'cancelled', 'Отменено пациентом'
+
+    ACTIVE_STATUSES = (Status.WAITING, Status.OFFERED)
+
+    doctor = models.ForeignKey(
+        Doctor,
+        on_delete=models.CASCADE,
+        related_name='waitlist_entries',
+        verbose_name='Врач'
+    )
+    patient = models.ForeignKey(
+        Patient,
+        on_delete=models.CASCADE,
+        related_name='waitlist_entries',
+        verbose_name='Пациент'
+    )
+    date = models.DateField(verbose_name='Дата приема')
+    earliest_time = models.TimeField(
+        null=True,
+        blank=True,
+        verbose_name='Не раньше',
+        help_text='Самое раннее подходящее время начала приема'
+    )
+    latest_time = models.TimeField(
+        null=True,
+        blank=True,
+        verbose_name='Не позже',
+        help_text='Самое позднее подходящее время окончания приема'
+    )
+    status = models.CharField(
+        max_length=10,
+        choices=Status.choices,
+        default=Status.WAITING,
+        verbose_name='Статус'
+    )
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='Дата создания')
+
+    offer_start_time = models.TimeField(null=True, blank=True, verbose_name='Начало предложенного слота')
+    offer_end_time = models.TimeField(null=True, blank=True, verbose_name='Окончание предложенного слота')
+    offer_workplace = models.ForeignKey(
+        Workplace,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name='Место работы предложенного слота'
+    )
+    offer_expires_at = models.DateTimeField(null=True, blank=True, verbose_name='Предложение действует до')
+    appointment = models.OneToOneField(
+        'Appointment',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='waitlist_entry',
+        verbose_name='Созданная запись'
+    )
+
+    class Meta:
+        verbose_name = 'Запись в листе ожидания'
+        verbose_name_plural = 'Лист ожидания'
+        ordering = ['created_at', 'id']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['patient', 'doctor', 'date'],
+                condition=Q(status__in=['waiting', 'offered']),
+                name='unique_active_waitlist_entry'
+            )
+        ]
+        indexes = [
+            # Поиск следующего ожидающего пациента для освободившегося слота
+            models.Index(fields=['doctor', 'date', 'status', 'created_at'], name='waitlist_match_idx'),
+            # Истекшие предложения
+            models.Index(fields=['status', 'offer_expires_at'], name='waitlist_offer_expiry_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.patient} -> {self.doctor} на {self.date}: {self.status}"
@@ -17,4 +17,4 @@ class IsAdminOrPatientOwner(permissions.BasePermission):
         if request.user.is_staff:
             return True
         # Пациенты могут видеть только свои записи
-        return obj.patient == request.user
\ No newline at end of file
+        return obj.patient.user_id == request.user.id
\ No newline at end of file
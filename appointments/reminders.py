@@ -0,0 +1,262 @@
+"""
+Планировщик напоминаний о предстоящих приемах.
+
+Цикл работы (ReminderScheduler.run_once):
+1. enqueue - для каждого окна (24h, 2h) находит предстоящие записи, начало которых попадает в окно,
+   и создает строки AppointmentReminder со статусом pending. Поиск идет по индексу
+   (appointment_date, start_time, status), уже запланированные напоминания исключаются подзапросом.
+   Напоминание запоминает дату и время приема: после переноса записи планируется новое.
+2. deliver - забирает pending-напоминания пачками, переводит их в sending и только потом отправляет.
+   Напоминание, отправка которого прервалась перезапуском, остается в sending и повторно не отправляется.
+   Напоминания об отмененных и перенесенных записях не отправляются и получают статус skipped.
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+
+from appointments.models import Appointment, AppointmentReminder
+from appointments.statuses import STATUS_UPCOMING, get_status_ids
+
+logger = logging.getLogger(__name__)
+
+# Окно: (минимальное, максимальное) время до начала приема.
+# Запись, созданная за час до приема, получает только напоминание за 2 часа.
+REMINDER_WINDOWS = {
+    AppointmentReminder.Window.DAY: (timedelta(hours=2), timedelta(hours=24)),
+    AppointmentReminder.Window.HOURS: (timedelta(0), timedelta(hours=2)),
+}
+DEFAULT_BATCH_SIZE = 500
+
+
+def get_reminder_channels():
+    return getattr(settings, 'APPOINTMENT_REMINDER_CHANNELS', (AppointmentReminder.Channel.PUSH,))
+
+
+def time_range_q(start, end):
+    """
+    Условие "начало приема в [start, end]" по отдельным полям даты и времени.
+    Сравнения идут по префиксу индекса (appointment_date, start_time), без вычислений над колонками.
+    """
+    if start.date() == end.date():
+        return Q(appointment_date=start.date(), start_time__gte=start.time(), start_time__lte=end.time())
+    return (
+        Q(appointment_date=start.date(), start_time__gte=start.time())
+        | Q(appointment_date__gt=start.date(), appointment_date__lt=end.date())
+        | Q(appointment_date=end.date(), start_time__lte=end.time())
+    )
+
+
+def reminder_text(appointment):
+    return (
+        f'Напоминание: прием у врача {appointment.doctor.user.get_full_name} '
+        f'{appointment.appointment_date:%d.%m.%Y} в {appointment.start_time:%H:%M}'
+    )
+
+
+def send_push(reminders):
+    """Push через Firebase: одно сообщение на каждое активное устройство пациента, пачкой до 500 сообщений"""
+    from fcm_django.models import FCMDevice
+    from firebase_admin import messaging
+
+    user_ids = {reminder.appointment.patient.user_id for reminder in reminders}
+    devices = {}
+    for user_id, token in FCMDevice.objects.filter(user_id__in=user_ids, active=True).values_list(
+            'user_id', 'registration_id'):
+        devices.setdefault(user_id, []).append(token)
+
+    errors = {}
+    messages, owners = [], []
+    for reminder in reminders:
+        tokens = devices.get(reminder.appointment.patient.user_id)
+        if not tokens:
+            errors[reminder.id] = 'Нет зарегистрированных устройств'
+            continue
+        for token in tokens:
+            messages.append(messaging.Message(
+                notification=messaging.Notification(title='Напоминание о приеме', body=reminder_text(reminder.appointment)),
+                token=token,
+            ))
+            owners.append(reminder.id)
+
+    for start in range(0, len(messages), 500):
+        response = messaging.send_each(messages[start:start + 500])
+        for owner, result in zip(owners[start:start + 500], response.responses):
+            if not result.success:
+                errors.setdefault(owner, str(result.exception))
+    return errors
+
+
+def send_sms(reminders):
+    from notifications.services import send_sms_aero
+
+    errors = {}
+    for reminder in reminders:
+        try:
+            send_sms_aero(reminder.appointment.phone_number, reminder_text(reminder.appointment))
+        except Exception as e:
+            errors[reminder.id] = str(e)
+    return errors
+
+
+def send_email(reminders):
+    from notifications.services import send_email as send
+
+    errors = {}
+    for reminder in reminders:
+        email = reminder.appointment.patient.user.email
+        if not email:
+            errors[reminder.id] = 'У пациента не указан email'
+        elif not send(email, 'Напоминание о приеме', reminder_text(reminder.appointment)):
+            errors[reminder.id] = 'Не удалось отправить email'
+    return errors
+
+
+# Канал -> функция, которая отправляет пачку напоминаний и возвращает {id напоминания: ошибка}
+SENDERS = {
+    AppointmentReminder.Channel.PUSH: send_push,
+    AppointmentReminder.Channel.SMS: send_sms,
+    AppointmentReminder.Channel.EMAIL: send_email,
+}
+
+
+class ReminderScheduler:
+    def __init__(self, channels=None, senders=None, batch_size=DEFAULT_BATCH_SIZE, stdout=None):
+        self.channels = list(channels or get_reminder_channels())
+        self.senders = senders or SENDERS
+        self.batch_size = batch_size
+        self.stdout = stdout
+
+    def log(self, message):
+        if self.stdout:
+            self.stdout.write(message)
+
+    def due_appointments(self, window, now):
+        """Предстоящие записи, которые попадают в окно и еще не получили напоминание этого окна"""
+        lower, upper = REMINDER_WINDOWS[window]
+        # Дата и время приема хранятся в местном времени (TIME_ZONE)
+        local_now = timezone.localtime(now).replace(tzinfo=None)
+        return Appointment.objects.filter(
+            time_range_q(local_now + lower, local_now + upper),
+            status_id=self.upcoming_status_id,
+        ).exclude(
+            Exists(AppointmentReminder.objects.filter(
+                appointment=OuterRef('pk'), window=window,
+                appointment_date=OuterRef('appointment_date'), start_time=OuterRef('start_time'),
+            ))
+        )
+
+    def enqueue(self, now=None):
+        """Создает pending-напоминания по всем окнам, возвращает количество переданных в очередь"""
+        now = now or timezone.now()
+        # Статус ищется один раз, чтобы запрос по записям использовал индекс целиком, без соединения
+        self.upcoming_status_id = get_status_ids(STATUS_UPCOMING).get(STATUS_UPCOMING)
+        if self.upcoming_status_id is None or not self.channels:
+            return 0
+        created = 0
+        for window in REMINDER_WINDOWS:
+            # Каждая пачка исключает записи, для которых напоминания уже созданы, поэтому выборка сдвигается сама
+            while appointments := list(self.due_appointments(window, now).values_list(
+                    'id', 'appointment_date', 'start_time')[:self.batch_size]):
+                created += self.create_reminders(window, appointments)
+        return created
+
+    def create_reminders(self, window, appointments):
+        """
+        Создает напоминания окна для записей [(id, дата, время начала)], возвращает количество созданных.
+        Записи блокируются, и только после этого проверяется, какие напоминания уже есть: пачку мог
+        запланировать другой процесс, пока шел поиск. Такие напоминания не создаются и не учитываются.
+        """
+        ids = [appointment_id for appointment_id, _, _ in appointments]
+        with transaction.atomic():
+            list(Appointment.objects.select_for_update().filter(id__in=ids).values_list('id', flat=True))
+            existing = set(AppointmentReminder.objects.filter(appointment_id__in=ids, window=window).values_list(
+                'appointment_id', 'channel', 'appointment_date', 'start_time'
+            ))
+            reminders = [
+                AppointmentReminder(appointment_id=appointment_id, window=window, channel=channel,
+                                    appointment_date=day, start_time=start_time)
+                for appointment_id, day, start_time in appointments
+                for channel in self.channels
+                if (appointment_id, channel, day, start_time) not in existing
+            ]
+            AppointmentReminder.objects.bulk_create(reminders)
+        return len(reminders)
+
+    def claim(self):
+        """Переводит очередную пачку pending-напоминаний в sending и возвращает их вместе со связями"""
+        with transaction.atomic():
+            queryset = AppointmentReminder.objects.filter(
+                status=AppointmentReminder.Status.PENDING
+            ).order_by('id')
+            if connection.features.has_select_for_update_skip_locked:
+                # Несколько процессов планировщика не забирают одни и те же строки
+                queryset = queryset.select_for_update(skip_locked=True)
+            ids = list(queryset.values_list('id', flat=True)[:self.batch_size])
+            AppointmentReminder.objects.filter(id__in=ids).update(status=AppointmentReminder.Status.SENDING)
+
+        return list(AppointmentReminder.objects.filter(id__in=ids).select_related(
+            'appointment__patient__user', 'appointment__doctor__user'
+        ).order_by('id'))
+
+    def is_current(self, reminder):
+        """Запись все еще предстоит и не перенесена с тех пор, как напоминание было запланировано"""
+        appointment = reminder.appointment
+        return (
+            appointment.status_id == self.upcoming_status_id
+            and appointment.cancelled_at is None
+            and (appointment.appointment_date, appointment.start_time) == (reminder.appointment_date, reminder.start_time)
+        )
+
+    def deliver(self):
+        """Отправляет все pending-напоминания пачками, возвращает (отправлено, ошибок, пропущено)"""
+        self.upcoming_status_id = get_status_ids(STATUS_UPCOMING).get(STATUS_UPCOMING)
+        sent = failed = skipped = 0
+        while claimed := self.claim():
+            reminders, stale = [], []
+            for reminder in claimed:
+                (reminders if self.is_current(reminder) else stale).append(reminder)
+            for reminder in stale:
+                reminder.status = AppointmentReminder.Status.SKIPPED
+            AppointmentReminder.objects.bulk_update(stale, ['status'])
+            skipped += len(stale)
+
+            by_channel = {}
+            for reminder in reminders:
+                by_channel.setdefault(reminder.channel, []).append(reminder)
+
+            errors = {}
+            for channel, items in by_channel.items():
+                sender = self.senders.get(channel)
+                if sender is None:
+                    errors.update((reminder.id, f'Канал {channel} не поддерживается') for reminder in items)
+                    continue
+                try:
+                    errors.update(sender(items))
+                except Exception as e:
+                    logger.exception('Ошибка отправки напоминаний через %s', channel)
+                    errors.update((reminder.id, str(e)) for reminder in items)
+
+            now = timezone.now()
+            for reminder in reminders:
+                if reminder.id in errors:
+                    reminder.status = AppointmentReminder.Status.FAILED
+                    reminder.error = errors[reminder.id] or 'Ошибка отправки'
+                else:
+                    reminder.status = AppointmentReminder.Status.SENT
+                    reminder.sent_at = now
+            AppointmentReminder.objects.bulk_update(reminders, ['status', 'error', 'sent_at'])
+
+            failed += len(errors)
+            sent += len(reminders) - len(errors)
+            self.log(f'Напоминания: отправлено {len(reminders) - len(errors)}, ошибок {len(errors)}, '
+                     f'пропущено {len(stale)}')
+        return sent, failed, skipped
+
+    def run_once(self, now=None):
+        queued = self.enqueue(now)
+        sent, failed, skipped = self.deliver()
+        return {'queued': queued, 'sent': sent, 'failed': failed, 'skipped': skipped}
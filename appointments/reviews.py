@@ -0,0 +1,37 @@
+"""
+Лента опубликованных отзывов врача.
+
+Лента читается по индексу (doctor, is_published, created_at, id) с keyset-пагинацией по (created_at, id),
+поэтому каждая страница - один проход по индексу независимо от ее номера.
+Первая страница (профиль врача открывают чаще всего) кэшируется отдельно для каждого врача.
+Кэш сбрасывается сдвигом версии ленты врача при сохранении или удалении его отзывов.
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from a_base.cache import build_response_key, bump_version, get_version
+from appointments.models import Review
+
+FEED_VERSION_PREFIX = 'review_feed_version'
+
+
+def _feed_version_key(doctor_id):
+    return f'{FEED_VERSION_PREFIX}:{doctor_id}'
+
+
+def feed_cache_key(doctor_id, *parts):
+    """Ключ кэша первой страницы ленты врача для текущей версии ленты"""
+    return build_response_key('review_feed', doctor_id, get_version(_feed_version_key(doctor_id)), *parts)
+
+
+def invalidate_feed(doctor_id):
+    bump_version(_feed_version_key(doctor_id))
+
+
+@receiver(post_save, sender=Review, dispatch_uid='review_feed_save')
+@receiver(post_delete, sender=Review, dispatch_uid='review_feed_delete')
+def invalidate_doctor_feed(sender, instance, **kwargs):
+    # После фиксации: иначе параллельный запрос может закэшировать ленту без нового отзыва
+    doctor_id = instance.doctor_id
+    transaction.on_commit(lambda: invalidate_feed(doctor_id))
@@ -1,7 +1,14 @@
+from django.utils import timezone
 from rest_framework import serializers
-from .models import Appointment, Review
-from patients.serializers import PatientPublicSerializer
-from doctors.serializers import DoctorSerializer
+from .models import Appointment, Review, WaitlistEntry
+from a_base.models import CancelReason
+from patients.serializers import PatientPublicSerializer, PatientCardSerializer
+from doctors.serializers import DoctorSerializer, DoctorCardSerializer
+from a_base.serializers import AppointmentStatusSerializer, CancelReasonSerializer
+from a_base.serializers.mixins import SparseFieldsetMixin
+from appointments.statuses import STATUS_COMPLETED
+from clinics.serializers import ClinicShortSerializer
+from doctors.models import Workplace
 
 class AppointmentSerializer(serializers.ModelSerializer):
     patient = PatientPublicSerializer()
@@ -12,3 +19,146 @@ class AppointmentSerializer(serializers.ModelSerializer):
                   'cancellation_reason', 'cancellation_notes', 'cancelled_at', 'phone_number',
                   'is_another_patient', 'another_patient_name', 'another_patient_age', 
                   'another_patient_gender', 'problem_description']
+        # Отмена только через action cancel: Appointment.cancel() освобождает слот для листа ожидания
+        read_only_fields = ['status', 'cancelled_at']
+
+
+class AppointmentCancelSerializer(serializers.Serializer):
+    reason = serializers.PrimaryKeyRelatedField(queryset=CancelReason.objects.all())
+    notes = serializers.CharField(max_length=1000, required=False, allow_blank=True)
+
+    def validate(self, attrs):
+        if attrs['reason'].name_ru == 'Другое' and not attrs.get('notes'):
+            raise serializers.ValidationError({'notes': "Укажите детали причины при выборе 'Другое'"})
+        return attrs
+
+
+class SchedulePatientSerializer(serializers.Serializer):
+    """Пациент в расписании врача: только имя и телефон"""
+    id = serializers.IntegerField()
+    name = serializers.CharField(source='user.get_full_name')
+    phone_number = serializers.CharField(source='user.phone_number')
+
+
+class ScheduleWorkplaceSerializer(serializers.ModelSerializer):
+    clinic = ClinicShortSerializer()
+
+    class Meta:
+        model = Workplace
+        fields = ['id', 'clinic', 'position']
+
+
+class ScheduleAppointmentSerializer(serializers.ModelSerializer):
+    """
+    Запись в расписании врача. Ожидает select_related('status', 'patient__user'),
+    см. AppointmentViewSet.schedule.
+    """
+    status = AppointmentStatusSerializer()
+    patient = SchedulePatientSerializer()
+
+    class Meta:
+        model = Appointment
+        fields = ['id', 'appointment_date', 'start_time', 'end_time', 'status', 'patient', 'phone_number',
+                  'is_another_patient', 'another_patient_name', 'problem_description']
+
+
+class AppointmentDoctorSerializer(DoctorCardSerializer):
+    """Карточка врача в списке записей: без рейтинга и клиники (клиника берется из места работы записи)"""
+
+    class Meta(DoctorCardSerializer.Meta):
+        fields = ['id', 'name', 'photo', 'specialties']
+        expandable_fields = {}
+
+
+class AppointmentListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    """
+    Компактная запись на прием для списков: id, время, статус и короткие карточки врача и пациента.
+    Queryset должен загружать ровно эти связи, см. AppointmentViewSet.get_list_queryset.
+    """
+    status = AppointmentStatusSerializer(read_only=True)
+    doctor = AppointmentDoctorSerializer(read_only=True)
+    patient = PatientCardSerializer(read_only=True)
+
+    class Meta:
+        model = Appointment
+        fields = ['id', 'appointment_date', 'start_time', 'end_time', 'status', 'doctor', 'patient',
+                  'workplace', 'is_another_patient', 'another_patient_name']
+        # Поля, которые можно добавить к записи через ?expand=
+        expandable_fields = {
+            'workplace': (ScheduleWorkplaceSerializer, {}),
+            'cancellation_reason': (CancelReasonSerializer, {}),
+        }
+
+
+class WaitlistEntrySerializer(serializers.ModelSerializer):
+    """Запись пациента в листе ожидания. Пациент задается из request.user, поля offer_* только для чтения."""
+
+    class Meta:
+        model = WaitlistEntry
+        fields = ['id', 'doctor', 'date', 'earliest_time', 'latest_time', 'status', 'created_at',
+                  'offer_start_time', 'offer_end_time', 'offer_workplace', 'offer_expires_at', 'appointment']
+        read_only_fields = ['status', 'created_at', 'offer_start_time', 'offer_end_time', 'offer_workplace',
+                            'offer_expires_at', 'appointment']
+
+    def validate(self, attrs):
+        earliest, latest = attrs.get('earliest_time'), attrs.get('latest_time')
+        if earliest and latest and earliest >= latest:
+            raise serializers.ValidationError({'latest_time': 'Должно быть позже earliest_time'})
+        if attrs.get('date') and attrs['date'] < timezone.localdate():
+            raise serializers.ValidationError({'date': 'Дата уже прошла'})
+        return attrs
+
+
+class BulkAppointmentItemSerializer(serializers.Serializer):
+    """
+    Элемент пакетной записи. Связи передаются как id и проверяются вместе для всего пакета
+    (см. appointments.booking). repeat_weeks > 1 создает серию приемов с шагом в неделю.
+    """
+    patient = serializers.IntegerField()
+    workplace = serializers.IntegerField(required=False)
+    appointment_date = serializers.DateField()
+    start_time = serializers.TimeField()
+    end_time = serializers.TimeField(required=False, help_text='По умолчанию начало + интервал приема места работы')
+    repeat_weeks = serializers.IntegerField(min_value=1, max_value=52, default=1)
+    phone_number = serializers.RegexField(Appointment.phone_regex.regex, required=False)
+    problem_description = serializers.CharField(max_length=1000, required=False, allow_blank=True)
+
+
+class BulkAppointmentSerializer(serializers.Serializer):
+    doctor = serializers.IntegerField(required=False, help_text='Обязателен для администратора')
+    workplace = serializers.IntegerField(required=False, help_text='Место работы по умолчанию для элементов')
+    items = serializers.ListField(child=serializers.DictField(), min_length=1)
+
+
+class BulkAppointmentCreatedSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Appointment
+        fields = ['id', 'appointment_date', 'start_time', 'end_time', 'workplace', 'patient']
+
+
+class ReviewSerializer(serializers.ModelSerializer):
+    """Отзыв в ленте врача: автор показывается только по имени. Ожидает select_related('appointment__patient__user')."""
+    author = serializers.CharField(source='appointment.patient.user.first_name', read_only=True)
+
+    class Meta:
+        model = Review
+        fields = ['id', 'rating', 'comment', 'author', 'created_at']
+
+
+class ReviewCreateSerializer(serializers.ModelSerializer):
+    """Отзыв пациента о своем завершенном приеме"""
+    appointment = serializers.PrimaryKeyRelatedField(queryset=Appointment.objects.select_related('status', 'patient'))
+
+    class Meta:
+        model = Review
+        fields = ['id', 'appointment', 'rating', 'comment', 'is_published', 'created_at']
+        read_only_fields = ['is_published', 'created_at']
+
+    def validate_appointment(self, appointment):
+        if appointment.patient.user_id != self.context['request'].user.id:
+            raise serializers.ValidationError('Можно оставить отзыв только о своей записи')
+        if appointment.status.name_ru != STATUS_COMPLETED:
+            raise serializers.ValidationError('Отзыв можно оставить только о завершенном приеме')
+        if Review.objects.filter(appointment=appointment).exists():
+            raise serializers.ValidationError('Отзыв об этом приеме уже оставлен')
+        return appointment
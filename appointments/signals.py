@@ -0,0 +1,16 @@
+from django.dispatch import Signal
+
+# Статус записей изменился. Отправляется после фиксации транзакции, одним сигналом на группу записей.
+# Аргументы: appointment_ids - список id записей, from_status_id, to_status_id - id статусов.
+appointments_status_changed = Signal()
+
+
+def send_status_changed(appointment_ids, from_status_id, to_status_id):
+    from appointments.models import Appointment
+
+    appointments_status_changed.send(
+        sender=Appointment,
+        appointment_ids=list(appointment_ids),
+        from_status_id=from_status_id,
+        to_status_id=to_status_id,
+    )
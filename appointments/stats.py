@@ -0,0 +1,212 @@
+"""
+Дневная статистика записей на прием (AppointmentDailyStats) для аналитики.
+
+Статистика ведется инкрементально: каждое изменение записи превращается в приращения count по ключу
+(дата, врач, место работы, статус, причина отмены). Место работы заменяется на клинику и район.
+- save() и delete() записи учитываются сигналами post_save/post_delete. Прежний ключ записи запоминает
+  Appointment.from_db.
+- Массовые операции в обход save() вызывают record_created и record_status_change явно:
+  пакетная запись (appointments.booking) и перевод прошедших записей (appointments.transitions).
+- rebuild_stats пересчитывает статистику за период по таблице записей. Ее запускает команда
+  backfill_appointment_stats и генератор данных.
+
+Функции чтения (workload, cancellation_rates, no_show_rates) обращаются только к таблице статистики.
+"""
+from collections import Counter
+from itertools import islice
+
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from appointments.models import Appointment, AppointmentDailyStats
+from appointments.statuses import STATUS_CANCELLED, STATUS_COMPLETED, STATUS_NO_SHOW, get_status_ids
+from doctors.models import Workplace
+
+# Поля строки статистики в порядке ключа
+STATS_FIELDS = ('date', 'doctor_id', 'clinic_id', 'district_id', 'status_id', 'cancellation_reason_id')
+# Разрезы аналитики: параметр group -> поле статистики
+GROUP_FIELDS = {'doctor': 'doctor_id', 'clinic': 'clinic_id', 'district': 'district_id'}
+
+
+def stats_key(appointment):
+    return tuple(getattr(appointment, field) for field in Appointment.STATS_FIELDS)
+
+
+def apply_deltas(deltas):
+    """
+    Прибавляет приращения {ключ записи: приращение} к строкам статистики: места работы, существующие строки,
+    затем один UPDATE и один INSERT. Отрицательное приращение без строки не создает новую:
+    такая строка уже удалена каскадом вместе с врачом.
+    """
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    workplaces = {
+        workplace_id: (clinic_id, district_id)
+        for workplace_id, clinic_id, district_id in Workplace.objects.filter(
+            id__in={key[2] for key in deltas if key[2] is not None}
+        ).values_list('id', 'clinic_id', 'clinic__district_id')
+    }
+
+    rows = Counter()
+    for (day, doctor_id, workplace_id, status_id, reason_id), delta in deltas.items():
+        clinic_id, district_id = workplaces.get(workplace_id, (None, None))
+        rows[(day, doctor_id, clinic_id, district_id, status_id, reason_id)] += delta
+
+    rows = {key: delta for key, delta in rows.items() if delta}
+    # Строки статистики тех же врачей и дат; для ключа берется первая строка, даже если
+    # параллельные вставки создали несколько
+    existing = {}
+    for pk, *key in AppointmentDailyStats.objects.filter(
+        date__in={key[0] for key in rows}, doctor_id__in={key[1] for key in rows}
+    ).order_by('id').values_list('id', *STATS_FIELDS):
+        existing.setdefault(tuple(key), pk)
+
+    updated = [
+        AppointmentDailyStats(id=existing[key], count=F('count') + delta)
+        for key, delta in rows.items() if key in existing
+    ]
+    created = [
+        AppointmentDailyStats(count=delta, **dict(zip(STATS_FIELDS, key)))
+        for key, delta in rows.items() if key not in existing and delta > 0
+    ]
+    if updated:
+        AppointmentDailyStats.objects.bulk_update(updated, ['count'])
+    if created:
+        AppointmentDailyStats.objects.bulk_create(created)
+
+
+def record_created(appointments):
+    """Учитывает записи, созданные через bulk_create"""
+    apply_deltas(Counter(stats_key(appointment) for appointment in appointments))
+    for appointment in appointments:
+        appointment._stats_key = stats_key(appointment)
+
+
+def record_status_change(appointment_ids, from_status_id):
+    """Учитывает записи, статус которых изменен одним UPDATE с from_status_id (остальные поля ключа прежние)"""
+    deltas = Counter()
+    rows = Appointment.objects.filter(id__in=appointment_ids).order_by().values_list(
+        *Appointment.STATS_FIELDS
+    ).annotate(total=Count('id'))
+    for *key, total in rows:
+        deltas[tuple(key)] += total
+        deltas[tuple(key[:3]) + (from_status_id, key[4])] -= total
+    apply_deltas(deltas)
+
+
+@receiver(pre_save, sender=Appointment, dispatch_uid='appointment_stats_load_key')
+def load_stats_key(sender, instance, raw, **kwargs):
+    """Прежний ключ записи, загруженной без полей статистики (only/defer), читается из базы"""
+    if raw or instance._state.adding or hasattr(instance, '_stats_key'):
+        return
+    key = Appointment.objects.filter(pk=instance.pk).values_list(*Appointment.STATS_FIELDS).first()
+    instance._stats_key = tuple(key) if key else None
+
+
+@receiver(post_save, sender=Appointment, dispatch_uid='appointment_stats_saved')
+def record_saved(sender, instance, created, raw, **kwargs):
+    if raw:
+        return
+    previous = None if created else getattr(instance, '_stats_key', None)
+    current = stats_key(instance)
+    if previous != current:
+        deltas = Counter({current: 1})
+        if previous is not None:
+            deltas[previous] -= 1
+        apply_deltas(deltas)
+    instance._stats_key = current
+
+
+@receiver(post_delete, sender=Appointment, dispatch_uid='appointment_stats_deleted')
+def record_deleted(sender, instance, **kwargs):
+    apply_deltas({getattr(instance, '_stats_key', None) or stats_key(instance): -1})
+
+
+def rebuild_stats(date_from=None, date_to=None, batch_size=5000):
+    """Пересчитывает статистику за период (по умолчанию за все время). Возвращает количество строк."""
+    appointments = Appointment.objects.order_by()
+    stats = AppointmentDailyStats.objects.all()
+    if date_from:
+        appointments = appointments.filter(appointment_date__gte=date_from)
+        stats = stats.filter(date__gte=date_from)
+    if date_to:
+        appointments = appointments.filter(appointment_date__lte=date_to)
+        stats = stats.filter(date__lte=date_to)
+
+    rows = appointments.values_list(
+        'appointment_date', 'doctor_id', 'workplace__clinic_id', 'workplace__clinic__district_id',
+        'status_id', 'cancellation_reason_id',
+    ).annotate(total=Count('id')).iterator(chunk_size=batch_size)
+    objects = (AppointmentDailyStats(count=total, **dict(zip(STATS_FIELDS, key))) for *key, total in rows)
+
+    created = 0
+    with transaction.atomic():
+        stats.delete()
+        while batch := list(islice(objects, batch_size)):
+            AppointmentDailyStats.objects.bulk_create(batch)
+            created += len(batch)
+    return created
+
+
+def stats_queryset(date_from, date_to, doctor=None, clinic=None, district=None):
+    queryset = AppointmentDailyStats.objects.filter(date__range=(date_from, date_to)).order_by()
+    filters = {'doctor_id': doctor, 'clinic_id': clinic, 'district_id': district}
+    return queryset.filter(**{field: value for field, value in filters.items() if value is not None})
+
+
+def status_sums():
+    """Суммы count по итоговым статусам для annotate"""
+    statuses = get_status_ids(STATUS_COMPLETED, STATUS_CANCELLED, STATUS_NO_SHOW)
+    return {
+        name: Coalesce(Sum('count', filter=Q(status_id=statuses.get(status))), 0)
+        for name, status in (('completed', STATUS_COMPLETED), ('cancelled', STATUS_CANCELLED),
+                             ('no_show', STATUS_NO_SHOW))
+    }
+
+
+def rate(part, whole):
+    return round(part / whole, 4) if whole else None
+
+
+def workload(group, date_from, date_to, **filters):
+    """Записи по дням в разрезе врача, клиники или района: всего, завершено, отменено, неявок"""
+    field = GROUP_FIELDS[group]
+    rows = stats_queryset(date_from, date_to, **filters).values(field, 'date').annotate(
+        total=Coalesce(Sum('count'), 0), **status_sums()
+    ).order_by('date', field)
+    return [{group: row.pop(field), **row} for row in rows]
+
+
+def cancellation_rates(date_from, date_to, **filters):
+    """Отмены по причинам: количество и доля от всех записей периода"""
+    queryset = stats_queryset(date_from, date_to, **filters)
+    total = queryset.aggregate(total=Coalesce(Sum('count'), 0))['total']
+    cancelled_id = get_status_ids(STATUS_CANCELLED).get(STATUS_CANCELLED)
+    rows = queryset.filter(status_id=cancelled_id).values('cancellation_reason_id').annotate(
+        cancelled=Sum('count')
+    ).order_by('-cancelled')
+    return {
+        'total': total,
+        'reasons': [
+            {'reason': row['cancellation_reason_id'], 'cancelled': row['cancelled'],
+             'rate': rate(row['cancelled'], total)}
+            for row in rows
+        ],
+    }
+
+
+def no_show_rates(group, date_from, date_to, **filters):
+    """Доля неявок среди прошедших записей (завершенных и неявок) в разрезе врача, клиники или района"""
+    field = GROUP_FIELDS[group]
+    rows = stats_queryset(date_from, date_to, **filters).values(field).annotate(
+        **status_sums()
+    ).order_by(field)
+    return [
+        {group: row[field], 'completed': row['completed'], 'no_show': row['no_show'],
+         'rate': rate(row['no_show'], row['completed'] + row['no_show'])}
+        for row in rows
+    ]
@@ -0,0 +1,15 @@
+"""
+Названия статусов записей (см. a_base/fixtures/appointment_statuses.json).
+Статусы - строки справочника AppointmentStatus, поэтому их id ищутся по названию.
+"""
+from a_base.models import AppointmentStatus
+
+STATUS_UPCOMING = 'Предстоящий'
+STATUS_COMPLETED = 'Завершен'
+STATUS_CANCELLED = 'Отменен'
+STATUS_NO_SHOW = 'Пациент не явился'
+
+
+def get_status_ids(*names):
+    """{название: id} для указанных статусов одним запросом. Отсутствующих в базе статусов нет в словаре."""
+    return dict(AppointmentStatus.objects.filter(name_ru__in=names).values_list('name_ru', 'id'))
@@ -0,0 +1,7 @@
+from .test_views import AppointmentScheduleAPITestCase, AppointmentListAPITestCase
+from .test_reminders import ReminderSchedulerTestCase
+from .test_transitions import ExpireAppointmentsTestCase
+from .test_waitlist import WaitlistTestCase
+from .test_booking import BulkAppointmentAPITestCase
+from .test_stats import AppointmentStatsTestCase
+from .test_reviews import ReviewAPITestCase
\ No newline at end of file
@@ -0,0 +1,92 @@
+from datetime import time, timedelta
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from a_base.benchmarks import seed_data
+from a_base.benchmarks.generators import phone_number
+from a_base.models import AppointmentStatus
+from appointments.models import Appointment
+from appointments.statuses import STATUS_UPCOMING
+from doctors.models import Doctor
+
+User = get_user_model()
+
+
+class BulkAppointmentAPITestCase(APITestCase):
+    volumes = {'doctors': 2, 'patients': 2, 'clinics': 1, 'appointments': 0, 'messages': 0}
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_data(cls.volumes)
+        cls.doctor_user = User.objects.get(phone_number=phone_number(0, 0))
+        cls.doctor = Doctor.objects.get(user=cls.doctor_user)
+        cls.other_doctor = Doctor.objects.exclude(pk=cls.doctor.pk).get()
+        cls.patients = [User.objects.get(phone_number=phone_number(1, index)).patient_profile for index in range(2)]
+        cls.staff = User.objects.filter(is_staff=True).first()
+        cls.url = reverse('appointment-bulk')
+        # Ближайший понедельник: у мест работы из генератора рабочие дни пн, ср, пт с 8 до 16
+        today = timezone.localdate()
+        cls.monday = today + timedelta(days=7 - today.weekday())
+        Appointment.objects.create(
+            doctor=cls.doctor, patient=cls.patients[1], workplace=cls.doctor.workplaces.get(),
+            status=AppointmentStatus.objects.get(name_ru=STATUS_UPCOMING),
+            appointment_date=cls.monday + timedelta(weeks=2), start_time=time(9, 15), end_time=time(9, 45),
+            phone_number=cls.patients[1].user.phone_number,
+        )
+
+    def item(self, **fields):
+        return {'patient': self.patients[0].pk, 'appointment_date': self.monday.isoformat(), 'start_time': '09:00',
+                **fields}
+
+    def test_weekly_series_reports_failed_slots(self):
+        """Серия создается одним запросом, занятые и нерабочие слоты возвращаются с номером элемента"""
+        self.client.force_authenticate(self.doctor_user)
+        items = [
+            self.item(repeat_weeks=4),
+            self.item(start_time='09:10'),
+            self.item(appointment_date=(self.monday + timedelta(days=1)).isoformat()),
+            self.item(start_time='15:45'),
+            self.item(patient=0),
+            self.item(start_time='bad'),
+        ]
+        # Пользователь, места работы с расписанием и исключениями, пациенты, занятые интервалы, статус,
+        # вставка и дневная статистика: клиники мест работы, строки статистики, вставка строк
+        with self.assertNumQueries(13):
+            response = self.client.post(self.url, {'items': items}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        created = response.data['created']
+        self.assertEqual([item['appointment_date'] for item in created],
+                         [(self.monday + timedelta(weeks=week)).isoformat() for week in (0, 1, 3)])
+        self.assertEqual({item['end_time'] for item in created}, {'09:30:00'})
+        self.assertEqual(Appointment.objects.filter(doctor=self.doctor).count(), 4)
+
+        failed = {(error['index'], next(iter(error['errors']))) for error in response.data['failed']}
+        self.assertEqual(failed, {
+            (0, 'start_time'), (1, 'start_time'), (2, 'appointment_date'),
+            (3, 'start_time'), (4, 'patient'), (5, 'start_time'),
+        })
+
+    def test_staff_books_for_doctor(self):
+        self.client.force_authenticate(self.staff)
+        response = self.client.post(self.url, {'doctor': self.other_doctor.pk, 'items': [self.item()]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(Appointment.objects.filter(doctor=self.other_doctor).exists())
+
+    def test_all_failed_returns_400(self):
+        self.client.force_authenticate(self.doctor_user)
+        response = self.client.post(self.url, {'items': [self.item(start_time='07:00')]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['created'], [])
+
+    def test_patient_cannot_bulk_book(self):
+        self.client.force_authenticate(self.patients[0].user)
+        response = self.client.post(self.url, {'items': [self.item()]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
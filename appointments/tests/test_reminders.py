@@ -0,0 +1,116 @@
+from datetime import datetime, timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from a_base.benchmarks import seed_data
+from a_base.models import AppointmentStatus
+from appointments.models import Appointment, AppointmentReminder
+from appointments.reminders import ReminderScheduler
+from doctors.models import Doctor
+from patients.models import Patient
+
+
+class FakeSender:
+    def __init__(self, fail=()):
+        self.sent = []
+        self.fail = set(fail)
+
+    def __call__(self, reminders):
+        self.sent.extend((reminder.appointment_id, reminder.window) for reminder in reminders)
+        return {reminder.id: 'Ошибка' for reminder in reminders if reminder.appointment_id in self.fail}
+
+
+class ReminderSchedulerTestCase(TestCase):
+    volumes = {'doctors': 1, 'patients': 1, 'clinics': 1, 'appointments': 0, 'messages': 0}
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_data(cls.volumes)
+        cls.doctor = Doctor.objects.get()
+        cls.patient = Patient.objects.get()
+        cls.upcoming = AppointmentStatus.objects.get(name_ru='Предстоящий')
+        cls.cancelled = AppointmentStatus.objects.get(name_ru='Отменен')
+        # 23:00 по местному времени: окна переходят через полночь
+        cls.now = timezone.make_aware(datetime(2026, 3, 10, 23, 0))
+
+        cls.soon = cls.create(timedelta(hours=1))
+        cls.tomorrow = cls.create(timedelta(hours=10))
+        cls.later = cls.create(timedelta(hours=30))
+        cls.cancelled_soon = cls.create(timedelta(hours=1, minutes=30), status=cls.cancelled)
+
+    @classmethod
+    def create(cls, delta, status=None):
+        start = timezone.localtime(cls.now) + delta
+        return Appointment.objects.create(
+            doctor=cls.doctor, patient=cls.patient, status=status or cls.upcoming,
+            appointment_date=start.date(), start_time=start.time(),
+            end_time=(start + timedelta(minutes=30)).time(), phone_number='+992900000000',
+        )
+
+    def scheduler(self, sender):
+        return ReminderScheduler(channels=['push'], senders={'push': sender}, batch_size=1)
+
+    def test_windows_and_no_duplicates(self):
+        """Каждая запись получает напоминание своего окна один раз, даже после повторного запуска"""
+        sender = FakeSender()
+        result = self.scheduler(sender).run_once(self.now)
+
+        self.assertEqual(result, {'queued': 2, 'sent': 2, 'failed': 0, 'skipped': 0})
+        self.assertEqual(sorted(sender.sent), sorted([(self.soon.id, '2h'), (self.tomorrow.id, '24h')]))
+
+        self.assertEqual(self.scheduler(sender).run_once(self.now)['queued'], 0)
+        self.assertEqual(len(sender.sent), 2)
+
+        # Через 9 часов запись на завтра попадает в окно 2 часов, а поздняя запись - в окно 24 часов
+        self.scheduler(sender).run_once(self.now + timedelta(hours=9))
+        self.assertEqual(sorted(sender.sent[2:]), sorted([(self.tomorrow.id, '2h'), (self.later.id, '24h')]))
+
+    def test_interrupted_and_failed(self):
+        """Прерванная отправка не повторяется, ошибка отправки сохраняется"""
+        scheduler = self.scheduler(FakeSender(fail={self.tomorrow.id}))
+        scheduler.enqueue(self.now)
+        AppointmentReminder.objects.filter(appointment=self.soon).update(status=AppointmentReminder.Status.SENDING)
+
+        self.assertEqual(scheduler.deliver(), (0, 1, 0))
+        failed = AppointmentReminder.objects.get(appointment=self.tomorrow)
+        self.assertEqual(failed.status, AppointmentReminder.Status.FAILED)
+        self.assertEqual(failed.error, 'Ошибка')
+        self.assertEqual(
+            AppointmentReminder.objects.get(appointment=self.soon).status, AppointmentReminder.Status.SENDING
+        )
+
+    def test_cancelled_and_moved_appointments_are_skipped(self):
+        """Напоминания отмененной и перенесенной записи не отправляются, для нового времени планируется новое"""
+        sender = FakeSender()
+        scheduler = self.scheduler(sender)
+        self.assertEqual(scheduler.enqueue(self.now), 2)
+
+        Appointment.objects.filter(pk=self.soon.pk).update(status=self.cancelled, cancelled_at=self.now)
+        moved = (timezone.localtime(self.now) + timedelta(hours=12)).time()
+        Appointment.objects.filter(pk=self.tomorrow.pk).update(start_time=moved)
+
+        self.assertEqual(scheduler.deliver(), (0, 0, 2))
+        self.assertEqual(sender.sent, [])
+        self.assertEqual(
+            AppointmentReminder.objects.filter(status=AppointmentReminder.Status.SKIPPED).count(), 2
+        )
+
+        self.assertEqual(scheduler.run_once(self.now), {'queued': 1, 'sent': 1, 'failed': 0, 'skipped': 0})
+        self.assertEqual(sender.sent, [(self.tomorrow.id, '24h')])
+        self.assertEqual(AppointmentReminder.objects.get(status=AppointmentReminder.Status.SENT).start_time, moved)
+
+    def test_existing_reminders_are_not_counted(self):
+        """Напоминания, которые уже запланировал другой процесс, не создаются повторно и не учитываются"""
+        scheduler = self.scheduler(FakeSender())
+        appointments = [
+            (appointment.id, appointment.appointment_date, appointment.start_time)
+            for appointment in (self.soon, self.tomorrow)
+        ]
+        AppointmentReminder.objects.create(
+            appointment=self.soon, window='2h', channel='push',
+            appointment_date=self.soon.appointment_date, start_time=self.soon.start_time,
+        )
+
+        self.assertEqual(scheduler.create_reminders('2h', appointments), 1)
+        self.assertEqual(AppointmentReminder.objects.count(), 2)
@@ -0,0 +1,104 @@
+from datetime import time, timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from a_base.benchmarks import seed_data
+from a_base.benchmarks.generators import phone_number
+from a_base.models import AppointmentStatus
+from appointments.models import Appointment, Review
+from appointments.statuses import STATUS_COMPLETED, STATUS_UPCOMING
+from doctors.models import Doctor
+
+User = get_user_model()
+
+
+class ReviewAPITestCase(APITestCase):
+    volumes = {'doctors': 1, 'patients': 2, 'clinics': 1, 'appointments': 0, 'messages': 0}
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_data(cls.volumes)
+        cls.doctor = Doctor.objects.get()
+        cls.user = User.objects.get(phone_number=phone_number(1, 0))
+        cls.other_user = User.objects.get(phone_number=phone_number(1, 1))
+        statuses = {status.name_ru: status for status in AppointmentStatus.objects.all()}
+        day = timezone.localdate() - timedelta(days=30)
+
+        appointments = [
+            Appointment.objects.create(
+                doctor=cls.doctor, patient=(cls.other_user if index % 2 else cls.user).patient_profile,
+                status=statuses[STATUS_COMPLETED], appointment_date=day + timedelta(days=index),
+                start_time=time(10), end_time=time(10, 30), phone_number=cls.user.phone_number,
+            )
+            for index in range(27)
+        ]
+        cls.completed = appointments[-1]
+        cls.upcoming = Appointment.objects.create(
+            doctor=cls.doctor, patient=cls.user.patient_profile, status=statuses[STATUS_UPCOMING],
+            appointment_date=day + timedelta(days=60), start_time=time(10), end_time=time(10, 30),
+            phone_number=cls.user.phone_number,
+        )
+        for index, appointment in enumerate(appointments[:-1]):
+            Review.objects.create(appointment=appointment, rating=5, comment=f'Отзыв {index}',
+                                  is_published=index != 3)
+        cls.url = reverse('review-list')
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(self.user)
+
+    def test_submit_for_own_completed_appointment(self):
+        response = self.client.post(self.url, {'appointment': self.completed.pk, 'rating': 4, 'comment': 'Хорошо'})
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Review.objects.get(pk=response.data['id']).doctor, self.doctor)
+
+    def test_submit_rejected(self):
+        """Чужая запись, незавершенный прием и повторный отзыв не принимаются"""
+        reviewed = Review.objects.filter(appointment__patient__user=self.user).first().appointment
+        other = Appointment.objects.filter(patient__user=self.other_user).first()
+        for appointment in (other, self.upcoming, reviewed):
+            response = self.client.post(self.url, {'appointment': appointment.pk, 'rating': 4})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn('appointment', response.data)
+
+    def test_feed_pages(self):
+        """Лента идет от новых к старым без пропусков и повторов, неопубликованные отзывы скрыты"""
+        response = self.client.get(self.url, {'doctor': self.doctor.pk})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        reviews = list(response.data['results'])
+        self.assertEqual(len(reviews), 20)
+
+        # Страница по курсору - один запрос, без COUNT
+        with self.assertNumQueries(1):
+            response = self.client.get(response.data['next'])
+        reviews += response.data['results']
+        self.assertIsNone(response.data['next'])
+
+        expected = Review.objects.filter(doctor=self.doctor, is_published=True).order_by('-created_at', '-id')
+        self.assertEqual([review['id'] for review in reviews], list(expected.values_list('id', flat=True)))
+        self.assertEqual(reviews[0]['author'], expected.first().appointment.patient.user.first_name)
+
+    # Кэш в памяти процесса: обращения к кэшу в базе данных не смешиваются с запросами к отзывам
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_first_page_cached_until_new_review(self):
+        self.client.get(self.url, {'doctor': self.doctor.pk})
+        with self.assertNumQueries(0):
+            cached = self.client.get(self.url, {'doctor': self.doctor.pk})
+        self.assertEqual(len(cached.data['results']), 20)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            review = Review.objects.create(appointment=self.completed, rating=3, comment='Новый')
+        response = self.client.get(self.url, {'doctor': self.doctor.pk})
+        self.assertEqual(response.data['results'][0]['id'], review.pk)
+
+    def test_feed_requires_doctor(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
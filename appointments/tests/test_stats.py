@@ -0,0 +1,112 @@
+from datetime import time, timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from a_base.benchmarks import seed_data
+from a_base.models import AppointmentStatus, CancelReason
+from appointments.booking import book_appointments
+from appointments.models import Appointment, AppointmentDailyStats
+from appointments.stats import STATS_FIELDS, rebuild_stats
+from appointments.statuses import STATUS_CANCELLED, STATUS_NO_SHOW, STATUS_UPCOMING
+from appointments.transitions import expire_appointments
+from doctors.models import Doctor
+from patients.models import Patient
+
+User = get_user_model()
+
+
+class AppointmentStatsTestCase(APITestCase):
+    volumes = {'doctors': 2, 'patients': 3, 'clinics': 2, 'appointments': 60, 'messages': 0}
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_data(cls.volumes)
+        cls.staff = User.objects.filter(is_staff=True).first()
+        cls.doctor = Doctor.objects.order_by('id').first()
+        cls.patient = Patient.objects.order_by('id').first()
+        cls.upcoming = AppointmentStatus.objects.get(name_ru=STATUS_UPCOMING)
+        cls.reason = CancelReason.objects.create(name='Перенос по работе')
+
+    def snapshot(self):
+        """{ключ: количество} по строкам статистики без нулевых"""
+        result = {}
+        for *key, count in AppointmentDailyStats.objects.values_list(*STATS_FIELDS, 'count'):
+            result[tuple(key)] = result.get(tuple(key), 0) + count
+        return {key: count for key, count in result.items() if count}
+
+    def create(self, day, start_time):
+        return Appointment.objects.create(
+            doctor=self.doctor, patient=self.patient, workplace=self.doctor.workplaces.get(), status=self.upcoming,
+            appointment_date=day, start_time=start_time, end_time=time(start_time.hour, 50),
+            phone_number=self.patient.user.phone_number,
+        )
+
+    def test_incremental_matches_rebuild(self):
+        """После изменений записей всеми путями статистика совпадает с полным пересчетом"""
+        today = timezone.localdate()
+        past = self.create(today - timedelta(days=400), time(10))
+        self.create(today + timedelta(days=400), time(10)).cancel(reason=self.reason)
+        moved = self.create(today + timedelta(days=401), time(11))
+        moved.reschedule(today + timedelta(days=402), time(11), time(11, 50))
+        self.create(today + timedelta(days=403), time(12)).delete()
+        Appointment.objects.only('id').get(pk=moved.pk).complete()
+
+        monday = today + timedelta(days=7 - today.weekday())
+        created, failed = book_appointments(self.doctor.pk, [
+            {'patient': self.patient.pk, 'appointment_date': monday + timedelta(weeks=60), 'start_time': time(8),
+             'repeat_weeks': 3},
+        ])
+        self.assertEqual((len(created), failed), (3, []))
+        expire_appointments()
+
+        past.refresh_from_db()
+        self.assertEqual(past.status.name_ru, STATUS_NO_SHOW)
+        incremental = self.snapshot()
+        rebuild_stats()
+        self.assertEqual(incremental, self.snapshot())
+
+    def test_rebuild_period(self):
+        day = Appointment.objects.order_by('appointment_date').values_list('appointment_date', flat=True).first()
+        AppointmentDailyStats.objects.update(count=0)
+        rebuild_stats(day, day)
+
+        self.assertEqual(
+            sum(AppointmentDailyStats.objects.values_list('count', flat=True)),
+            Appointment.objects.filter(appointment_date=day).count()
+        )
+
+    def test_api_reads_only_rollups(self):
+        """Аналитика не обращается к таблице записей"""
+        self.create(timezone.localdate() + timedelta(days=1), time(10)).cancel(reason=self.reason)
+        self.client.force_authenticate(self.staff)
+        period = {'date_from': (timezone.localdate() - timedelta(days=60)).isoformat(),
+                  'date_to': (timezone.localdate() + timedelta(days=60)).isoformat()}
+
+        with CaptureQueriesContext(connection) as queries:
+            workload = self.client.get(reverse('appointment-stats-workload'), {**period, 'group': 'clinic'})
+            cancellations = self.client.get(reverse('appointment-stats-cancellations'), period)
+            no_shows = self.client.get(reverse('appointment-stats-no-shows'), {**period, 'doctor': self.doctor.pk})
+
+        for response in (workload, cancellations, no_shows):
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse([query for query in queries if Appointment._meta.db_table + '"' in query['sql']])
+
+        self.assertEqual(
+            sum(row['total'] for row in workload.data['results']),
+            Appointment.objects.filter(appointment_date__range=(period['date_from'], period['date_to'])).count()
+        )
+        reasons = {row['reason']: row['cancelled'] for row in cancellations.data['reasons']}
+        self.assertEqual(reasons[self.reason.pk], 1)
+        self.assertEqual([row['doctor'] for row in no_shows.data['results']], [self.doctor.pk])
+
+    def test_staff_only(self):
+        self.client.force_authenticate(self.patient.user)
+        response = self.client.get(reverse('appointment-stats-workload'))
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
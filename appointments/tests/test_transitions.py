@@ -0,0 +1,101 @@
+from datetime import datetime, timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from a_base.benchmarks import seed_data
+from a_base.models import AppointmentStatus
+from appointments.models import Appointment
+from appointments.signals import appointments_status_changed
+from appointments.statuses import STATUS_CANCELLED, STATUS_COMPLETED, STATUS_NO_SHOW, STATUS_UPCOMING
+from appointments.transitions import expire_appointments
+from doctors.models import Doctor
+from ehr.models import Visit
+from patients.models import Patient
+
+
+class ExpireAppointmentsTestCase(TestCase):
+    volumes = {'doctors': 1, 'patients': 1, 'clinics': 1, 'appointments': 0, 'messages': 0}
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_data(cls.volumes)
+        cls.doctor = Doctor.objects.get()
+        cls.patient = Patient.objects.get()
+        cls.statuses = {status.name_ru: status for status in AppointmentStatus.objects.all()}
+        cls.now = timezone.make_aware(datetime(2026, 3, 10, 12, 0))
+
+        cls.visited = cls.create(timedelta(days=-1))
+        cls.missed = cls.create(timedelta(days=-2))
+        cls.just_ended = cls.create(timedelta(minutes=-40))
+        cls.in_grace = cls.create(timedelta(minutes=-50), duration=timedelta(minutes=30))
+        cls.future = cls.create(timedelta(hours=2))
+        cls.cancelled = cls.create(timedelta(days=-3), status=STATUS_CANCELLED)
+        Visit.objects.create(appointment=cls.visited)
+
+    @classmethod
+    def create(cls, delta, status=STATUS_UPCOMING, duration=timedelta(minutes=5)):
+        start = timezone.localtime(cls.now) + delta
+        return Appointment.objects.create(
+            doctor=cls.doctor, patient=cls.patient, status=cls.statuses[status],
+            appointment_date=start.date(), start_time=start.time(),
+            end_time=(start + duration).time(), phone_number='+992900000000',
+        )
+
+    def status(self, appointment):
+        return Appointment.objects.select_related('status').get(pk=appointment.pk).status.name_ru
+
+    def test_expire_in_batches(self):
+        """Прошедшие записи получают статус по наличию посещения, события отправляются по группам"""
+        events = []
+
+        def receiver(appointment_ids, from_status_id, to_status_id, **kwargs):
+            events.append((sorted(appointment_ids), to_status_id))
+
+        appointments_status_changed.connect(receiver)
+        self.addCleanup(appointments_status_changed.disconnect, receiver)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            result = expire_appointments(now=self.now, batch_size=2)
+
+        self.assertEqual(result, {STATUS_COMPLETED: 1, STATUS_NO_SHOW: 2})
+        self.assertEqual(self.status(self.visited), STATUS_COMPLETED)
+        self.assertEqual(self.status(self.missed), STATUS_NO_SHOW)
+        self.assertEqual(self.status(self.just_ended), STATUS_NO_SHOW)
+        self.assertEqual(self.status(self.in_grace), STATUS_UPCOMING)
+        self.assertEqual(self.status(self.future), STATUS_UPCOMING)
+        self.assertEqual(self.status(self.cancelled), STATUS_CANCELLED)
+
+        completed, no_show = self.statuses[STATUS_COMPLETED].id, self.statuses[STATUS_NO_SHOW].id
+        self.assertIn(([self.visited.id], completed), events)
+        self.assertEqual(
+            sorted(pk for ids, status in events if status == no_show for pk in ids),
+            sorted([self.missed.id, self.just_ended.id])
+        )
+
+    def test_single_update_per_status(self):
+        """Записи пачки обновляются по id одним UPDATE на каждый статус, посещения повторно не проверяются"""
+        with CaptureQueriesContext(connection) as queries:
+            expire_appointments(now=self.now, batch_size=10)
+
+        # Кроме UPDATE записей в пачке один UPDATE дневной статистики (appointments.stats)
+        table = Appointment._meta.db_table
+        updates = [query['sql'] for query in queries.captured_queries
+                   if query['sql'].startswith(f'UPDATE "{table}" ')]
+        self.assertEqual(len(updates), 2)
+        self.assertFalse(any('EXISTS' in sql for sql in updates))
+
+    def test_cancel_sends_event(self):
+        events = []
+
+        def receiver(appointment_ids, to_status_id, **kwargs):
+            events.append((appointment_ids, to_status_id))
+
+        appointments_status_changed.connect(receiver)
+        self.addCleanup(appointments_status_changed.disconnect, receiver)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.future.cancel()
+        self.assertEqual(events, [([self.future.id], self.statuses[STATUS_CANCELLED].id)])
@@ -0,0 +1,108 @@
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from a_base.benchmarks import seed_data
+from a_base.benchmarks.generators import phone_number
+from appointments.models import Appointment
+from doctors.models import Doctor
+
+User = get_user_model()
+
+
+class AppointmentScheduleAPITestCase(APITestCase):
+    volumes = {'doctors': 2, 'patients': 3, 'clinics': 2, 'appointments': 120, 'messages': 0}
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_data(cls.volumes)
+        cls.doctor_user = User.objects.get(phone_number=phone_number(0, 0))
+        cls.doctor = Doctor.objects.get(user=cls.doctor_user)
+        cls.patient_user = User.objects.get(phone_number=phone_number(1, 0))
+        cls.staff = User.objects.filter(is_staff=True).first()
+        cls.url = reverse('appointment-schedule')
+        cls.day = cls.doctor.appointments.order_by('appointment_date').first().appointment_date
+
+    def test_staff_without_patient_profile_can_list(self):
+        """Администратор без профиля пациента видит все записи"""
+        self.client.force_authenticate(self.staff)
+        response = self.client.get(reverse('appointment-list'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_doctor_week_schedule(self):
+        """Неделя врача загружается одним запросом и группируется по местам работы"""
+        self.client.force_authenticate(self.doctor_user)
+        # Запрос id врача и запрос записей
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, {'date': self.day.isoformat(), 'period': 'week'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        start = self.day - timedelta(days=self.day.weekday())
+        self.assertEqual(response.data['date_from'], start)
+        self.assertEqual(response.data['date_to'], start + timedelta(days=6))
+
+        expected = Appointment.objects.filter(
+            doctor=self.doctor, appointment_date__range=(start, start + timedelta(days=6))
+        ).count()
+        [group] = response.data['workplaces']
+        self.assertEqual(group['workplace']['id'], self.doctor.workplaces.get().id)
+        self.assertEqual(len(group['appointments']), expected)
+        self.assertIn('name', group['appointments'][0]['patient'])
+
+    def test_staff_day_schedule_for_doctor(self):
+        """Администратор смотрит день выбранного врача"""
+        self.client.force_authenticate(self.staff)
+        response = self.client.get(self.url, {'date': self.day.isoformat(), 'doctor': self.doctor.id})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        dates = {item['appointment_date'] for group in response.data['workplaces'] for item in group['appointments']}
+        self.assertEqual(dates, {self.day.isoformat()})
+
+    def test_schedule_rejects_patients_and_bad_params(self):
+        self.client.force_authenticate(self.patient_user)
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.force_authenticate(self.doctor_user)
+        self.assertEqual(self.client.get(self.url, {'period': 'month'}).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(self.url, {'date': '2025-13-01'}).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(self.url, {'date': date.today().isoformat()}).status_code, status.HTTP_200_OK)
+
+
+class AppointmentListAPITestCase(APITestCase):
+    volumes = {'doctors': 3, 'patients': 2, 'clinics': 2, 'appointments': 60, 'messages': 0}
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_data(cls.volumes)
+        cls.patient_user = User.objects.get(phone_number=phone_number(1, 0))
+        cls.url = reverse('appointment-list')
+
+    def test_compact_list(self):
+        """Список записей пациента загружается двумя запросами независимо от их количества"""
+        self.client.force_authenticate(self.patient_user)
+        # Записи со связями и специализации врачей
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), Appointment.objects.filter(patient__user=self.patient_user).count())
+        item = response.data[0]
+        self.assertEqual(set(item['doctor']), {'id', 'name', 'photo', 'specialties'})
+        self.assertEqual(set(item['patient']), {'id', 'name', 'photo'})
+        self.assertIsInstance(item['workplace'], int)
+        self.assertNotIn('problem_description', item)
+
+    def test_expand_and_fields(self):
+        """?expand= добавляет место работы с клиникой без дополнительных запросов, ?fields= сокращает ответ"""
+        self.client.force_authenticate(self.patient_user)
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, {'expand': 'workplace,cancellation_reason'})
+        self.assertIn('name', response.data[0]['workplace']['clinic'])
+        self.assertIn('cancellation_reason', response.data[0])
+
+        response = self.client.get(self.url, {'fields': 'id,appointment_date'})
+        self.assertEqual(set(response.data[0]), {'id', 'appointment_date'})
@@ -0,0 +1,174 @@
+from datetime import time, timedelta
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from a_base.benchmarks import seed_data
+from a_base.benchmarks.generators import phone_number
+from a_base.models import AppointmentStatus, CancelReason
+from appointments.models import Appointment, WaitlistEntry
+from appointments.statuses import STATUS_UPCOMING
+from appointments.waitlist import expire_offers, waitlist_slot_offered
+from doctors.models import Doctor
+
+User = get_user_model()
+
+
+class WaitlistTestCase(APITestCase):
+    volumes = {'doctors': 1, 'patients': 4, 'clinics': 1, 'appointments': 0, 'messages': 0}
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_data(cls.volumes)
+        cls.doctor = Doctor.objects.get()
+        cls.users = [User.objects.get(phone_number=phone_number(1, index)) for index in range(4)]
+        cls.patients = [user.patient_profile for user in cls.users]
+        cls.day = timezone.localdate() + timedelta(days=1)
+        cls.appointment = Appointment.objects.create(
+            doctor=cls.doctor, patient=cls.patients[0],
+            status=AppointmentStatus.objects.get(name_ru=STATUS_UPCOMING),
+            appointment_date=cls.day, start_time=time(10, 0), end_time=time(10, 30),
+            phone_number=cls.users[0].phone_number,
+        )
+        # Очередь: утреннее окно не подходит, затем два пациента, которым слот подходит
+        cls.morning = cls.join(1, latest_time=time(9, 0))
+        cls.first = cls.join(2, earliest_time=time(9, 0), latest_time=time(12, 0))
+        cls.second = cls.join(3)
+        cls.reason = CancelReason.objects.create(name='Перенос по работе')
+
+    @classmethod
+    def join(cls, index, **window):
+        return WaitlistEntry.objects.create(doctor=cls.doctor, patient=cls.patients[index], date=cls.day, **window)
+
+    def cancel(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.appointment.cancel()
+
+    def refresh(self, *entries):
+        for entry in entries:
+            entry.refresh_from_db()
+
+    def test_cancel_offers_slot_to_first_matching(self):
+        """Отмена записи предлагает слот первому в очереди, кому подходит время"""
+        offered = []
+
+        def receiver(entry, **kwargs):
+            offered.append(entry.pk)
+
+        waitlist_slot_offered.connect(receiver)
+        self.addCleanup(waitlist_slot_offered.disconnect, receiver)
+
+        self.cancel()
+        self.refresh(self.morning, self.first, self.second)
+
+        self.assertEqual(self.morning.status, WaitlistEntry.Status.WAITING)
+        self.assertEqual(self.first.status, WaitlistEntry.Status.OFFERED)
+        self.assertEqual(self.first.offer_start_time, time(10, 0))
+        self.assertEqual(self.second.status, WaitlistEntry.Status.WAITING)
+        self.assertEqual(offered, [self.first.pk])
+
+    def test_cancel_over_api_offers_slot(self):
+        """Отмена через API проходит через Appointment.cancel() и предлагает слот очереди"""
+        self.client.force_authenticate(self.users[0])
+        url = reverse('appointment-cancel', args=[self.appointment.pk])
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(url, {'reason': self.reason.pk})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNotNone(response.data['cancelled_at'])
+        self.refresh(self.first)
+        self.assertEqual(self.first.status, WaitlistEntry.Status.OFFERED)
+
+        self.assertEqual(self.client.post(url, {'reason': self.reason.pk}).status_code, status.HTTP_409_CONFLICT)
+
+    def test_update_does_not_change_status(self):
+        """Статус и время отмены не меняются через update, слот не освобождается в обход листа ожидания"""
+        cancelled = AppointmentStatus.objects.get(name_ru='Отменен')
+        admin = User.objects.create_user(first_name='Админ', date_of_birth='2002-08-08',
+                                         phone_number='+992900009999', password='pass', is_staff=True)
+        self.client.force_authenticate(admin)
+        response = self.client.patch(reverse('appointment-detail', args=[self.appointment.pk]),
+                                     {'status': cancelled.pk, 'cancelled_at': timezone.now().isoformat()})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.appointment.refresh_from_db()
+        self.assertNotEqual(self.appointment.status, cancelled)
+        self.assertIsNone(self.appointment.cancelled_at)
+
+    def test_decline_passes_offer_and_accept_books(self):
+        """После отказа слот получает следующий в очереди, принятие создает запись на прием"""
+        self.cancel()
+
+        self.client.force_authenticate(self.users[2])
+        response = self.client.post(reverse('waitlist-decline', args=[self.first.pk]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status'], WaitlistEntry.Status.WAITING)
+
+        self.client.force_authenticate(self.users[3])
+        response = self.client.post(reverse('waitlist-accept', args=[self.second.pk]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status'], WaitlistEntry.Status.BOOKED)
+
+        booked = Appointment.objects.get(pk=response.data['appointment'])
+        self.assertEqual(booked.patient, self.patients[3])
+        self.assertEqual((booked.appointment_date, booked.start_time), (self.day, time(10, 0)))
+        self.refresh(self.first)
+        self.assertEqual(self.first.status, WaitlistEntry.Status.WAITING)
+
+    def test_expired_offer_moves_to_next(self):
+        """Не подтвержденное вовремя предложение истекает и передается следующему"""
+        self.cancel()
+        self.assertEqual(expire_offers(timezone.now() + timedelta(hours=1)), 1)
+        self.refresh(self.first, self.second)
+
+        self.assertEqual(self.first.status, WaitlistEntry.Status.EXPIRED)
+        self.assertEqual(self.second.status, WaitlistEntry.Status.OFFERED)
+
+        self.client.force_authenticate(self.users[2])
+        response = self.client.post(reverse('waitlist-accept', args=[self.first.pk]))
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
+    def test_taken_slot_keeps_patient_waiting(self):
+        """Если слот заняли в обход очереди, пациент получает 409 и остается в листе ожидания"""
+        self.cancel()
+        Appointment.objects.create(
+            doctor=self.doctor, patient=self.patients[1], status=self.appointment.status,
+            appointment_date=self.day, start_time=time(10, 0), end_time=time(10, 30),
+            phone_number=self.users[1].phone_number,
+        )
+
+        self.client.force_authenticate(self.users[2])
+        response = self.client.post(reverse('waitlist-accept', args=[self.first.pk]))
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.refresh(self.first)
+        self.assertEqual(self.first.status, WaitlistEntry.Status.WAITING)
+
+    def test_overlapping_appointment_blocks_accept(self):
+        """Запись, пересекающая слот с другим временем начала, тоже делает слот занятым"""
+        self.cancel()
+        Appointment.objects.create(
+            doctor=self.doctor, patient=self.patients[1], status=self.appointment.status,
+            appointment_date=self.day, start_time=time(10, 15), end_time=time(10, 45),
+            phone_number=self.users[1].phone_number,
+        )
+
+        self.client.force_authenticate(self.users[2])
+        response = self.client.post(reverse('waitlist-accept', args=[self.first.pk]))
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.refresh(self.first)
+        self.assertEqual(self.first.status, WaitlistEntry.Status.WAITING)
+        self.assertFalse(Appointment.objects.filter(patient=self.patients[2]).exists())
+
+    def test_patient_joins_once_and_sees_own_entries(self):
+        self.client.force_authenticate(self.users[0])
+        data = {'doctor': self.doctor.pk, 'date': self.day.isoformat()}
+        self.assertEqual(self.client.post(reverse('waitlist-list'), data).status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.client.post(reverse('waitlist-list'), data).status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(reverse('waitlist-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+
+        response = self.client.post(reverse('waitlist-accept', args=[self.first.pk]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
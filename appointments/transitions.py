@@ -0,0 +1,75 @@
+"""
+Перевод прошедших записей из статуса "Предстоящий" в "Завершен" или "Пациент не явился".
+
+Записи обрабатываются пачками: id пачки выбираются по индексу (appointment_date, start_time, status)
+вместе с признаком посещения и блокируются до конца транзакции, а статус меняется по id одним UPDATE
+на каждый новый статус. Запись считается завершенной, если по ней есть посещение (ehr.Visit),
+иначе - неявкой. Пока пачка не зафиксирована, другие запросы не могут отменить или перенести
+заблокированную запись или добавить к ней посещение, поэтому статус, результат и события совпадают.
+В транзакции пачки обновляется дневная статистика (appointments.stats), после фиксации отправляется
+appointments_status_changed.
+"""
+from datetime import timedelta
+from functools import partial
+
+from django.db import connection, transaction
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+
+from appointments.models import Appointment
+from appointments.signals import send_status_changed
+from appointments.stats import record_status_change
+from appointments.statuses import STATUS_COMPLETED, STATUS_NO_SHOW, STATUS_UPCOMING, get_status_ids
+from ehr.models import Visit
+
+# Время после окончания приема, за которое врач успевает отметить посещение
+DEFAULT_GRACE = timedelta(minutes=30)
+DEFAULT_BATCH_SIZE = 1000
+
+
+def expired_appointments(now, status_id, grace=DEFAULT_GRACE):
+    """Записи со статусом status_id, которые закончились раньше now - grace"""
+    # Дата и время приема хранятся в местном времени (TIME_ZONE)
+    cutoff = timezone.localtime(now).replace(tzinfo=None) - grace
+    return Appointment.objects.filter(
+        Q(appointment_date__lt=cutoff.date()) | Q(appointment_date=cutoff.date(), end_time__lte=cutoff.time()),
+        status_id=status_id,
+    )
+
+
+def expire_appointments(now=None, grace=DEFAULT_GRACE, batch_size=DEFAULT_BATCH_SIZE):
+    """Переводит прошедшие предстоящие записи в завершенные или неявки. Возвращает {название статуса: количество}."""
+    now = now or timezone.now()
+    statuses = get_status_ids(STATUS_UPCOMING, STATUS_COMPLETED, STATUS_NO_SHOW)
+    result = {STATUS_COMPLETED: 0, STATUS_NO_SHOW: 0}
+    if len(statuses) < 3:
+        return result
+
+    upcoming, completed, no_show = statuses[STATUS_UPCOMING], statuses[STATUS_COMPLETED], statuses[STATUS_NO_SHOW]
+    has_visit = Exists(Visit.objects.filter(appointment=OuterRef('pk')))
+    # Порядок пачек не важен, сортировка по Meta.ordering не нужна
+    expired = expired_appointments(now, upcoming, grace).annotate(has_visit=has_visit).order_by()
+    if connection.features.has_select_for_update_skip_locked:
+        # Записи, заблокированные другим запросом или параллельным запуском, пропускаются
+        expired = expired.select_for_update(skip_locked=True)
+
+    while True:
+        with transaction.atomic():
+            rows = list(expired.values_list('id', 'has_visit')[:batch_size])
+            if not rows:
+                break
+            done = [pk for pk, visited in rows if visited]
+            missed = [pk for pk, visited in rows if not visited]
+            updated_at = timezone.now()
+            for ids, status_id in ((done, completed), (missed, no_show)):
+                if ids:
+                    Appointment.objects.filter(id__in=ids, status_id=upcoming).update(
+                        status_id=status_id, updated_at=updated_at
+                    )
+                    transaction.on_commit(partial(send_status_changed, ids, upcoming, status_id))
+            # UPDATE обходит post_save, дневная статистика обновляется явно в той же транзакции
+            record_status_change([pk for pk, _ in rows], upcoming)
+
+        result[STATUS_COMPLETED] += len(done)
+        result[STATUS_NO_SHOW] += len(missed)
+    return result
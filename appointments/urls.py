@@ -1,13 +1,16 @@
 # urls.py
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import AppointmentViewSet
+from .views import AppointmentViewSet, AppointmentStatsViewSet, ReviewViewSet, WaitlistViewSet
 
 # Создаем экземпляр роутера
 router = DefaultRouter()
 
 # Регистрируем наш ViewSet
 router.register(r'appointments', AppointmentViewSet, basename='appointment')
+router.register(r'waitlist', WaitlistViewSet, basename='waitlist')
+router.register(r'reviews', ReviewViewSet, basename='review')
+router.register(r'appointment-stats', AppointmentStatsViewSet, basename='appointment-stats')
 
 urlpatterns = [
     # Подключаем URL-адреса, которые создал роутер
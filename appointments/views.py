@@ -1,10 +1,33 @@
-from rest_framework import viewsets
-from .serializers import AppointmentSerializer
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from rest_framework import mixins, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+from .serializers import (AppointmentSerializer, AppointmentListSerializer, AppointmentCancelSerializer,
+                          ScheduleAppointmentSerializer, ScheduleWorkplaceSerializer,
+                          WaitlistEntrySerializer, BulkAppointmentSerializer, BulkAppointmentItemSerializer,
+                          BulkAppointmentCreatedSerializer, ReviewSerializer, ReviewCreateSerializer)
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.permissions import IsAuthenticated
-from .models import Appointment
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from .models import Appointment, Review, WaitlistEntry
+from .booking import MAX_BULK_SLOTS, book_appointments
+from . import stats
 from .permissions import IsAdminOrPatientOwner
-from patients.models import Patient
+from .reviews import feed_cache_key
+from .waitlist import OfferError, accept_offer, decline_offer
+from doctors.models import Doctor
+from a_base.cache import get_cache_timeout
+from a_base.serializers.mixins import parse_fields_param
+
+SCHEDULE_PERIODS = ('day', 'week')
+# Период аналитики по умолчанию, дней до сегодняшнего включительно
+STATS_DEFAULT_DAYS = 30
+
 
 class AppointmentViewSet(viewsets.ModelViewSet):
     serializer_class = AppointmentSerializer
@@ -12,12 +35,361 @@ class AppointmentViewSet(viewsets.ModelViewSet):
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['patient']
 
+    # Поля записи из ?expand=: (связь для select_related, загружаемые поля связи)
+    list_expand_related = {
+        'workplace': ('workplace__clinic', (
+            'workplace__clinic', 'workplace__position',
+            *(f'workplace__position_{code}' for code, _ in settings.LANGUAGES),
+        )),
+        'cancellation_reason': ('cancellation_reason', ('cancellation_reason',)),
+    }
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return AppointmentListSerializer
+        if self.action == 'bulk':
+            return BulkAppointmentSerializer
+        if self.action == 'cancel':
+            return AppointmentCancelSerializer
+        return AppointmentSerializer
+
+    def get_permissions(self):
+        if self.action == 'bulk':
+            # Врачи создают записи к себе, права проверяются в get_schedule_doctor_id
+            return [IsAuthenticated()]
+        if self.action == 'cancel':
+            # Пациент отменяет свои записи: чужие не попадают в get_queryset
+            return [IsAuthenticated()]
+        return super().get_permissions()
+
+    def get_list_queryset(self, queryset):
+        """
+        Загружает только то, что выводит AppointmentListSerializer: статус, имена и фото врача и пациента,
+        специализации врача и связи из ?expand=. Длинные тексты врача и приватные поля пользователей
+        не загружаются.
+        """
+        expand = parse_fields_param(self.request.query_params.get('expand', ''))
+        expanded = [self.list_expand_related[name] for name in expand & set(self.list_expand_related)]
+        select = [related for related, _ in expanded]
+        only = [field for _, fields in expanded for field in fields]
+
+        return queryset.select_related('status', 'doctor__user', 'patient__user', *select).only(
+            'id', 'appointment_date', 'start_time', 'end_time', 'workplace_id', 'cancellation_reason_id',
+            'is_another_patient', 'another_patient_name', 'status',
+            'doctor__id', 'doctor__user__first_name', 'doctor__user__last_name',
+            'doctor__user__middle_name', 'doctor__user__profile_picture',
+            'patient__id', 'patient__user__first_name', 'patient__user__last_name',
+            'patient__user__middle_name', 'patient__user__profile_picture', *only,
+        ).prefetch_related('doctor__specialties')
+
     def get_queryset(self):
         """
         Админы видят все записи, пациенты - только свои
         """
         user = self.request.user
-        patient = Patient.objects.get(user=user)
+        queryset = Appointment.objects.all()
+        if self.action == 'list':
+            queryset = self.get_list_queryset(queryset)
         if user.is_staff:
-            return Appointment.objects.all()
-        return Appointment.objects.filter(patient=patient)
\ No newline at end of file
+            return queryset
+        return queryset.filter(patient__user=user)
+
+    def get_schedule_period(self):
+        """Первый и последний день периода из ?date=YYYY-MM-DD&period=day|week (неделя с понедельника)"""
+        period = self.request.query_params.get('period', 'day')
+        if period not in SCHEDULE_PERIODS:
+            raise ValidationError({'period': f'Допустимые значения: {", ".join(SCHEDULE_PERIODS)}'})
+        try:
+            day = date.fromisoformat(self.request.query_params.get('date') or date.today().isoformat())
+        except ValueError:
+            raise ValidationError({'date': 'Дата должна быть в формате YYYY-MM-DD'})
+
+        if period == 'day':
+            return period, day, day
+        start = day - timedelta(days=day.weekday())
+        return period, start, start + timedelta(days=6)
+
+    def get_schedule_doctor_id(self, requested=None):
+        """
+        Врач работает со своим расписанием, администратор - с расписанием врача из ?doctor=
+        (или requested - врача из тела запроса).
+        """
+        user = self.request.user
+        requested = requested or self.request.query_params.get('doctor')
+        if user.is_staff and requested:
+            try:
+                return int(requested)
+            except (TypeError, ValueError):
+                raise ValidationError({'doctor': 'Ожидается id врача'})
+
+        doctor_id = Doctor.objects.filter(user=user).values_list('id', flat=True).first()
+        if doctor_id is None:
+            raise PermissionDenied('Расписание доступно только врачам')
+        return doctor_id
+
+    @action(detail=False, methods=['get'])
+    def schedule(self, request):
+        """
+        Записи врача на день или неделю, сгруппированные по местам работы.
+        Все записи загружаются одним запросом по индексу (doctor, appointment_date, start_time).
+        """
+        period, start, end = self.get_schedule_period()
+        doctor_id = self.get_schedule_doctor_id()
+        appointments = Appointment.objects.filter(
+            doctor_id=doctor_id, appointment_date__range=(start, end)
+        ).select_related(
+            'status', 'patient__user', 'workplace__clinic'
+        ).order_by('appointment_date', 'start_time')
+
+        groups = {}
+        for appointment in appointments:
+            groups.setdefault(appointment.workplace_id, (appointment.workplace, []))[1].append(appointment)
+
+        workplaces = [
+            {
+                'workplace': ScheduleWorkplaceSerializer(workplace).data if workplace else None,
+                'appointments': ScheduleAppointmentSerializer(items, many=True).data,
+            }
+            for workplace, items in groups.values()
+        ]
+        return Response({
+            'doctor': doctor_id,
+            'period': period,
+            'date_from': start,
+            'date_to': end,
+            'workplaces': workplaces,
+        })
+
+    @action(detail=False, methods=['post'])
+    def bulk(self, request):
+        """
+        Пакетная запись к врачу: серия повторных приемов или импорт из системы клиники.
+        Все слоты проверяются по расписанию и существующим записям за один проход и создаются
+        одним bulk_create. Ошибочные элементы не мешают созданию остальных и возвращаются в failed.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        doctor_id = self.get_schedule_doctor_id(serializer.validated_data.get('doctor'))
+        default_workplace = serializer.validated_data.get('workplace')
+
+        items, failed = [], []
+        for index, data in enumerate(serializer.validated_data['items']):
+            item = BulkAppointmentItemSerializer(data=data)
+            if item.is_valid():
+                items.append((index, {'workplace': default_workplace, **item.validated_data}))
+            else:
+                failed.append({'index': index, 'errors': item.errors})
+        if sum(item['repeat_weeks'] for _, item in items) > MAX_BULK_SLOTS:
+            raise ValidationError({'items': f'Не больше {MAX_BULK_SLOTS} приемов в одном запросе'})
+
+        try:
+            created, slot_errors = book_appointments(doctor_id, [item for _, item in items])
+        except IntegrityError:
+            return Response(
+                {'detail': 'Расписание врача изменилось во время записи, повторите запрос'},
+                status=status.HTTP_409_CONFLICT
+            )
+        # Номера элементов в booking считаются по прошедшим проверку формата, возвращаем исходные
+        positions = [index for index, _ in items]
+        for error in slot_errors:
+            error['index'] = positions[error['index']]
+
+        return Response({
+            'created': [
+                {'index': positions[index], **BulkAppointmentCreatedSerializer(appointment).data}
+                for index, appointment in created
+            ],
+            'failed': sorted(failed + slot_errors, key=lambda error: error['index']),
+        }, status=status.HTTP_201_CREATED if created else status.HTTP_400_BAD_REQUEST)
+
+    @action(detail=True, methods=['post'])
+    def cancel(self, request, pk=None):
+        """Отмена записи с причиной. Освободившийся слот предлагается листу ожидания"""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            appointment = self.get_object()
+            appointment = Appointment.objects.select_for_update().get(pk=appointment.pk)
+            try:
+                appointment.cancel(
+                    by_patient=not request.user.is_staff,
+                    reason=serializer.validated_data['reason'],
+                    notes=serializer.validated_data.get('notes'),
+                )
+            except ValueError as e:
+                return Response({'detail': str(e)}, status=status.HTTP_409_CONFLICT)
+        return Response(AppointmentSerializer(appointment, context=self.get_serializer_context()).data)
+
+
+class WaitlistViewSet(mixins.CreateModelMixin, mixins.ListModelMixin, mixins.RetrieveModelMixin,
+                      mixins.DestroyModelMixin, viewsets.GenericViewSet):
+    """
+    Лист ожидания пациента: запись к врачу на дату, принятие и отклонение предложенного слота.
+    Удаление записи листа переводит ее в статус cancelled.
+    """
+    serializer_class = WaitlistEntrySerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        queryset = WaitlistEntry.objects.all()
+        if self.request.user.is_staff:
+            return queryset
+        return queryset.filter(patient__user=self.request.user)
+
+    def perform_create(self, serializer):
+        patient = getattr(self.request.user, 'patient_profile', None)
+        if patient is None:
+            raise PermissionDenied('Лист ожидания доступен только пациентам')
+        try:
+            with transaction.atomic():
+                serializer.save(patient=patient)
+        except IntegrityError:
+            raise ValidationError('Вы уже в листе ожидания к этому врачу на эту дату')
+
+    def perform_destroy(self, instance):
+        if instance.status in WaitlistEntry.ACTIVE_STATUSES:
+            with transaction.atomic():
+                if instance.status == WaitlistEntry.Status.OFFERED:
+                    # Предложенный слот сразу передается следующему в очереди
+                    decline_offer(instance)
+                instance.status = WaitlistEntry.Status.CANCELLED
+                instance.save(update_fields=['status'])
+
+    def get_locked_entry(self):
+        """Запись листа под блокировкой: одно предложение не принимается и не отклоняется дважды"""
+        entry = self.get_object()
+        return WaitlistEntry.objects.select_for_update().get(pk=entry.pk)
+
+    @action(detail=True, methods=['post'])
+    def accept(self, request, pk=None):
+        """Принять предложенный слот: создается запись на прием"""
+        with transaction.atomic():
+            entry = self.get_locked_entry()
+            try:
+                accept_offer(entry)
+            except OfferError as e:
+                # Истекшее предложение при этом уже передано следующему в очереди
+                return Response({'detail': str(e)}, status=status.HTTP_409_CONFLICT)
+        return Response(self.get_serializer(entry).data)
+
+    @action(detail=True, methods=['post'])
+    def decline(self, request, pk=None):
+        """Отказаться от предложенного слота, оставаясь в листе ожидания"""
+        with transaction.atomic():
+            entry = self.get_locked_entry()
+            try:
+                decline_offer(entry)
+            except OfferError as e:
+                return Response({'detail': str(e)}, status=status.HTTP_409_CONFLICT)
+        return Response(self.get_serializer(entry).data)
+
+
+class AppointmentStatsViewSet(viewsets.ViewSet):
+    """
+    Аналитика записей для администраторов: нагрузка по дням, отмены по причинам, неявки.
+    Читает только дневную статистику (AppointmentDailyStats), таблица записей не сканируется.
+    Параметры: ?date_from, ?date_to (по умолчанию последние 30 дней), ?doctor, ?clinic, ?district,
+    ?group=doctor|clinic|district для разрезов.
+    """
+    permission_classes = [IsAdminUser]
+
+    def get_period(self):
+        params = self.request.query_params
+        try:
+            date_to = date.fromisoformat(params['date_to']) if params.get('date_to') else date.today()
+            date_from = (date.fromisoformat(params['date_from']) if params.get('date_from')
+                         else date_to - timedelta(days=STATS_DEFAULT_DAYS - 1))
+        except ValueError:
+            raise ValidationError({'date': 'Дата должна быть в формате YYYY-MM-DD'})
+        if date_from > date_to:
+            raise ValidationError({'date_from': 'Начало периода позже конца'})
+        return date_from, date_to
+
+    def get_filters(self):
+        filters = {}
+        for name in stats.GROUP_FIELDS:
+            value = self.request.query_params.get(name)
+            if value:
+                try:
+                    filters[name] = int(value)
+                except ValueError:
+                    raise ValidationError({name: 'Ожидается id'})
+        return filters
+
+    def get_group(self):
+        group = self.request.query_params.get('group', 'doctor')
+        if group not in stats.GROUP_FIELDS:
+            raise ValidationError({'group': f'Допустимые значения: {", ".join(stats.GROUP_FIELDS)}'})
+        return group
+
+    def respond(self, data):
+        date_from, date_to = self.get_period()
+        return Response({'date_from': date_from, 'date_to': date_to, **data})
+
+    @action(detail=False, methods=['get'])
+    def workload(self, request):
+        """Записей за день: всего, завершено, отменено, неявок"""
+        group = self.get_group()
+        results = stats.workload(group, *self.get_period(), **self.get_filters())
+        return self.respond({'group': group, 'results': results})
+
+    @action(detail=False, methods=['get'])
+    def cancellations(self, request):
+        """Отмены по причинам и их доля от всех записей периода"""
+        return self.respond(stats.cancellation_rates(*self.get_period(), **self.get_filters()))
+
+    @action(detail=False, methods=['get'], url_path='no-shows')
+    def no_shows(self, request):
+        """Доля неявок среди прошедших записей"""
+        group = self.get_group()
+        results = stats.no_show_rates(group, *self.get_period(), **self.get_filters())
+        return self.respond({'group': group, 'results': results})
+
+
+class ReviewFeedPagination(CursorPagination):
+    """Keyset-пагинация ленты отзывов: новые сверху, страница читается по индексу с позиции курсора"""
+    page_size = 20
+    ordering = ('-created_at', '-id')
+
+
+class ReviewViewSet(mixins.CreateModelMixin, mixins.ListModelMixin, viewsets.GenericViewSet):
+    """
+    Отзывы о приемах. POST - отзыв пациента о своем завершенном приеме.
+    GET ?doctor= - лента опубликованных отзывов врача, первая страница кэшируется (см. appointments.reviews).
+    """
+    permission_classes = [IsAuthenticated]
+    pagination_class = ReviewFeedPagination
+    filter_backends = []
+
+    def get_serializer_class(self):
+        if self.action == 'create':
+            return ReviewCreateSerializer
+        return ReviewSerializer
+
+    def get_doctor_id(self):
+        try:
+            return int(self.request.query_params['doctor'])
+        except KeyError:
+            raise ValidationError({'doctor': 'Укажите id врача'})
+        except ValueError:
+            raise ValidationError({'doctor': 'Ожидается id врача'})
+
+    def get_queryset(self):
+        return Review.objects.filter(
+            doctor_id=self.get_doctor_id(), is_published=True
+        ).select_related('appointment__patient__user').only(
+            'id', 'rating', 'comment', 'created_at', 'appointment__patient__user__first_name'
+        )
+
+    def list(self, request, *args, **kwargs):
+        if self.paginator.cursor_query_param in request.query_params:
+            return super().list(request, *args, **kwargs)
+
+        # Ссылка на следующую страницу содержит адрес запроса, поэтому он входит в ключ
+        key = feed_cache_key(self.get_doctor_id(), request.build_absolute_uri())
+        data = cache.get(key)
+        if data is None:
+            response = super().list(request, *args, **kwargs)
+            cache.set(key, response.data, get_cache_timeout())
+            return response
+        return Response(data)
@@ -0,0 +1,176 @@
+"""
+Лист ожидания: освободившийся после отмены слот предлагается ожидающим пациентам по очереди.
+
+- При отмене записи (сигнал appointments_status_changed) слот предлагается первой подходящей записи листа
+  ожидания этого врача на эту дату. Поиск идет по индексу (doctor, date, status, created_at) и возвращает
+  одну строку, весь лист ожидания не просматривается.
+- Предложение действует WAITLIST_HOLD_MINUTES минут. Пациент принимает его (создается запись на прием)
+  или отказывается; при отказе или истечении времени слот предлагается следующей записи в очереди.
+"""
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Q
+from django.dispatch import Signal, receiver
+from django.utils import timezone
+
+from appointments.booking import overlaps
+from appointments.models import Appointment, WaitlistEntry
+from appointments.signals import appointments_status_changed
+from appointments.statuses import STATUS_CANCELLED, STATUS_UPCOMING, get_status_ids
+
+# Слот предложен пациенту. Аргументы: entry - WaitlistEntry в статусе offered.
+waitlist_slot_offered = Signal()
+
+
+class OfferError(Exception):
+    """Предложение нельзя принять: оно истекло или слот уже занят"""
+
+
+def get_hold_time():
+    return timedelta(minutes=getattr(settings, 'WAITLIST_HOLD_MINUTES', 15))
+
+
+def matching_entries(doctor_id, date, start_time, end_time, after=None):
+    """
+    Ожидающие записи листа, которым подходит слот, в порядке очереди.
+    after - запись, после которой продолжается очередь (отказавшийся или не ответивший пациент).
+    """
+    queryset = WaitlistEntry.objects.filter(
+        Q(earliest_time__isnull=True) | Q(earliest_time__lte=start_time),
+        Q(latest_time__isnull=True) | Q(latest_time__gte=end_time),
+        doctor_id=doctor_id, date=date, status=WaitlistEntry.Status.WAITING,
+    )
+    if after is not None:
+        queryset = queryset.filter(
+            Q(created_at__gt=after.created_at) | Q(created_at=after.created_at, id__gt=after.id)
+        )
+    return queryset.order_by('created_at', 'id')
+
+
+def offer_slot(doctor_id, date, start_time, end_time, workplace_id=None, after=None, now=None):
+    """Предлагает слот следующей подходящей записи листа ожидания. Возвращает запись или None."""
+    now = now or timezone.now()
+    with transaction.atomic():
+        entry = matching_entries(doctor_id, date, start_time, end_time, after).select_for_update().first()
+        if entry is None:
+            return None
+        entry.status = WaitlistEntry.Status.OFFERED
+        entry.offer_start_time = start_time
+        entry.offer_end_time = end_time
+        entry.offer_workplace_id = workplace_id
+        entry.offer_expires_at = now + get_hold_time()
+        entry.save(update_fields=[
+            'status', 'offer_start_time', 'offer_end_time', 'offer_workplace', 'offer_expires_at'
+        ])
+        transaction.on_commit(lambda: waitlist_slot_offered.send(sender=WaitlistEntry, entry=entry))
+    return entry
+
+
+def clear_offer(entry, status):
+    """Снимает предложение с записи и переводит ее в status"""
+    entry.status = status
+    entry.offer_start_time = entry.offer_end_time = entry.offer_workplace = entry.offer_expires_at = None
+    entry.save(update_fields=['status', 'offer_start_time', 'offer_end_time', 'offer_workplace', 'offer_expires_at'])
+
+
+def pass_offer(entry, status, now=None):
+    """Снимает предложение с записи (status - новый статус записи) и передает слот следующей в очереди"""
+    slot = (entry.doctor_id, entry.date, entry.offer_start_time, entry.offer_end_time, entry.offer_workplace_id)
+    clear_offer(entry, status)
+    return offer_slot(*slot, after=entry, now=now)
+
+
+def slot_taken(entry):
+    """Предложенный слот пересекается с неотмененной записью врача (та же проверка, что при бронировании)"""
+    busy = Appointment.objects.filter(
+        doctor_id=entry.doctor_id, appointment_date=entry.date, cancelled_at__isnull=True,
+    ).values_list('start_time', 'end_time')
+    return overlaps(entry.offer_start_time, entry.offer_end_time, busy)
+
+
+def accept_offer(entry, now=None):
+    """Создает запись на прием по предложенному слоту. Бросает OfferError, если это уже невозможно."""
+    now = now or timezone.now()
+    if entry.status != WaitlistEntry.Status.OFFERED:
+        raise OfferError('Слот не предложен')
+    if entry.offer_expires_at <= now:
+        pass_offer(entry, WaitlistEntry.Status.EXPIRED, now)
+        raise OfferError('Время на подтверждение истекло')
+
+    if slot_taken(entry):
+        # Слот или его часть заняли в обход листа ожидания, пациент остается в очереди
+        clear_offer(entry, WaitlistEntry.Status.WAITING)
+        raise OfferError('Слот уже занят')
+
+    patient = entry.patient
+    try:
+        with transaction.atomic():
+            appointment = Appointment.objects.create(
+                doctor_id=entry.doctor_id,
+                patient=patient,
+                workplace_id=entry.offer_workplace_id,
+                appointment_date=entry.date,
+                start_time=entry.offer_start_time,
+                end_time=entry.offer_end_time,
+                status_id=get_status_ids(STATUS_UPCOMING)[STATUS_UPCOMING],
+                phone_number=patient.user.phone_number,
+            )
+    except IntegrityError:
+        # Слот заняли параллельно
+        clear_offer(entry, WaitlistEntry.Status.WAITING)
+        raise OfferError('Слот уже занят')
+
+    entry.status = WaitlistEntry.Status.BOOKED
+    entry.appointment = appointment
+    entry.save(update_fields=['status', 'appointment'])
+    return appointment
+
+
+def decline_offer(entry, now=None):
+    """Пациент отказался от слота, но остается в листе ожидания"""
+    if entry.status != WaitlistEntry.Status.OFFERED:
+        raise OfferError('Слот не предложен')
+    return pass_offer(entry, WaitlistEntry.Status.WAITING, now)
+
+
+def expire_offers(now=None):
+    """
+    Истекшие предложения передаются следующим в очереди. Возвращает количество истекших.
+    Каждая запись обрабатывается в своей транзакции под блокировкой: запись, которую сейчас принимает
+    или отклоняет пациент, пропускается, а после блокировки статус и срок предложения проверяются заново.
+    """
+    now = now or timezone.now()
+    ids = list(WaitlistEntry.objects.filter(
+        status=WaitlistEntry.Status.OFFERED, offer_expires_at__lte=now
+    ).order_by('offer_expires_at').values_list('id', flat=True))
+
+    expired = 0
+    for entry_id in ids:
+        with transaction.atomic():
+            queryset = WaitlistEntry.objects.filter(id=entry_id)
+            if connection.features.has_select_for_update_skip_locked:
+                queryset = queryset.select_for_update(skip_locked=True)
+            entry = queryset.first()
+            if entry is None or entry.status != WaitlistEntry.Status.OFFERED or entry.offer_expires_at > now:
+                continue
+            pass_offer(entry, WaitlistEntry.Status.EXPIRED, now)
+        expired += 1
+    return expired
+
+
+@receiver(appointments_status_changed, dispatch_uid='waitlist_offer_cancelled_slots')
+def offer_cancelled_slots(sender, appointment_ids, to_status_id, **kwargs):
+    """Освободившиеся будущие слоты отмененных записей предлагаются листу ожидания"""
+    if to_status_id != get_status_ids(STATUS_CANCELLED).get(STATUS_CANCELLED):
+        return
+
+    now = timezone.now()
+    local_now = timezone.localtime(now).replace(tzinfo=None)
+    slots = Appointment.objects.filter(id__in=appointment_ids).values_list(
+        'doctor_id', 'appointment_date', 'start_time', 'end_time', 'workplace_id'
+    )
+    for doctor_id, date, start_time, end_time, workplace_id in slots:
+        if datetime.combine(date, start_time) > local_now:
+            offer_slot(doctor_id, date, start_time, end_time, workplace_id, now=now)
@@ -0,0 +1,181 @@
+"""
+Нагрузочный сценарий для ChatConsumer: много одновременных авторизованных
+WebSocket-соединений, отправка сообщений с заданной частотой и замер задержек.
+Код не обращается к БД: клиенты (чат, пользователь, токен) подготавливаются заранее.
+"""
+import asyncio
+import json
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+
+import aiohttp
+
+from a_base.benchmarks.runner import percentile
+
+MESSAGE_PREFIX = 'loadtest'
+
+
+@dataclass
+class LoadTestClient:
+    chat_id: int
+    user_id: int
+    token: str
+
+
+def read_rss(pid):
+    """Резидентная память процесса в байтах (Linux, /proc) или None"""
+    try:
+        with open(f'/proc/{pid}/status') as status:
+            for line in status:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def summarize(values_ms):
+    if not values_ms:
+        return None
+    return {
+        'p50_ms': round(percentile(values_ms, 50), 2),
+        'p95_ms': round(percentile(values_ms, 95), 2),
+        'p99_ms': round(percentile(values_ms, 99), 2),
+        'max_ms': round(max(values_ms), 2),
+    }
+
+
+class ChatLoadTest:
+    """
+    Каждый клиент подключается к ws/chat/<chat_id>/?token=..., затем отправляет rate сообщений в секунду
+    в течение duration секунд. Сообщение доставляется всем подключенным участникам чата,
+    включая отправителя, поэтому ожидаемое число доставок считается по числу участников онлайн.
+    """
+
+    def __init__(self, base_url, clients, rate=1.0, duration=30, connect_concurrency=100,
+                 connect_timeout=10, drain=5, server_pid=None, stdout=None):
+        self.base_url = base_url.rstrip('/')
+        self.clients = clients
+        self.rate = rate
+        self.duration = duration
+        self.connect_concurrency = connect_concurrency
+        self.connect_timeout = connect_timeout
+        self.drain = drain
+        self.server_pid = server_pid
+        self.stdout = stdout
+
+        self.connect_latencies = []
+        self.connect_errors = 0
+        self.delivery_latencies = []
+        self.sent = 0
+        self.expected = 0
+        self.received = 0
+        self.online = defaultdict(int)
+
+    def log(self, message):
+        if self.stdout:
+            self.stdout.write(message)
+
+    def url_for(self, client):
+        return f'{self.base_url}/ws/chat/{client.chat_id}/?token={client.token}'
+
+    async def connect(self, session, semaphore, client):
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                ws = await session.ws_connect(self.url_for(client), timeout=self.connect_timeout)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                self.connect_errors += 1
+                return None
+            self.connect_latencies.append((time.perf_counter() - started) * 1000)
+            self.online[client.chat_id] += 1
+            return ws
+
+    async def read(self, ws):
+        async for message in ws:
+            if message.type != aiohttp.WSMsgType.TEXT:
+                continue
+            text = json.loads(message.data).get('message', '')
+            if not text.startswith(MESSAGE_PREFIX):
+                continue
+            sent_at = float(text.rsplit(':', 1)[1])
+            self.delivery_latencies.append((time.perf_counter() - sent_at) * 1000)
+            self.received += 1
+
+    async def send(self, ws, index, client, deadline):
+        interval = 1 / self.rate
+        # Случайный сдвиг, чтобы клиенты не отправляли сообщения одновременно
+        await asyncio.sleep(random.uniform(0, interval))
+        sequence = 0
+        while time.perf_counter() < deadline and not ws.closed:
+            payload = {
+                'message': f'{MESSAGE_PREFIX}:{index}:{sequence}:{time.perf_counter()}',
+                'sender_id': client.user_id,
+            }
+            try:
+                await ws.send_str(json.dumps(payload))
+            except (aiohttp.ClientError, ConnectionError):
+                break
+            self.sent += 1
+            self.expected += self.online[client.chat_id]
+            sequence += 1
+            await asyncio.sleep(interval)
+
+    async def run(self):
+        rss_before = read_rss(self.server_pid) if self.server_pid else None
+        semaphore = asyncio.Semaphore(self.connect_concurrency)
+        connector = aiohttp.TCPConnector(limit=0)
+
+        async with aiohttp.ClientSession(connector=connector) as session:
+            self.log(f'Подключение {len(self.clients)} клиентов...')
+            connections = await asyncio.gather(*(
+                self.connect(session, semaphore, client) for client in self.clients
+            ))
+            connected = [(index, ws) for index, ws in enumerate(connections) if ws is not None]
+            rss_connected = read_rss(self.server_pid) if self.server_pid else None
+            self.log(f'Подключено: {len(connected)}, ошибок: {self.connect_errors}')
+
+            readers = [asyncio.create_task(self.read(ws)) for _, ws in connected]
+            deadline = time.perf_counter() + self.duration
+            self.log(f'Отправка сообщений в течение {self.duration} с...')
+            await asyncio.gather(*(
+                self.send(ws, index, self.clients[index], deadline) for index, ws in connected
+            ))
+
+            # Ждем доставки сообщений, отправленных в конце сценария
+            await asyncio.sleep(self.drain)
+            rss_after = read_rss(self.server_pid) if self.server_pid else None
+
+            await asyncio.gather(*(ws.close() for _, ws in connected), return_exceptions=True)
+            for reader in readers:
+                reader.cancel()
+            await asyncio.gather(*readers, return_exceptions=True)
+
+        return self.report(len(connected), rss_before, rss_connected, rss_after)
+
+    def report(self, connected, rss_before, rss_connected, rss_after):
+        memory = None
+        if rss_before is not None and rss_connected is not None:
+            memory = {
+                'rss_before_mb': round(rss_before / 2 ** 20, 1),
+                'rss_connected_mb': round(rss_connected / 2 ** 20, 1),
+                'rss_after_mb': round(rss_after / 2 ** 20, 1) if rss_after is not None else None,
+                'per_connection_kb': round((rss_connected - rss_before) / max(connected, 1) / 1024, 1),
+            }
+
+        return {
+            'clients': len(self.clients),
+            'connected': connected,
+            'connect_errors': self.connect_errors,
+            'connect_latency': summarize(self.connect_latencies),
+            'rate_per_client': self.rate,
+            'duration_s': self.duration,
+            'sent': self.sent,
+            'expected_deliveries': self.expected,
+            'received': self.received,
+            'dropped': max(self.expected - self.received, 0),
+            'delivery_latency': summarize(self.delivery_latencies),
+            'server_memory': memory,
+        }
@@ -1,12 +1,15 @@
 # doctors/filters.py
 import django_filters
+from doctors.filters import WorkScheduleFilterSet
 from .models import Clinic
 
-class ClinicFilter(django_filters.FilterSet):
+class ClinicFilter(WorkScheduleFilterSet):
     name = django_filters.CharFilter(lookup_expr='icontains') # Поиск по подстроке
     district = django_filters.CharFilter(field_name='district__name', lookup_expr='icontains')
     region = django_filters.CharFilter(field_name='city__region__name', lookup_expr='icontains') 
     clinic_type = django_filters.CharFilter(lookup_expr='exact')
+    # Фильтры расписания: в клинике принимает хотя бы один врач
+    schedule_path = 'workplace__clinic'
 
     class Meta:
         model = Clinic
@@ -1,2 +1,2 @@
 from .clinic_types import ClinicTypeSerializer
-from .clinics import ClinicSerializer
\ No newline at end of file
+from .clinics import ClinicSerializer, ClinicShortSerializer
@@ -1,7 +1,6 @@
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
-from django.utils import translation
 
 from a_base.permissions import ReadOnlyOrAdmin
 from clinics.models import Clinic
@@ -52,9 +51,8 @@ class ClinicViewSet(viewsets.ReadOnlyModelViewSet):
 
     def list(self, request, *args, **kwargs):
         """
-        Список клиник с поддержкой языка из заголовка запроса.
+        Список клиник. Язык ответа определяется RequestLanguageMiddleware.
         """
-        self._activate_language_from_header(request)
         queryset = self.filter_queryset(self.get_queryset())
 
         if not queryset.exists():
@@ -75,8 +73,6 @@ class ClinicViewSet(viewsets.ReadOnlyModelViewSet):
         """
         Детальная информация о клинике с проверкой доступа.
         """
-        self._activate_language_from_header(request)
-        
         try:
             # Получаем queryset с учетом прав доступа
             queryset = self.get_queryset()
@@ -100,11 +96,3 @@ class ClinicViewSet(viewsets.ReadOnlyModelViewSet):
                 {"detail": str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
-
-    def _activate_language_from_header(self, request):
-        """
-        Активирует язык из заголовка запроса.
-        По умолчанию: русский ('ru').
-        """
-        lang = request.META.get('HTTP_ACCEPT_LANGUAGE', 'ru')
-        translation.activate(lang)
\ No newline at end of file
@@ -1,9 +1,54 @@
 from django.contrib import admin
+from django.core.exceptions import PermissionDenied
+from django.http import StreamingHttpResponse
+from django.urls import path
 from django.utils.translation import gettext_lazy as _
+from .exporters import stream_csv
 from .models import (Doctor,
-                     Workplace, Education, DoctorLanguage)
+                     Workplace, Education, DoctorLanguage, WorkplaceSchedule, ScheduleException)
+
+
+def csv_response(queryset=None):
+    response = StreamingHttpResponse(stream_csv(queryset), content_type='text/csv; charset=utf-8')
+    response['Content-Disposition'] = 'attachment; filename="doctors.csv"'
+    return response
+
+
+@admin.register(Doctor)
+class DoctorAdmin(admin.ModelAdmin):
+    actions = ['export_csv']
+
+    def get_urls(self):
+        urls = [
+            path('export/', self.admin_site.admin_view(self.export_view), name='doctors_doctor_export'),
+        ]
+        return urls + super().get_urls()
+
+    def export_view(self, request):
+        """Потоковая выгрузка всех врачей в CSV: /admin/doctors/doctor/export/"""
+        if not self.has_view_permission(request):
+            raise PermissionDenied
+        return csv_response()
+
+    @admin.action(description=_('Выгрузить выбранных врачей в CSV'))
+    def export_csv(self, request, queryset):
+        return csv_response(queryset)
+
+
+class WorkplaceScheduleInline(admin.TabularInline):
+    model = WorkplaceSchedule
+    extra = 0
+
+
+class ScheduleExceptionInline(admin.TabularInline):
+    model = ScheduleException
+    extra = 0
+
+
+@admin.register(Workplace)
+class WorkplaceAdmin(admin.ModelAdmin):
+    inlines = [WorkplaceScheduleInline, ScheduleExceptionInline]
+
 
-admin.site.register(Doctor)
 admin.site.register(DoctorLanguage)
-admin.site.register(Workplace)
 admin.site.register(Education)
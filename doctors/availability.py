@@ -0,0 +1,147 @@
+"""
+Ближайший свободный слот врача.
+
+Слоты строятся по рабочим интервалам мест работы с учетом исключений (Workplace.working_intervals)
+с шагом appointment_interval.
+Слот свободен, если не пересекается с неотмененными записями врача на этот день (записи врача
+в любом месте работы, врач не может принимать в двух местах одновременно).
+Места работы с расписанием и исключениями и записи всех врачей загружаются четырьмя запросами,
+дальше расчет идет в памяти.
+
+Результат хранится в Workplace.next_available_at и Doctor.next_available_at, чтобы списки врачей
+фильтровались и сортировались по нему в SQL. Значения пересчитываются:
+- после изменения записей на прием в пределах горизонта, мест работы, их расписания и исключений
+  (сигналы в doctors.signals, пакетная запись в appointments.booking вызывает schedule_refresh явно);
+- командой refresh_next_available, которая периодически обходит всех врачей: слоты уходят в прошлое,
+  горизонт сдвигается, а изменения через UPDATE сигналов не отправляют.
+"""
+from datetime import datetime, timedelta
+from functools import partial
+
+from django.db import transaction
+from django.db.models import Prefetch
+from django.utils import timezone
+
+from appointments.models import Appointment
+from doctors.models import Doctor, ScheduleException, Workplace
+
+# На сколько дней вперед ищется свободный слот
+DEFAULT_HORIZON_DAYS = 14
+# Врачей в одной пачке пересчета refresh_all
+DEFAULT_BATCH_SIZE = 500
+
+
+def first_free_slot(workplace, day, busy, after):
+    """Начало первого свободного слота места работы в этот день не раньше after или None"""
+    step = timedelta(minutes=workplace.appointment_interval)
+    for interval_start, interval_end in workplace.working_intervals(day):
+        start, end = datetime.combine(day, interval_start), datetime.combine(day, interval_end)
+        while start + step <= end:
+            slot_end = start + step
+            if start >= after and not any(
+                busy_start < slot_end.time() and start.time() < busy_end for busy_start, busy_end in busy
+            ):
+                return start
+            start = slot_end
+    return None
+
+
+def workplace_free_slots(doctors, now=None, horizon_days=DEFAULT_HORIZON_DAYS):
+    """
+    Места работы врачей и ближайшие свободные слоты в них: [(место работы, начало слота в местном времени
+    или None)]. doctors - id врачей или queryset врачей.
+    """
+    local_now = timezone.localtime(now or timezone.now()).replace(tzinfo=None)
+    today = local_now.date()
+    last_day = today + timedelta(days=horizon_days - 1)
+
+    workplaces = list(Workplace.objects.filter(doctor_id__in=doctors).order_by('id').prefetch_related(
+        'schedule',
+        Prefetch('schedule_exceptions', queryset=ScheduleException.objects.filter(
+            date_from__lte=last_day, date_to__gte=today
+        )),
+    ))
+
+    busy = {}
+    for doctor_id, day, start_time, end_time in Appointment.objects.filter(
+        doctor_id__in=doctors, cancelled_at__isnull=True, appointment_date__range=(today, last_day)
+    ).order_by().values_list('doctor_id', 'appointment_date', 'start_time', 'end_time'):
+        busy.setdefault((doctor_id, day), []).append((start_time, end_time))
+
+    result = []
+    for workplace in workplaces:
+        slot = None
+        for offset in range(horizon_days):
+            day = today + timedelta(days=offset)
+            slot = first_free_slot(workplace, day, busy.get((workplace.doctor_id, day), ()), local_now)
+            if slot:
+                break
+        result.append((workplace, slot))
+    return result
+
+
+def next_free_slots(doctors, now=None, horizon_days=DEFAULT_HORIZON_DAYS):
+    """
+    Ближайшие свободные слоты врачей: {id врача: (начало слота в местном времени, id места работы)}.
+    doctors - id врачей или queryset врачей. Врачей без свободных слотов в горизонте нет в результате.
+    """
+    result = {}
+    for workplace, slot in workplace_free_slots(doctors, now, horizon_days):
+        if slot is not None and (slot, workplace.id) < result.get(workplace.doctor_id, (datetime.max, 0)):
+            result[workplace.doctor_id] = (slot, workplace.id)
+    return result
+
+
+def refresh_next_available(doctor_ids, now=None):
+    """
+    Пересчитывает next_available_at мест работы и врачей с этими id. Сохраняются только изменившиеся
+    значения. Возвращает количество врачей, у которых значение изменилось.
+    """
+    nearest = dict.fromkeys(doctor_ids)
+    if not nearest:
+        return 0
+
+    workplaces = []
+    for workplace, slot in workplace_free_slots(list(nearest), now):
+        value = timezone.make_aware(slot) if slot else None
+        if workplace.next_available_at != value:
+            workplace.next_available_at = value
+            workplaces.append(workplace)
+        if value and (nearest[workplace.doctor_id] is None or value < nearest[workplace.doctor_id]):
+            nearest[workplace.doctor_id] = value
+
+    doctors = [
+        Doctor(id=doctor_id, next_available_at=nearest[doctor_id])
+        for doctor_id, current in Doctor.objects.filter(id__in=list(nearest)).values_list('id', 'next_available_at')
+        if current != nearest[doctor_id]
+    ]
+    with transaction.atomic():
+        Workplace.objects.bulk_update(workplaces, ['next_available_at'])
+        Doctor.objects.bulk_update(doctors, ['next_available_at'])
+    return len(doctors)
+
+
+def refresh_all(now=None, batch_size=DEFAULT_BATCH_SIZE):
+    """Пересчитывает всех врачей пачками по id. Возвращает (количество врачей, количество изменившихся)."""
+    now = now or timezone.now()
+    last_id = total = changed = 0
+    while doctor_ids := list(
+        Doctor.objects.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:batch_size]
+    ):
+        changed += refresh_next_available(doctor_ids, now)
+        total += len(doctor_ids)
+        last_id = doctor_ids[-1]
+    return total, changed
+
+
+def in_horizon(day, now=None, horizon_days=DEFAULT_HORIZON_DAYS):
+    """Попадает ли дата в горизонт поиска свободных слотов"""
+    today = timezone.localdate(now)
+    return today <= day < today + timedelta(days=horizon_days)
+
+
+def schedule_refresh(doctor_ids):
+    """Пересчет после фиксации транзакции, когда изменения записей и расписания уже видны"""
+    doctor_ids = set(doctor_ids)
+    if doctor_ids:
+        transaction.on_commit(partial(refresh_next_available, doctor_ids))
@@ -0,0 +1,145 @@
+"""
+Потоковая выгрузка врачей в Excel, CSV или Parquet.
+
+Все связи загружаются prefetch-запросами по пачкам врачей (QuerySet.iterator с chunk_size),
+а строки сразу записываются в файл, поэтому память не растет с количеством врачей.
+"""
+import csv
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from django.db.models import Prefetch
+from openpyxl import Workbook
+
+from doctors.models import Doctor, DoctorLanguage, Education, Workplace
+
+HEADERS = [
+    'ID', 'Фамилия', 'Имя', 'Отчество', 'Номер телефона', 'ИНН', 'Дата рождения', 'Область', 'Район проживания',
+    'Пол', 'Специализации', 'Профессиональный опыт', 'Медицинская категория', 'Ученая степень',
+    'Услуги, которые предоставляет врач', 'Номер лицензии',
+    'Краткое описание деятельности врача и его качеств (рус)',
+    'Краткое описание деятельности врача и его качеств (тадж)',
+    'Рабочий телефон', 'Номер для связи в Whatsapp', 'Номер или никнейм для связи в Telegram',
+    'Email', 'Заслуги и награды (рус)', 'Заслуги и награды (тадж)', 'Владение языками',
+    'Места работы', 'Образование'
+]
+
+EXPORT_FORMATS = ('xlsx', 'csv', 'parquet')
+DEFAULT_CHUNK_SIZE = 500
+
+
+def export_queryset(queryset=None):
+    """Врачи со всеми связями, которые попадают в выгрузку"""
+    if queryset is None:
+        queryset = Doctor.objects.all()
+    return queryset.select_related(
+        'user__district__region', 'user__gender', 'experience_level', 'medical_category', 'academic_degree'
+    ).prefetch_related(
+        'specialties',
+        'services',
+        Prefetch('languages', DoctorLanguage.objects.select_related('language', 'level').order_by('id')),
+        Prefetch('workplaces', Workplace.objects.select_related('clinic__clinic_type').order_by('id')),
+        Prefetch('educations', Education.objects.select_related('university')),
+    ).order_by('id')
+
+
+def doctor_row(doctor):
+    user = doctor.user
+    district = user.district
+    languages = ', '.join(f'{l.language.name_ru} ({l.level.level_ru})' for l in doctor.languages.all())
+    workplaces = ', '.join(
+        f'{w.clinic.name_ru} ({w.clinic.clinic_type.name_ru}) | {w.position_ru} | {w.position_tg}|'
+        for w in doctor.workplaces.all()
+    )
+    educations = ', '.join(
+        f'{e.university.name_ru}|{e.university.city_ru}| ({e.graduation_year})' for e in doctor.educations.all()
+    )
+    return [
+        doctor.id,
+        user.last_name,
+        user.first_name,
+        user.middle_name,
+        user.phone_number,
+        user.inn,
+        user.date_of_birth,
+        district.region.name_ru if district else '',
+        district.name_ru if district else '',
+        user.gender.name_ru if user.gender else '',
+        ', '.join(s.name_ru for s in doctor.specialties.all()),
+        doctor.experience_level.level_ru if doctor.experience_level else '',
+        doctor.medical_category.name_ru if doctor.medical_category else '',
+        doctor.academic_degree.name_ru if doctor.academic_degree else '',
+        ', '.join(s.name_ru for s in doctor.services.all()),
+        doctor.license_number,
+        doctor.about_ru,
+        doctor.about_tg,
+        doctor.work_phone_number,
+        doctor.whatsapp,
+        doctor.telegram,
+        user.email,
+        doctor.titles_and_merits_ru,
+        doctor.titles_and_merits_tg,
+        languages,
+        workplaces,
+        educations,
+    ]
+
+
+def iter_rows(queryset=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Строки выгрузки без заголовка. Связи загружаются отдельно для каждой пачки из chunk_size врачей."""
+    for doctor in export_queryset(queryset).iterator(chunk_size=chunk_size):
+        yield doctor_row(doctor)
+
+
+def write_xlsx(file, rows):
+    """Write-only книга openpyxl: строки сбрасываются на диск, а не хранятся в памяти"""
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title='Врачи')
+    sheet.append(HEADERS)
+    for row in rows:
+        sheet.append(row)
+    workbook.save(file)
+
+
+def write_csv(file, rows):
+    writer = csv.writer(file)
+    writer.writerow(HEADERS)
+    writer.writerows(rows)
+
+
+def write_parquet(path, rows, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Запись в Parquet группами строк по chunk_size: в памяти хранится только текущая группа"""
+    # Все столбцы сохраняются строками, как и в CSV
+    schema = pa.schema([(header, pa.string()) for header in HEADERS])
+    with pq.ParquetWriter(path, schema) as writer:
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) == chunk_size:
+                writer.write_batch(_record_batch(schema, chunk))
+                chunk = []
+        if chunk:
+            writer.write_batch(_record_batch(schema, chunk))
+
+
+def _record_batch(schema, chunk):
+    columns = zip(*chunk)
+    return pa.record_batch(
+        [pa.array([None if value is None else str(value) for value in column], pa.string()) for column in columns],
+        schema=schema,
+    )
+
+
+class Echo:
+    """Файлоподобный объект для csv.writer, который возвращает строку вместо записи"""
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(queryset=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Генератор строк CSV для StreamingHttpResponse. Начинается с BOM, чтобы Excel распознал UTF-8."""
+    writer = csv.writer(Echo())
+    yield '\ufeff' + writer.writerow(HEADERS)
+    for row in iter_rows(queryset, chunk_size):
+        yield writer.writerow(row)
@@ -2,14 +2,77 @@
 import django_filters
 from dateutil.relativedelta import relativedelta
 import datetime
+from django.db.models import Exists, F, OuterRef
+from django.utils import timezone
 from .models.doctors import Doctor
+from .models.schedules import ScheduleException, WorkplaceSchedule
 
-class DoctorFilter(django_filters.FilterSet):
+SCHEDULE_FILTERS = ('work_weekday', 'work_date', 'works_after', 'works_before')
+
+
+class WorkScheduleFilterSet(django_filters.FilterSet):
+    """
+    Фильтры по расписанию мест работы: день недели или дата (без исключений на весь день),
+    работа после и до указанного времени. Все условия проверяются в одном рабочем интервале
+    подзапросом к WorkplaceSchedule по индексам (день недели, время).
+    """
+    # Путь от строки расписания к фильтруемой модели
+    schedule_path = None
+
+    work_weekday = django_filters.TypedChoiceFilter(
+        choices=WorkplaceSchedule.WEEKDAY_CHOICES, coerce=int, method='filter_schedule', label='День недели'
+    )
+    work_date = django_filters.DateFilter(method='filter_schedule', label='Дата приема')
+    works_after = django_filters.TimeFilter(method='filter_schedule', label='Принимает после')
+    works_before = django_filters.TimeFilter(method='filter_schedule', label='Принимает до')
+
+    def filter_schedule(self, queryset, name, value):
+        # Условия расписания применяются вместе в filter_queryset
+        return queryset
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        conditions = {name: self.form.cleaned_data.get(name) for name in SCHEDULE_FILTERS}
+        if all(value in (None, '') for value in conditions.values()):
+            return queryset
+        schedule = self.working_schedule(**conditions)
+        return queryset.filter(Exists(schedule.filter(**{self.schedule_path: OuterRef('pk')})))
+
+    @staticmethod
+    def working_schedule(work_weekday=None, work_date=None, works_after=None, works_before=None):
+        schedule = WorkplaceSchedule.objects.order_by()
+        if work_date:
+            work_weekday = work_date.weekday()
+            schedule = schedule.exclude(Exists(ScheduleException.objects.filter(
+                workplace=OuterRef('workplace'), date_from__lte=work_date, date_to__gte=work_date,
+                start_time__isnull=True,
+            )))
+        if work_weekday not in (None, ''):
+            schedule = schedule.filter(weekday=work_weekday)
+        if works_after:
+            schedule = schedule.filter(end_time__gt=works_after)
+        if works_before:
+            schedule = schedule.filter(start_time__lt=works_before)
+        return schedule
+
+
+class DoctorFilter(WorkScheduleFilterSet):
     specialty = django_filters.CharFilter(field_name='specialty__name', lookup_expr='exact')
     gender = django_filters.CharFilter(field_name='user__gender', lookup_expr='exact')
     min_age = django_filters.NumberFilter(method='filter_min_age', label='Минимальный возраст')
     max_age = django_filters.NumberFilter(method='filter_max_age', label='Максимальный возраст')
     experience_years = django_filters.CharFilter(field_name='experience_years', lookup_expr='icontains')
+    available = django_filters.ChoiceFilter(
+        choices=(('today', 'Сегодня'), ('week', 'В ближайшие 7 дней')),
+        method='filter_available',
+        label='Есть свободный прием'
+    )
+    ordering = django_filters.ChoiceFilter(
+        choices=(('next_available_at', 'Ближайший свободный прием'),),
+        method='filter_ordering',
+        label='Сортировка'
+    )
+    schedule_path = 'workplace__doctor'
 
     def filter_min_age(self, queryset, name, value):
         today = datetime.date.today()
@@ -20,7 +83,17 @@ class DoctorFilter(django_filters.FilterSet):
         today = datetime.date.today()
         birth_date = today - relativedelta(years=value)
         return queryset.filter(user__date_of_birth__gte=birth_date)
+
+    def filter_available(self, queryset, name, value):
+        """Свободный слот до конца сегодняшнего дня или ближайших 7 дней (индекс по next_available_at)"""
+        days = 1 if value == 'today' else 7
+        until = datetime.datetime.combine(timezone.localdate() + datetime.timedelta(days=days), datetime.time())
+        return queryset.filter(next_available_at__lt=timezone.make_aware(until))
+
+    def filter_ordering(self, queryset, name, value):
+        # Врачи без свободных слотов в горизонте поиска в конце списка
+        return queryset.order_by(F(value).asc(nulls_last=True), 'id')
     
     class Meta:
         model = Doctor
-        fields = ['specialty']
\ No newline at end of file
+        fields = ['specialty']
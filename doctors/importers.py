@@ -0,0 +1,780 @@
+"""
+Импорт врачей из Excel-таблицы анкет.
+
+Справочники загружаются в словари один раз, столбцы проверяются и очищаются
+векторно средствами pandas, а пользователи, врачи и связанные записи
+сохраняются пачками через bulk_create. Строки с ошибками не прерывают импорт,
+а попадают в отчет с исходным индексом и причиной.
+
+Для каждой строки сохраняется хэш содержимого (DoctorImportRecord): при повторном
+импорте неизмененные строки пропускаются, а у измененных обновляются только поля,
+зависящие от изменившихся столбцов.
+"""
+import json
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import repeat
+
+import django
+import pandas as pd
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import Group
+from django.db import transaction
+from django.db.models import Q
+
+from a_base.models import (AcademicDegree, District, ExperienceLevel, Gender, Language, LanguageLevel,
+                           MedicalCategory, Service, Specialty, University)
+from clinics.models import Clinic, ClinicType
+from doctors.models import Doctor, DoctorImportRecord, DoctorLanguage, Education, Workplace
+
+User = get_user_model()
+
+COLUMN_MAPPING = {
+    'Фамилия': 'last_name_ru',
+    'Насаб(фамилия)': 'last_name_tg',
+    'Имя': 'first_name_ru',
+    'Ном(имя)': 'first_name_tg',
+    'Отчество': 'middle_name_ru',
+    'Номипадар(отчество)': 'middle_name_tg',
+    'Дата рождения (ДД/ММ/ГГГГ)': 'date_of_birth',
+    'Пол': 'gender',
+    'Район': 'district',
+    'Индивидуальный номер налогоплательщика (ИНН)': 'inn',
+    'Ваш номер телефона для связи с пациентами': 'work_phone_number',
+    'Ваш номер Ватсап для связи с пациентами': 'whatsapp',
+    'Ваш номер Телеграм для связи с пациентами': 'telegram',
+    'Ваш адрес электронной почты': 'email',
+
+    'Образование (название ВУЗа)': 'university_name_ru',
+    'Таҳсилот (номи расмии Донишгоҳ)': 'university_name_tg',
+    'Город,ВУЗа': 'university_city_ru',
+    'Шаҳри Донишгоҳ': 'university_city_tg',
+    'СтранаВУЗа': 'university_country_ru',
+    'Кишвари Донишгоҳ': 'university_country_tg',
+    'Год выпуска (окончания) ВУЗа': 'graduation_year',
+
+    'Профессиональный стаж работы в здравоохранении (количество лет)': 'experience_level',
+    'Специализация по лечебному профилю': 'specialty_ru',
+    'Ихтисос ё самти фаъолият (специализация)': 'specialty_tg',
+    'Медицинская категория': 'medical_category',
+    'Унвони илмӣ ва номзадӣ': 'academic_degree',
+    'Заслуги и награды (Отличник здравоохранения, член-корреспондент Академии медицинских наук, почётный врач и т.д.)': 'title_and_merits_ru',
+    'Унвонҳо ва мукофотҳо (Аълочии тандурустӣ, аъзои Академияи илмҳои тиб ва ғайра). Ҳама намуди унвонҳои доштаатонро дарҷ намоед.': 'title_and_merits_tg',
+    'Напишите коротко о себе (информация, которая будет доступна пациентам)': 'about_ru',
+    'Дар бораи худ мухтасар нависед (маълумоте, ки барои беморон дастрас мешавад)': 'about_tg',
+    'Перечислите три Ваши сильные стороны в работе с пациентами': 'strength_ru',
+    'Лутфан, се ҷиҳати (хусусияти) қавии худро дар вақти муносибат ва корбарӣ бо беморон, номбар кунед.': 'strength_tg',
+
+    'Выберете название своего медицинского учреждения': 'clinic_name_ru',
+    'Номи муассисаи тиббии худро интихоб кунед': 'clinic_name_tg',
+    'Напишите свою текущую должность': 'position_ru',
+    'Вазифаи ҳозираи худро ба пуррагӣ нависед.': 'position_tg',
+
+    'Таджикский': 'lang_tg',
+    'Русский': 'lang_ru',
+    'Узбекский': 'lang_uz',
+    'Английский': 'lang_en',
+    'Кыргызский': 'lang_kg',
+    'Немецкий': 'lang_dt',
+    'Хинди': 'lang_in',
+    'Турецкий': 'lang_tr',
+
+    'Индивидуальная консультация (на своем рабочем месте)': 'Индивидуальная консультация;2',
+    'Онлайн консультация': 'Индивидуальная консультация;3',
+    'Консультация с выездом к пациенту': 'Индивидуальная консультация;1',
+    'Консультация в ночное время': 'Консультация в ночное время;3',
+    'Консультация в выходные и праздничные дни': 'Консультация в выходные и праздничные дни;2',
+    'Выдача рецепта': 'Выдача рецепта;2'
+}
+
+# Столбцы услуг в формате "название услуги;id места оказания услуги"
+SERVICE_COLUMNS = ['Индивидуальная консультация;2', 'Индивидуальная консультация;3', 'Индивидуальная консультация;1',
+                   'Консультация в ночное время;3', 'Консультация в выходные и праздничные дни;2', 'Выдача рецепта;2']
+
+# Столбец уровня владения языком: название языка (name_ru)
+LANGUAGE_COLUMNS = {
+    'lang_tg': 'Таджикский',
+    'lang_ru': 'Русский',
+    'lang_uz': 'Узбекский',
+    'lang_en': 'Английский',
+    'lang_kg': 'Кыргызский',
+    'lang_dt': 'Немецкий',
+    'lang_in': 'Хинди',
+    'lang_tr': 'Турецкий',
+}
+
+PHONE_PATTERN = r'\+992\d{9}'
+INN_PATTERN = r'\d{9}'
+DATE_FORMAT = '%d/%m/%Y'
+MIN_GRADUATION_YEAR = 1900
+MAX_GRADUATION_YEAR = 2025
+NO_MEDICAL_CATEGORY = 'Нет категории'
+SERVICE_PROVIDED = 'Да'
+
+DOCTOR_GROUP = 'Доктор'
+DEFAULT_CLINIC_TYPE_ID = 1
+DEFAULT_CLINIC_ADDRESS = 'Пока без адреса...'
+
+ERROR_INDEX_COLUMN = 'Оригинальный индекс'
+ERROR_REASON_COLUMN = 'Причина ошибки'
+
+SOURCE_COLUMNS = list(COLUMN_MAPPING.values())
+
+# Поле модели: столбцы анкеты, от которых зависит его значение
+USER_FIELD_COLUMNS = {
+    'first_name': ('first_name_ru', 'first_name_tg'),
+    'last_name': ('last_name_ru', 'last_name_tg'),
+    'middle_name': ('middle_name_ru', 'middle_name_tg'),
+    'date_of_birth': ('date_of_birth',),
+    'gender': ('gender',),
+    'district': ('district',),
+    'inn': ('inn',),
+    'email': ('email',),
+}
+DOCTOR_FIELD_COLUMNS = {
+    'experience_level': ('experience_level',),
+    'medical_category': ('medical_category',),
+    'academic_degree': ('academic_degree',),
+    'whatsapp': ('whatsapp',),
+    'telegram': ('telegram',),
+    'about': ('about_ru', 'strength_ru'),
+    'about_ru': ('about_ru', 'strength_ru'),
+    'about_tg': ('about_tg', 'strength_tg'),
+    'titles_and_merits': ('title_and_merits_ru',),
+    'titles_and_merits_ru': ('title_and_merits_ru',),
+    'titles_and_merits_tg': ('title_and_merits_tg',),
+}
+SPECIALTY_COLUMNS = ('specialty_ru', 'specialty_tg')
+WORKPLACE_COLUMNS = ('clinic_name_ru', 'clinic_name_tg', 'position_ru', 'position_tg')
+EDUCATION_COLUMNS = ('university_name_ru', 'university_name_tg', 'university_city_ru', 'university_city_tg',
+                     'university_country_ru', 'university_country_tg', 'graduation_year')
+
+# Состояние строки относительно последнего импорта
+ROW_NEW = 'new'
+ROW_CHANGED = 'changed'
+ROW_UNCHANGED = 'unchanged'
+
+
+def read_excel(path):
+    """Читает анкеты и переименовывает столбцы в короткие ключи"""
+    df = pd.read_excel(path, usecols=COLUMN_MAPPING.keys(), dtype=str)
+    return df.rename(columns=COLUMN_MAPPING)
+
+
+def blank_to_na(series):
+    """Обрезает пробелы, пустые строки и прочерки заменяет на NA"""
+    series = series.astype('string').str.strip()
+    return series.mask(series.isin(['', '-']))
+
+
+def normalize(df):
+    return df.apply(blank_to_na)
+
+
+def row_hashes(source):
+    """Хэш значений столбцов анкеты для каждой строки, 16 шестнадцатеричных символов"""
+    return pd.util.hash_pandas_object(source[SOURCE_COLUMNS], index=False).map('{:016x}'.format)
+
+
+def update_fields(field_columns, changed_columns):
+    """Поля модели, которые зависят от изменившихся столбцов"""
+    return [name for name, columns in field_columns.items() if changed_columns.intersection(columns)]
+
+
+def matches(series, pattern):
+    return series.str.fullmatch(pattern).fillna(False).astype(bool)
+
+
+def join_text(text, extra, prefix):
+    """Добавляет к тексту "о себе" сильные стороны врача"""
+    extra = prefix + extra
+    joined = (text + '\n\n' + extra).fillna(text).fillna(extra)
+    return joined.fillna('').str.strip()
+
+
+def to_records(df):
+    """Строки DataFrame в виде словарей с None вместо NA и обычными типами Python"""
+    df = df.astype(object)
+    return df.where(df.notna(), None).to_dict('records')
+
+
+class RowErrors:
+    """Причины отклонения строк по исходному индексу. Сохраняется первая найденная причина."""
+
+    def __init__(self, index):
+        self.reasons = pd.Series(pd.NA, index=index, dtype='string')
+
+    def reject(self, mask, reason):
+        self.reasons[mask & self.reasons.isna()] = reason
+
+    @property
+    def valid(self):
+        return self.reasons.isna()
+
+    def rejected(self):
+        return self.reasons.dropna()
+
+
+def clean_frame(source, errors):
+    """
+    Векторная очистка и проверка столбцов нормализованной анкеты (см. normalize).
+    Неверные строки отмечаются в errors, исправимые значения (WhatsApp, год выпуска) обнуляются.
+    Проверки зависят только от самой строки, поэтому анкету можно обрабатывать по частям.
+    """
+    df = source.copy()
+
+    valid_phone = matches(df['work_phone_number'], PHONE_PATTERN)
+    errors.reject(~valid_phone, 'Неверный номер телефона')
+
+    df['date_of_birth'] = pd.to_datetime(df['date_of_birth'], format=DATE_FORMAT, errors='coerce').dt.date
+    errors.reject(df['date_of_birth'].isna(), 'Неверная дата рождения')
+
+    errors.reject(df['inn'].notna() & ~matches(df['inn'], INN_PATTERN), 'Неверный ИНН')
+
+    for name in ('first_name', 'last_name', 'middle_name'):
+        df[name] = df[f'{name}_ru'].fillna(df[f'{name}_tg'])
+    errors.reject(df['first_name'].isna(), 'Не указано имя')
+    df['last_name'] = df['last_name'].fillna('')
+
+    df['whatsapp'] = df['whatsapp'].where(matches(df['whatsapp'], PHONE_PATTERN))
+
+    year = pd.to_numeric(df['graduation_year'], errors='coerce').astype('Int64')
+    df['graduation_year'] = year.where(year.between(MIN_GRADUATION_YEAR, MAX_GRADUATION_YEAR))
+
+    df['about_ru'] = join_text(df['about_ru'], df['strength_ru'], 'Мои сильные стороны: ')
+    df['about_tg'] = join_text(df['about_tg'], df['strength_tg'], 'Қувваҳои ман: ')
+    df['title_and_merits_ru'] = df['title_and_merits_ru'].fillna('')
+    df['title_and_merits_tg'] = df['title_and_merits_tg'].fillna('')
+
+    df['medical_category'] = df['medical_category'].mask(df['medical_category'] == NO_MEDICAL_CATEGORY)
+    # Ученая степень записана как "название;", значение "надорам;" означает отсутствие степени
+    df['academic_degree'] = blank_to_na(df['academic_degree'].str.split(';').str[0])
+    return df
+
+
+def reject_duplicates(rows, errors):
+    """Дубликаты внутри файла: остается первая корректная строка"""
+    errors.reject(rows['work_phone_number'].where(errors.valid).duplicated() & errors.valid,
+                  'Номер телефона повторяется в файле')
+    inn = rows['inn'].where(errors.valid)
+    errors.reject(inn.notna() & inn.duplicated(), 'ИНН повторяется в файле')
+
+
+@dataclass
+class References:
+    """Справочники в виде словарей "значение из таблицы -> id" """
+    genders: dict
+    districts: dict
+    experience_levels: dict
+    medical_categories: dict
+    academic_degrees: dict
+    languages: dict
+    language_levels: dict
+    services: dict
+
+    @classmethod
+    def load(cls):
+        return cls(
+            genders=dict(Gender.objects.values_list('name_ru', 'id')),
+            districts=dict(District.objects.values_list('name_ru', 'id')),
+            experience_levels=dict(ExperienceLevel.objects.values_list('level_ru', 'id')),
+            medical_categories=dict(MedicalCategory.objects.values_list('name_ru', 'id')),
+            academic_degrees=dict(AcademicDegree.objects.values_list('name_tg', 'id')),
+            languages=dict(Language.objects.values_list('name_ru', 'id')),
+            language_levels=dict(LanguageLevel.objects.values_list('level_ru', 'id')),
+            services={
+                f'{name};{place_id}': service_id
+                for service_id, name, place_id in Service.objects.values_list('id', 'name_ru', 'service_place_id')
+            },
+        )
+
+
+def map_ids(series, mapping):
+    return series.map(mapping).astype('Int64')
+
+
+def resolve_frame(df, references, errors):
+    """Заменяет значения справочников на id. Обязательные значения без совпадения отклоняют строку."""
+    for column, mapping, reason in (
+        ('gender', references.genders, 'Неверный пол'),
+        ('district', references.districts, 'Неверный район'),
+        ('experience_level', references.experience_levels, 'Неверный уровень опыта'),
+    ):
+        df[f'{column}_id'] = map_ids(df[column], mapping)
+        errors.reject(df[f'{column}_id'].isna(), reason)
+
+    df['medical_category_id'] = map_ids(df['medical_category'], references.medical_categories)
+    df['academic_degree_id'] = map_ids(df['academic_degree'], references.academic_degrees)
+    for column in LANGUAGE_COLUMNS:
+        df[f'{column}_id'] = map_ids(df[column], references.language_levels)
+    return df
+
+
+def prepare_partition(df, references):
+    """
+    Нормализация, очистка, сопоставление со справочниками и хэширование части анкеты.
+    Не обращается к базе данных, поэтому выполняется и в отдельном процессе.
+    Возвращает нормализованные значения, подготовленные строки и причины ошибок.
+    """
+    errors = RowErrors(df.index)
+    source = normalize(df)
+    rows = clean_frame(source, errors)
+    rows = resolve_frame(rows, references, errors)
+    rows['content_hash'] = row_hashes(source)
+    return source, rows, errors.reasons
+
+
+@dataclass
+class ImportResult:
+    created: dict = field(default_factory=dict)
+    updated: dict = field(default_factory=dict)
+    skipped: int = 0
+    # Длительность этапов импорта в секундах
+    timings: dict = field(default_factory=dict)
+    errors: pd.DataFrame = None
+    # Изменения относительно последнего импорта (заполняется в режиме dry_run)
+    diff: pd.DataFrame = None
+
+    def add(self, counter, name, value):
+        counter[name] = counter.get(name, 0) + value
+
+    def summary(self):
+        created = ', '.join(f'{value} {name}' for name, value in self.created.items())
+        updated = ', '.join(f'{value} {name}' for name, value in self.updated.items())
+        return (f'Created: {created or "-"}. Updated: {updated or "-"}. '
+                f'Unchanged: {self.skipped}. Errors: {len(self.errors)}')
+
+
+class ImportCheckpoint:
+    """
+    JSON-файл с индексом последней сохраненной строки.
+    Прерванный импорт того же файла (source_id) продолжается со следующей строки.
+    """
+
+    def __init__(self, path, source_id):
+        self.path = path
+        self.source_id = source_id
+
+    def load(self):
+        try:
+            with open(self.path, encoding='utf-8') as file:
+                state = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if state.get('source_id') != self.source_id:
+            return None
+        return state.get('last_index')
+
+    def save(self, last_index):
+        # Запись через временный файл, чтобы прерывание не оставило поврежденный checkpoint
+        temporary = f'{self.path}.tmp'
+        with open(temporary, 'w', encoding='utf-8') as file:
+            json.dump({'source_id': self.source_id, 'last_index': last_index}, file)
+        os.replace(temporary, self.path)
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class DoctorImporter:
+    """
+    Импорт анкет врачей в несколько проходов:
+    очистка и проверка столбцов, сопоставление со справочниками,
+    создание недостающих клиник, вузов и специальностей,
+    затем пачечная запись пользователей, врачей и их связей.
+    Пользователи сопоставляются по номеру телефона: существующие обновляются.
+
+    full=True обрабатывает все строки, даже не изменившиеся с прошлого импорта.
+    dry_run=True ничего не записывает и возвращает список изменений в result.diff.
+
+    При workers > 1 очистка и сопоставление со справочниками выполняются по частям
+    в пуле процессов, а запись в базу по-прежнему идет пачками из основного процесса.
+    """
+
+    def __init__(self, batch_size=1000, workers=1, stdout=None):
+        self.batch_size = batch_size
+        self.workers = workers
+        self.stdout = stdout
+
+    def log(self, message):
+        if self.stdout:
+            self.stdout.write(message)
+
+    def run(self, df, full=False, dry_run=False, checkpoint=None):
+        result = ImportResult()
+        started = time.perf_counter()
+
+        self.references = References.load()
+        source, rows, errors = self.prepare(df)
+        reject_duplicates(rows, errors)
+        self.reject_foreign_inns(rows, errors)
+        rows = rows[errors.valid]
+        result.errors = self.error_report(df, errors)
+        result.timings['prepare'] = time.perf_counter() - started
+
+        last_index = checkpoint.load() if checkpoint else None
+        if last_index is not None:
+            rows = rows[rows.index > last_index]
+            self.log(f'Продолжение импорта после строки {last_index}')
+
+        source = source.loc[rows.index]
+        status, changed_columns, previous = self.compare_with_previous(
+            source, rows['work_phone_number'], rows['content_hash']
+        )
+        result.skipped = int((status == ROW_UNCHANGED).sum())
+        if dry_run:
+            result.diff = self.diff_report(source, rows['work_phone_number'], status, previous)
+            return result
+
+        rows['source_data'] = to_records(source[SOURCE_COLUMNS])
+        rows['changed_columns'] = changed_columns
+        if full:
+            rows['changed_columns'] = [frozenset(SOURCE_COLUMNS)] * len(rows)
+        else:
+            rows = rows[status != ROW_UNCHANGED]
+        self.log(f'Строк к загрузке: {len(rows)}, без изменений: {result.skipped}, '
+                 f'отклонено: {len(result.errors)}')
+        if rows.empty:
+            if checkpoint:
+                checkpoint.clear()
+            return result
+
+        started = time.perf_counter()
+        with transaction.atomic():
+            rows['clinic_id'] = self.resolve_clinics(rows, result)
+            rows['university_id'] = self.resolve_universities(rows, result)
+            rows['specialty_id'] = self.resolve_specialties(rows, result)
+
+        existing_phones = set(
+            User.objects.filter(phone_number__in=rows['work_phone_number']).values_list('phone_number', flat=True)
+        )
+        self.group = Group.objects.get_or_create(name=DOCTOR_GROUP)[0]
+        for start in range(0, len(rows), self.batch_size):
+            batch = rows.iloc[start:start + self.batch_size]
+            with transaction.atomic():
+                self.write_batch(batch, existing_phones, result)
+            if checkpoint:
+                checkpoint.save(int(batch.index[-1]))
+            self.log(f'Загружено строк: {min(start + self.batch_size, len(rows))}')
+
+        if checkpoint:
+            checkpoint.clear()
+        result.timings['write'] = time.perf_counter() - started
+        return result
+
+    def prepare(self, df):
+        """Подготовка анкеты целиком или частями в пуле процессов"""
+        if self.workers > 1 and len(df) > self.workers:
+            size = math.ceil(len(df) / self.workers)
+            partitions = [df.iloc[start:start + size] for start in range(0, len(df), size)]
+            # initializer нужен для запуска процессов через spawn, где Django еще не настроен
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=django.setup) as pool:
+                prepared = list(pool.map(prepare_partition, partitions, repeat(self.references)))
+        else:
+            prepared = [prepare_partition(df, self.references)]
+
+        errors = RowErrors(df.index)
+        errors.reasons = pd.concat([reasons for _, _, reasons in prepared])
+        return (
+            pd.concat([source for source, _, _ in prepared]),
+            pd.concat([rows for _, rows, _ in prepared]),
+            errors,
+        )
+
+    def compare_with_previous(self, source, keys, hashes):
+        """
+        Сравнивает строки с последним импортом по номеру телефона.
+        Возвращает состояние каждой строки, множество изменившихся столбцов
+        и прежние значения изменившихся строк.
+        """
+        records = list(
+            DoctorImportRecord.objects.filter(source_key__in=keys).values_list('source_key', 'content_hash', 'data')
+        )
+        previous_hashes = {key: content_hash for key, content_hash, _ in records}
+        previous_data = {key: data for key, _, data in records}
+
+        previous_hash = keys.map(previous_hashes)
+        status = pd.Series(ROW_CHANGED, index=source.index)
+        status[previous_hash.isna()] = ROW_NEW
+        status[previous_hash == hashes] = ROW_UNCHANGED
+
+        changed_columns = pd.Series([frozenset(SOURCE_COLUMNS)] * len(source), index=source.index, dtype=object)
+        changed_columns[status == ROW_UNCHANGED] = [frozenset()] * int((status == ROW_UNCHANGED).sum())
+
+        changed = status == ROW_CHANGED
+        previous = pd.DataFrame(
+            [previous_data[key] for key in keys[changed]], index=source.index[changed], columns=SOURCE_COLUMNS
+        )
+        differs = source.loc[changed, SOURCE_COLUMNS].fillna('').ne(previous.astype('string').fillna(''))
+        columns = differs.columns.to_numpy()
+        changed_columns[changed] = [frozenset(columns[mask]) for mask in differs.to_numpy(dtype=bool)]
+        return status, changed_columns, previous
+
+    def diff_report(self, source, keys, status, previous):
+        """Изменения по столбцам: для новых строк одна запись без столбца, для измененных - по записи на столбец"""
+        lines = []
+        for index in status.index[status == ROW_NEW]:
+            lines.append((index, keys[index], ROW_NEW, None, None, None))
+        for index, row in previous.iterrows():
+            for column in SOURCE_COLUMNS:
+                old, new = row[column], source.at[index, column]
+                old = None if pd.isna(old) else old
+                new = None if pd.isna(new) else new
+                if old != new:
+                    lines.append((index, keys[index], ROW_CHANGED, column, old, new))
+        diff = pd.DataFrame(lines, columns=['index', 'key', 'status', 'column', 'old', 'new'])
+        return diff.sort_values('index', kind='stable').reset_index(drop=True)
+
+    def reject_foreign_inns(self, rows, errors):
+        """ИНН уникален: строка отклоняется, если ИНН уже принадлежит пользователю с другим телефоном"""
+        owners = dict(User.objects.filter(inn__in=rows['inn'].dropna()).values_list('inn', 'phone_number'))
+        owner = rows['inn'].map(owners)
+        errors.reject(owner.notna() & (owner != rows['work_phone_number']), 'ИНН принадлежит другому пользователю')
+
+    def resolve_clinics(self, rows, result):
+        """Клиника ищется по названию на русском, затем на таджикском; недостающие создаются"""
+        by_ru = dict(Clinic.objects.filter(name_ru__in=rows['clinic_name_ru'].dropna()).values_list('name_ru', 'id'))
+        by_tg = dict(Clinic.objects.filter(name_tg__in=rows['clinic_name_tg'].dropna()).values_list('name_tg', 'id'))
+        clinic_ids = map_ids(rows['clinic_name_ru'], by_ru).fillna(map_ids(rows['clinic_name_tg'], by_tg))
+
+        missing = rows[clinic_ids.isna() & (rows['clinic_name_ru'].notna() | rows['clinic_name_tg'].notna())]
+        missing = missing.drop_duplicates(['clinic_name_ru', 'clinic_name_tg'])
+        if missing.empty:
+            return clinic_ids
+
+        clinic_type = ClinicType.objects.get(id=DEFAULT_CLINIC_TYPE_ID)
+        Clinic.objects.bulk_create([
+            Clinic(
+                clinic_type=clinic_type,
+                name_ru=row['clinic_name_ru'],
+                name_tg=row['clinic_name_tg'],
+                district_id=row['district_id'],
+                address_ru=DEFAULT_CLINIC_ADDRESS,
+            )
+            for row in to_records(missing)
+        ])
+        result.add(result.created, 'clinics', len(missing))
+
+        by_ru = dict(Clinic.objects.filter(name_ru__in=missing['clinic_name_ru'].dropna()).values_list('name_ru', 'id'))
+        by_tg = dict(Clinic.objects.filter(name_tg__in=missing['clinic_name_tg'].dropna()).values_list('name_tg', 'id'))
+        return clinic_ids.fillna(map_ids(rows['clinic_name_ru'], by_ru)).fillna(map_ids(rows['clinic_name_tg'], by_tg))
+
+    def resolve_universities(self, rows, result):
+        """Вуз ищется по названию на русском или таджикском; недостающие создаются"""
+        names = pd.concat([rows['university_name_ru'], rows['university_name_tg']]).dropna().unique().tolist()
+        known = {}
+        universities = University.objects.filter(Q(name_ru__in=names) | Q(name_tg__in=names))
+        for university_id, name_ru, name_tg in universities.values_list('id', 'name_ru', 'name_tg'):
+            known.setdefault(name_ru, university_id)
+            known.setdefault(name_tg, university_id)
+
+        # Название без перевода на русский сохраняется как есть
+        rows = rows.assign(university_name=rows['university_name_ru'].fillna(rows['university_name_tg']))
+        university_ids = map_ids(rows['university_name_ru'], known).fillna(map_ids(rows['university_name_tg'], known))
+        missing = rows[university_ids.isna() & rows['university_name'].notna()].drop_duplicates('university_name')
+        if missing.empty:
+            return university_ids
+
+        University.objects.bulk_create([
+            University(
+                name=row['university_name'],
+                name_ru=row['university_name_ru'],
+                name_tg=row['university_name_tg'],
+                city=row['university_city_ru'] or '',
+                city_ru=row['university_city_ru'],
+                city_tg=row['university_city_tg'],
+                country=row['university_country_ru'] or '',
+                country_ru=row['university_country_ru'],
+                country_tg=row['university_country_tg'],
+            )
+            for row in to_records(missing)
+        ])
+        result.add(result.created, 'universities', len(missing))
+
+        created = dict(University.objects.filter(name__in=missing['university_name']).values_list('name', 'id'))
+        return university_ids.fillna(map_ids(rows['university_name'], created))
+
+    def resolve_specialties(self, rows, result):
+        """Специальность определяется парой названий на русском и таджикском"""
+        keys = rows['specialty_ru'].fillna('') + ';' + rows['specialty_tg'].fillna('')
+        keys = keys.mask(rows['specialty_ru'].isna() & rows['specialty_tg'].isna())
+
+        def load():
+            return {
+                f'{name_ru or ""};{name_tg or ""}': specialty_id
+                for specialty_id, name_ru, name_tg in Specialty.objects.filter(
+                    Q(name_ru__in=rows['specialty_ru'].dropna()) | Q(name_tg__in=rows['specialty_tg'].dropna())
+                ).values_list('id', 'name_ru', 'name_tg')
+            }
+
+        known = load()
+        missing = rows.assign(key=keys)[keys.notna() & ~keys.isin(known)].drop_duplicates('key')
+        if not missing.empty:
+            Specialty.objects.bulk_create([
+                Specialty(name_ru=row['specialty_ru'], name_tg=row['specialty_tg'])
+                for row in to_records(missing)
+            ])
+            result.add(result.created, 'specialties', len(missing))
+            known = load()
+        return map_ids(keys, known)
+
+    def write_batch(self, rows, existing_phones, result):
+        records = to_records(rows)
+        phones = [row['work_phone_number'] for row in records]
+
+        self.upsert(User, [self.build_user(row) for row in records], records, ['phone_number'], USER_FIELD_COLUMNS)
+        user_ids = dict(User.objects.filter(phone_number__in=phones).values_list('phone_number', 'id'))
+        created_users = sum(phone not in existing_phones for phone in phones)
+        result.add(result.created, 'users', created_users)
+        result.add(result.updated, 'users', len(phones) - created_users)
+
+        existing_doctors = set(Doctor.objects.filter(user_id__in=user_ids.values()).values_list('user_id', flat=True))
+        self.upsert(Doctor, [self.build_doctor(row, user_ids[row['work_phone_number']]) for row in records], records,
+                    ['user'], DOCTOR_FIELD_COLUMNS, extra_fields=['updated_at'])
+        doctor_ids = dict(Doctor.objects.filter(user_id__in=user_ids.values()).values_list('user_id', 'id'))
+        result.add(result.created, 'doctors', len(doctor_ids) - len(existing_doctors))
+        result.add(result.updated, 'doctors', len(existing_doctors))
+
+        # bulk_create не вызывает сигнал post_save, поэтому группа добавляется явно
+        self.bulk_link(User.groups, ((user_id, self.group.id) for user_id in doctor_ids))
+
+        for row in records:
+            row['doctor_id'] = doctor_ids[user_ids[row['work_phone_number']]]
+
+        self.bulk_link(Doctor.specialties, (
+            (row['doctor_id'], row['specialty_id'])
+            for row in self.changed(records, SPECIALTY_COLUMNS) if row['specialty_id']
+        ))
+        self.bulk_link(Doctor.services, (
+            (row['doctor_id'], self.references.services[column])
+            for row in self.changed(records, SERVICE_COLUMNS)
+            for column in SERVICE_COLUMNS
+            if row[column] == SERVICE_PROVIDED and column in self.references.services
+        ))
+
+        languages = [
+            DoctorLanguage(doctor_id=row['doctor_id'], language_id=self.references.languages[name], level_id=row[f'{column}_id'])
+            for row in self.changed(records, LANGUAGE_COLUMNS)
+            for column, name in LANGUAGE_COLUMNS.items()
+            if row[f'{column}_id'] and name in self.references.languages
+        ]
+        DoctorLanguage.objects.bulk_create(
+            languages, update_conflicts=True, unique_fields=['doctor', 'language'], update_fields=['level'],
+        )
+        result.add(result.created, 'languages', len(languages))
+
+        result.add(result.created, 'workplaces', self.create_workplaces(self.changed(records, WORKPLACE_COLUMNS)))
+        result.add(result.created, 'educations', self.create_educations(self.changed(records, EDUCATION_COLUMNS)))
+
+        DoctorImportRecord.objects.bulk_create(
+            [
+                DoctorImportRecord(source_key=row['work_phone_number'], content_hash=row['content_hash'],
+                                   data=row['source_data'], doctor_id=row['doctor_id'])
+                for row in records
+            ],
+            update_conflicts=True, unique_fields=['source_key'],
+            update_fields=['content_hash', 'data', 'doctor', 'imported_at'],
+        )
+
+    def changed(self, records, columns):
+        """Строки, в которых изменился хотя бы один из столбцов"""
+        return [row for row in records if row['changed_columns'].intersection(columns)]
+
+    def upsert(self, model, objects, records, unique_fields, field_columns, extra_fields=()):
+        """
+        Вставка с обновлением только полей, зависящих от изменившихся столбцов строки.
+        Строки группируются по набору таких полей, и каждая группа пишется отдельным запросом:
+        общий набор на всю пачку перезаписал бы поля строк, в которых они не менялись.
+        Группа без полей только вставляет новые строки, существующие не изменяются.
+        """
+        groups = {}
+        for obj, row in zip(objects, records):
+            groups.setdefault(tuple(update_fields(field_columns, row['changed_columns'])), []).append(obj)
+        for fields, group in groups.items():
+            if fields:
+                model.objects.bulk_create(group, update_conflicts=True, unique_fields=unique_fields,
+                                          update_fields=[*fields, *extra_fields])
+            else:
+                model.objects.bulk_create(group, ignore_conflicts=True)
+
+    def build_user(self, row):
+        return User(
+            phone_number=row['work_phone_number'],
+            # Пароль не задается: врач устанавливает его при первом входе
+            password=make_password(None),
+            first_name=row['first_name'],
+            last_name=row['last_name'],
+            middle_name=row['middle_name'],
+            date_of_birth=row['date_of_birth'],
+            gender_id=row['gender_id'],
+            district_id=row['district_id'],
+            inn=row['inn'],
+            email=row['email'],
+        )
+
+    def build_doctor(self, row, user_id):
+        return Doctor(
+            user_id=user_id,
+            experience_level_id=row['experience_level_id'],
+            medical_category_id=row['medical_category_id'],
+            academic_degree_id=row['academic_degree_id'],
+            work_phone_number=row['work_phone_number'],
+            whatsapp=row['whatsapp'],
+            telegram=row['telegram'],
+            about_ru=row['about_ru'],
+            about_tg=row['about_tg'],
+            titles_and_merits_ru=row['title_and_merits_ru'],
+            titles_and_merits_tg=row['title_and_merits_tg'],
+        )
+
+    def bulk_link(self, relation, pairs):
+        """Добавляет строки в промежуточную таблицу M2M-связи, пропуская существующие"""
+        through = relation.through
+        source = f'{relation.field.m2m_field_name()}_id'
+        target = f'{relation.field.m2m_reverse_field_name()}_id'
+        through.objects.bulk_create(
+            [through(**{source: source_id, target: target_id}) for source_id, target_id in set(pairs)],
+            ignore_conflicts=True,
+        )
+
+    def create_workplaces(self, records):
+        """Место работы не имеет уникального ключа, поэтому повторы отсекаются по уже существующим записям"""
+        existing = set(Workplace.objects.filter(doctor_id__in=[row['doctor_id'] for row in records]).values_list(
+            'doctor_id', 'clinic_id', 'position_ru', 'position_tg'))
+        workplaces = {}
+        for row in records:
+            key = (row['doctor_id'], row['clinic_id'], row['position_ru'], row['position_tg'])
+            if row['clinic_id'] and key not in existing:
+                workplaces[key] = Workplace(
+                    doctor_id=row['doctor_id'], clinic_id=row['clinic_id'],
+                    position_ru=row['position_ru'], position_tg=row['position_tg'],
+                )
+        Workplace.objects.bulk_create(workplaces.values())
+        return len(workplaces)
+
+    def create_educations(self, records):
+        existing = set(Education.objects.filter(doctor_id__in=[row['doctor_id'] for row in records]).values_list(
+            'doctor_id', 'university_id', 'graduation_year'))
+        educations = {}
+        for row in records:
+            key = (row['doctor_id'], row['university_id'], row['graduation_year'])
+            if row['university_id'] and row['graduation_year'] and key not in existing:
+                educations[key] = Education(
+                    doctor_id=row['doctor_id'], university_id=row['university_id'],
+                    graduation_year=row['graduation_year'],
+                )
+        Education.objects.bulk_create(educations.values())
+        return len(educations)
+
+    def error_report(self, df, errors):
+        """Отклоненные строки с исходными заголовками, индексом и причиной"""
+        rejected = errors.rejected()
+        report = df.loc[rejected.index].rename(columns={v: k for k, v in COLUMN_MAPPING.items()})
+        report[ERROR_INDEX_COLUMN] = rejected.index
+        report[ERROR_REASON_COLUMN] = rejected.to_numpy()
+        return report
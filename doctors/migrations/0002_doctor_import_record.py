@@ -0,0 +1,29 @@
+# Generated by Django 5.1.6 on 2026-10-19 18:26
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('doctors', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DoctorImportRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source_key', models.CharField(help_text='Рабочий номер телефона врача из анкеты', max_length=13, unique=True, verbose_name='Ключ строки')),
+                ('content_hash', models.CharField(max_length=16, verbose_name='Хэш содержимого')),
+                ('data', models.JSONField(default=dict, verbose_name='Значения строки')),
+                ('imported_at', models.DateTimeField(auto_now=True, verbose_name='Дата импорта')),
+                ('doctor', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='import_records', to='doctors.doctor', verbose_name='Врач')),
+            ],
+            options={
+                'verbose_name': 'Импортированная анкета врача',
+                'verbose_name_plural': 'Импортированные анкеты врачей',
+            },
+        ),
+    ]
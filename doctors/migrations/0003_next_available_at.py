@@ -0,0 +1,23 @@
+# Generated by Django 5.1.6 on 2026-10-19 19:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('doctors', '0002_doctor_import_record'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='doctor',
+            name='next_available_at',
+            field=models.DateTimeField(blank=True, db_index=True, editable=False, help_text='Ближайший свободный слот во всех местах работы, пересчитывается автоматически', null=True, verbose_name='Ближайший свободный слот'),
+        ),
+        migrations.AddField(
+            model_name='workplace',
+            name='next_available_at',
+            field=models.DateTimeField(blank=True, db_index=True, editable=False, help_text='Начало ближайшего свободного приема, пересчитывается автоматически (см. doctors.availability)', null=True, verbose_name='Ближайший свободный слот'),
+        ),
+    ]
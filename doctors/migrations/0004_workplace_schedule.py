@@ -0,0 +1,70 @@
+# Generated by Django 5.1.6 on 2026-10-19 19:18
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+WEEKDAYS = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+
+
+def fill_schedule(apps, schema_editor):
+    """Интервалы расписания из столбцов <день>_start/_end: по одному на рабочий день"""
+    Workplace = apps.get_model('doctors', 'Workplace')
+    WorkplaceSchedule = apps.get_model('doctors', 'WorkplaceSchedule')
+    columns = [f'{name}_{edge}' for name in WEEKDAYS for edge in ('start', 'end')]
+    rows = []
+    for workplace_id, *values in Workplace.objects.order_by('id').values_list('id', *columns).iterator(chunk_size=2000):
+        for weekday in range(len(WEEKDAYS)):
+            start, end = values[2 * weekday], values[2 * weekday + 1]
+            if start is not None and end is not None and start < end:
+                rows.append(WorkplaceSchedule(workplace_id=workplace_id, weekday=weekday, start_time=start, end_time=end))
+        if len(rows) >= 5000:
+            WorkplaceSchedule.objects.bulk_create(rows)
+            rows = []
+    WorkplaceSchedule.objects.bulk_create(rows)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('doctors', '0003_next_available_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScheduleException',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date_from', models.DateField(verbose_name='Первый день')),
+                ('date_to', models.DateField(verbose_name='Последний день')),
+                ('start_time', models.TimeField(blank=True, help_text='Пусто, если место работы не принимает весь день', null=True, verbose_name='Начало')),
+                ('end_time', models.TimeField(blank=True, null=True, verbose_name='Конец')),
+                ('reason', models.CharField(choices=[('holiday', 'Праздник'), ('vacation', 'Отпуск'), ('sick_leave', 'Больничный'), ('other', 'Другое')], default='other', max_length=10, verbose_name='Причина')),
+                ('workplace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='schedule_exceptions', to='doctors.workplace', verbose_name='Место работы')),
+            ],
+            options={
+                'verbose_name': 'Исключение из расписания',
+                'verbose_name_plural': 'Исключения из расписания',
+                'ordering': ['workplace', 'date_from'],
+                'indexes': [models.Index(fields=['workplace', 'date_from', 'date_to'], name='schedule_exception_date_idx')],
+                'constraints': [models.CheckConstraint(condition=models.Q(('date_to__gte', models.F('date_from'))), name='schedule_exception_date_order'), models.CheckConstraint(condition=models.Q(models.Q(('end_time__isnull', True), ('start_time__isnull', True)), ('end_time__gt', models.F('start_time')), _connector='OR'), name='schedule_exception_time_order')],
+            },
+        ),
+        migrations.CreateModel(
+            name='WorkplaceSchedule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('weekday', models.PositiveSmallIntegerField(choices=[(0, 'Понедельник'), (1, 'Вторник'), (2, 'Среда'), (3, 'Четверг'), (4, 'Пятница'), (5, 'Суббота'), (6, 'Воскресенье')], help_text='Номер дня недели: 0 - понедельник, 6 - воскресенье', verbose_name='День недели')),
+                ('start_time', models.TimeField(verbose_name='Начало')),
+                ('end_time', models.TimeField(verbose_name='Конец')),
+                ('workplace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='schedule', to='doctors.workplace', verbose_name='Место работы')),
+            ],
+            options={
+                'verbose_name': 'Рабочий интервал',
+                'verbose_name_plural': 'Расписание мест работы',
+                'ordering': ['workplace', 'weekday', 'start_time'],
+                'indexes': [models.Index(fields=['weekday', 'end_time'], name='schedule_day_end_idx'), models.Index(fields=['weekday', 'start_time'], name='schedule_day_start_idx')],
+                'constraints': [models.CheckConstraint(condition=models.Q(('end_time__gt', models.F('start_time'))), name='workplace_schedule_time_order'), models.CheckConstraint(condition=models.Q(('weekday__lte', 6)), name='workplace_schedule_weekday_range')],
+            },
+        ),
+        migrations.RunPython(fill_schedule, migrations.RunPython.noop),
+    ]
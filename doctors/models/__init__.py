@@ -1,5 +1,6 @@
 from .doc_languages import DoctorLanguage
 from .doctors import Doctor
 from .educations import Education
+from .import_records import DoctorImportRecord
 from .workplaces import Workplace
-
+from .schedules import WorkplaceSchedule, ScheduleException
@@ -123,6 +123,15 @@ class Doctor(models.Model):
         help_text=_("Дата и время последнего обновления записи")
     )
 
+    next_available_at = models.DateTimeField(
+        _("Ближайший свободный слот"),
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=True,
+        help_text=_("Ближайший свободный слот во всех местах работы, пересчитывается автоматически")
+    )
+
     class Meta:
         verbose_name = _("Врач")
         verbose_name_plural = _("Врачи")
@@ -135,4 +144,13 @@ class Doctor(models.Model):
         user_name = self.user.get_full_name or self.user.email
         specialty_names = ", ".join([s.name for s in self.specialties.all()]) if self.specialties.exists() else _("Без специализации")
         academic_degree = self.academic_degree.name if self.academic_degree else _("Без степени")
-        return f"{user_name} ({specialty_names}, {academic_degree})"
\ No newline at end of file
+        return f"{user_name} ({specialty_names}, {academic_degree})"
+
+    @property
+    def primary_clinic(self):
+        """
+        Клиника первого места работы врача.
+        Использует prefetch_related('workplaces__clinic'), если он был выполнен.
+        """
+        workplace = next(iter(self.workplaces.all()), None)
+        return workplace.clinic if workplace else None
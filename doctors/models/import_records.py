@@ -0,0 +1,48 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class DoctorImportRecord(models.Model):
+    """
+    Последняя импортированная версия строки анкеты врача.
+    По хэшу содержимого повторный импорт пропускает неизмененные строки,
+    а по сохраненным значениям определяет, какие столбцы изменились.
+    """
+
+    source_key = models.CharField(
+        max_length=13,
+        unique=True,
+        verbose_name=_("Ключ строки"),
+        help_text=_("Рабочий номер телефона врача из анкеты")
+    )
+
+    content_hash = models.CharField(
+        max_length=16,
+        verbose_name=_("Хэш содержимого")
+    )
+
+    data = models.JSONField(
+        default=dict,
+        verbose_name=_("Значения строки")
+    )
+
+    doctor = models.ForeignKey(
+        "Doctor",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="import_records",
+        verbose_name=_("Врач")
+    )
+
+    imported_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name=_("Дата импорта")
+    )
+
+    class Meta:
+        verbose_name = _("Импортированная анкета врача")
+        verbose_name_plural = _("Импортированные анкеты врачей")
+
+    def __str__(self):
+        return f"{self.source_key} ({self.content_hash})"
@@ -0,0 +1,118 @@
+from django.db import models, transaction
+from django.db.models import F, Q
+
+
+class WorkplaceSchedule(models.Model):
+    """
+    Рабочий интервал места работы в день недели. В один день может быть несколько интервалов
+    (прием с перерывом). Столбцы Workplace.<день>_start/_end хранят границы рабочего дня
+    (начало первого и конец последнего интервала) и синхронизируются с этой таблицей в обе стороны.
+    """
+
+    WEEKDAY_CHOICES = (
+        (0, 'Понедельник'),
+        (1, 'Вторник'),
+        (2, 'Среда'),
+        (3, 'Четверг'),
+        (4, 'Пятница'),
+        (5, 'Суббота'),
+        (6, 'Воскресенье'),
+    )
+
+    workplace = models.ForeignKey(
+        "Workplace",
+        on_delete=models.CASCADE,
+        related_name="schedule",
+        verbose_name="Место работы"
+    )
+    weekday = models.PositiveSmallIntegerField(
+        choices=WEEKDAY_CHOICES,
+        verbose_name="День недели",
+        help_text="Номер дня недели: 0 - понедельник, 6 - воскресенье"
+    )
+    start_time = models.TimeField(verbose_name="Начало")
+    end_time = models.TimeField(verbose_name="Конец")
+
+    class Meta:
+        verbose_name = "Рабочий интервал"
+        verbose_name_plural = "Расписание мест работы"
+        ordering = ['workplace', 'weekday', 'start_time']
+        constraints = [
+            models.CheckConstraint(condition=Q(end_time__gt=F('start_time')), name='workplace_schedule_time_order'),
+            models.CheckConstraint(condition=Q(weekday__lte=6), name='workplace_schedule_weekday_range'),
+        ]
+        indexes = [
+            # Поиск по дню и времени: "работает в субботу после 18:00", "принимает до 9:00"
+            models.Index(fields=['weekday', 'end_time'], name='schedule_day_end_idx'),
+            models.Index(fields=['weekday', 'start_time'], name='schedule_day_start_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.get_weekday_display()} {self.start_time:%H:%M}-{self.end_time:%H:%M}"
+
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            self.workplace.sync_columns()
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            self.workplace.sync_columns()
+        return result
+
+
+class ScheduleException(models.Model):
+    """
+    Период, когда место работы не принимает: праздник, отпуск, больничный.
+    Без времени - нерабочие дни целиком, со временем - интервал без приема в каждый день периода.
+    """
+
+    class Reason(models.TextChoices):
+        HOLIDAY = 'holiday', 'Праздник'
+        VACATION = 'vacation', 'Отпуск'
+        SICK_LEAVE = 'sick_leave', 'Больничный'
+        OTHER = 'other', 'Другое'
+
+    workplace = models.ForeignKey(
+        "Workplace",
+        on_delete=models.CASCADE,
+        related_name="schedule_exceptions",
+        verbose_name="Место работы"
+    )
+    date_from = models.DateField(verbose_name="Первый день")
+    date_to = models.DateField(verbose_name="Последний день")
+    start_time = models.TimeField(
+        null=True,
+        blank=True,
+        verbose_name="Начало",
+        help_text="Пусто, если место работы не принимает весь день"
+    )
+    end_time = models.TimeField(null=True, blank=True, verbose_name="Конец")
+    reason = models.CharField(
+        max_length=10,
+        choices=Reason.choices,
+        default=Reason.OTHER,
+        verbose_name="Причина"
+    )
+
+    class Meta:
+        verbose_name = "Исключение из расписания"
+        verbose_name_plural = "Исключения из расписания"
+        ordering = ['workplace', 'date_from']
+        constraints = [
+            models.CheckConstraint(condition=Q(date_to__gte=F('date_from')), name='schedule_exception_date_order'),
+            models.CheckConstraint(
+                condition=Q(start_time__isnull=True, end_time__isnull=True) | Q(end_time__gt=F('start_time')),
+                name='schedule_exception_time_order'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['workplace', 'date_from', 'date_to'], name='schedule_exception_date_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.get_reason_display()}: {self.date_from} - {self.date_to}"
+
+    def covers(self, day):
+        return self.date_from <= day <= self.date_to
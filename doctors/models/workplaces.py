@@ -1,8 +1,12 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Max, Min
 from clinics.models import Clinic
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils.translation import gettext_lazy as _
 
+# Префиксы полей расписания по номеру дня недели (date.weekday())
+WEEKDAYS = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+
 
 class Workplace(models.Model):
     """
@@ -56,10 +60,88 @@ class Workplace(models.Model):
         help_text="Длительность одного приема пациента в минутах (15-360)"
     )
 
+    next_available_at = models.DateTimeField(
+        verbose_name="Ближайший свободный слот",
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=True,
+        help_text="Начало ближайшего свободного приема, пересчитывается автоматически (см. doctors.availability)"
+    )
+
     class Meta:
         verbose_name = "Место работы"
         verbose_name_plural = "Места работы"
 
+    def working_hours(self, weekday):
+        """(начало, конец) рабочего дня по столбцам расписания или None, если день нерабочий"""
+        start = getattr(self, f'{WEEKDAYS[weekday]}_start')
+        end = getattr(self, f'{WEEKDAYS[weekday]}_end')
+        if start is None or end is None:
+            return None
+        return start, end
+
+    def working_intervals(self, day):
+        """
+        Рабочие интервалы [(начало, конец)] в эту дату по таблице расписания за вычетом исключений.
+        Использует prefetch_related('schedule', 'schedule_exceptions'), если он был выполнен.
+        """
+        intervals = [(row.start_time, row.end_time) for row in self.schedule.all() if row.weekday == day.weekday()]
+        for exception in self.schedule_exceptions.all():
+            if not exception.covers(day):
+                continue
+            if exception.start_time is None:
+                return []
+            intervals = [
+                piece
+                for start, end in intervals
+                for piece in ((start, min(end, exception.start_time)), (max(start, exception.end_time), end))
+                if piece[0] < piece[1]
+            ]
+        return sorted(intervals)
+
+    def schedule_bounds(self):
+        """Границы рабочего дня по таблице расписания: {день недели: (начало, конец)}"""
+        return {
+            weekday: (start, end)
+            for weekday, start, end in self.schedule.order_by().values('weekday').annotate(
+                start=Min('start_time'), end=Max('end_time')
+            ).values_list('weekday', 'start', 'end')
+        }
+
+    def sync_columns(self):
+        """Переносит границы рабочих дней из таблицы расписания в столбцы <день>_start/_end"""
+        bounds = self.schedule_bounds()
+        values = {}
+        for weekday, name in enumerate(WEEKDAYS):
+            values[f'{name}_start'], values[f'{name}_end'] = bounds.get(weekday, (None, None))
+        Workplace.objects.filter(pk=self.pk).update(**values)
+        for field, value in values.items():
+            setattr(self, field, value)
+
+    def sync_schedule(self):
+        """
+        Переносит столбцы расписания в таблицу. Столбцы всегда совпадают с границами интервалов таблицы,
+        поэтому расхождение означает, что день изменили через столбцы: его интервалы заменяются одним.
+        """
+        bounds = self.schedule_bounds()
+        changed = [weekday for weekday in range(len(WEEKDAYS)) if self.working_hours(weekday) != bounds.get(weekday)]
+        if not changed:
+            return
+        self.schedule.filter(weekday__in=changed).delete()
+        self.schedule.model.objects.bulk_create([
+            self.schedule.model(workplace=self, weekday=weekday, start_time=hours[0], end_time=hours[1])
+            for weekday in changed
+            if (hours := self.working_hours(weekday)) and hours[0] < hours[1]
+        ])
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if update_fields is None or any(field.endswith(('_start', '_end')) for field in update_fields):
+                self.sync_schedule()
+
     def __str__(self):
         """
         Возвращает строковое представление места работы.
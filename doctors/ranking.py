@@ -0,0 +1,161 @@
+"""
+Подбор врачей для пациента ("лучшие врачи для меня").
+
+1. Кандидаты отбираются индексированными фильтрами: специализации (таблица связи врача и специализации),
+   языки (DoctorLanguage) и правила доступа DoctorViewSet. Кандидатов не больше MAX_CANDIDATES.
+2. Признаки кандидатов загружаются несколькими запросами с кандидатами в подзапросе: рейтинг и число
+   опубликованных отзывов (индекс отзывов по врачу), координаты клиник мест работы, совпадения
+   специализаций и языков. Ближайший свободный слот читается из Doctor.next_available_at, который
+   поддерживается doctors.availability.
+3. Оценка считается векторно в NumPy: взвешенная сумма нормированных признаков, top-K через argpartition.
+"""
+import math
+
+import numpy as np
+from django.conf import settings
+from django.db.models import Avg, Count, Sum
+from django.utils import timezone
+
+from appointments.models import Review
+from clinics.models import Clinic
+from doctors.models import Doctor, DoctorLanguage, Workplace
+
+MAX_CANDIDATES = 5000
+# Вес признака в итоговой оценке. Признак без входных данных (нет координат пациента,
+# не запрошены специализации или языки) не учитывается.
+DEFAULT_WEIGHTS = {
+    'rating': 0.3,
+    'reviews': 0.1,
+    'distance': 0.2,
+    'availability': 0.2,
+    'specialty': 0.1,
+    'language': 0.1,
+}
+# Число отзывов, при котором рейтинг врача весит столько же, сколько средний рейтинг кандидатов
+RATING_PRIOR_REVIEWS = 5
+# Расстояние (км) и ожидание слота (часы), на которых признак падает в e раз
+DISTANCE_SCALE_KM = 10
+AVAILABILITY_SCALE_HOURS = 72
+EARTH_RADIUS_KM = 6371
+
+
+def get_weights():
+    return {**DEFAULT_WEIGHTS, **getattr(settings, 'DOCTOR_RANKING_WEIGHTS', {})}
+
+
+def district_location(district_id):
+    """Центр района пациента: средние координаты его клиник или None"""
+    if district_id is None:
+        return None
+    location = Clinic.objects.filter(
+        district_id=district_id, latitude__isnull=False, longitude__isnull=False
+    ).aggregate(latitude=Avg('latitude'), longitude=Avg('longitude'))
+    if location['latitude'] is None:
+        return None
+    return location['latitude'], location['longitude']
+
+
+def haversine_km(latitude, longitude, latitudes, longitudes):
+    """Расстояния (км) от точки до массивов координат"""
+    lat1, lon1 = math.radians(latitude), math.radians(longitude)
+    lat2, lon2 = np.radians(latitudes), np.radians(longitudes)
+    a = np.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+def candidates(queryset, specialties=(), languages=()):
+    """Запрос id кандидатов. Используется подзапросом в запросах признаков: длинный список id
+    в IN дорого готовить в ORM на каждом запросе"""
+    if specialties:
+        queryset = queryset.filter(
+            id__in=Doctor.specialties.through.objects.filter(specialty_id__in=specialties).values('doctor_id')
+        )
+    if languages:
+        queryset = queryset.filter(
+            id__in=DoctorLanguage.objects.filter(language_id__in=languages).values('doctor_id')
+        )
+    return queryset.order_by('id').values_list('id', flat=True)[:MAX_CANDIDATES]
+
+
+def rank_doctors(queryset, specialties=(), languages=(), location=None, limit=10, now=None):
+    """
+    Лучшие врачи из queryset. specialties и languages - id, location - (широта, долгота) пациента.
+    Возвращает список словарей {doctor, score, distance_km, next_available_at} по убыванию оценки.
+    """
+    candidate_query = candidates(queryset, specialties, languages)
+    ids = list(candidate_query)
+    if not ids:
+        return []
+    count = len(ids)
+    position = {doctor_id: index for index, doctor_id in enumerate(ids)}
+    now = now or timezone.now()
+
+    rating_sum, reviews = np.zeros(count), np.zeros(count)
+    for doctor_id, total, value_sum in Review.objects.filter(
+        doctor_id__in=candidate_query, is_published=True
+    ).order_by().values('doctor_id').annotate(total=Count('id'), value_sum=Sum('rating')).values_list(
+        'doctor_id', 'total', 'value_sum'
+    ):
+        reviews[position[doctor_id]], rating_sum[position[doctor_id]] = total, value_sum
+
+    distance = np.full(count, np.inf)
+    if location is not None:
+        rows = np.array([
+            (position[doctor_id], latitude, longitude)
+            for doctor_id, latitude, longitude in Workplace.objects.filter(
+                doctor_id__in=candidate_query, clinic__latitude__isnull=False, clinic__longitude__isnull=False
+            ).values_list('doctor_id', 'clinic__latitude', 'clinic__longitude')
+        ]).reshape(-1, 3)
+        if len(rows):
+            # Ближайшая клиника врача
+            np.minimum.at(distance, rows[:, 0].astype(int), haversine_km(*location, rows[:, 1], rows[:, 2]))
+
+    specialty_matches = np.zeros(count)
+    if specialties:
+        for doctor_id, matched in Doctor.specialties.through.objects.filter(
+            doctor_id__in=candidate_query, specialty_id__in=specialties
+        ).order_by().values('doctor_id').annotate(matched=Count('id')).values_list('doctor_id', 'matched'):
+            specialty_matches[position[doctor_id]] = matched
+
+    language_match = np.zeros(count)
+    if languages:
+        spoken = DoctorLanguage.objects.filter(doctor_id__in=candidate_query, language_id__in=languages).values_list(
+            'doctor_id', flat=True
+        )
+        language_match[[position[doctor_id] for doctor_id in set(spoken)]] = 1
+
+    slots = dict(Doctor.objects.filter(
+        id__in=candidate_query, next_available_at__isnull=False
+    ).values_list('id', 'next_available_at'))
+    wait_hours = np.full(count, np.inf)
+    for doctor_id, start in slots.items():
+        # Значение могло устареть до периодического пересчета, прошедший слот считается текущим
+        wait_hours[position[doctor_id]] = max((start - now).total_seconds() / 3600, 0)
+
+    # Рейтинг сглаживается к среднему по кандидатам, чтобы один отзыв "5" не поднимал врача наверх
+    mean_rating = rating_sum.sum() / reviews.sum() if reviews.sum() else 0
+    rating = (rating_sum + mean_rating * RATING_PRIOR_REVIEWS) / (reviews + RATING_PRIOR_REVIEWS)
+    features = {
+        'rating': rating / 5,
+        'reviews': np.log1p(reviews) / np.log1p(reviews.max()) if reviews.max() else reviews,
+        'distance': np.exp(-distance / DISTANCE_SCALE_KM) if location is not None else None,
+        'availability': np.exp(-wait_hours / AVAILABILITY_SCALE_HOURS),
+        'specialty': specialty_matches / len(specialties) if specialties else None,
+        'language': language_match if languages else None,
+    }
+
+    weights = get_weights()
+    score = sum(weights[name] * value for name, value in features.items() if value is not None)
+
+    limit = min(limit, count)
+    top = np.argpartition(-score, limit - 1)[:limit]
+    top = top[np.argsort(-score[top], kind='stable')]
+    return [
+        {
+            'doctor': ids[index],
+            'score': round(float(score[index]), 4),
+            'distance_km': round(float(distance[index]), 1) if np.isfinite(distance[index]) else None,
+            'next_available_at': slots.get(ids[index]),
+        }
+        for index in top
+    ]
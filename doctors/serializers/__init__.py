@@ -2,4 +2,6 @@
 from .doctors import DoctorSerializer, DoctorUpdateSerializer
 from .doc_languages import DoctorLanguageSerializer
 from .educations import EducationSerializer
-from .workplaces import WorkplaceSerializer
\ No newline at end of file
+from .schedules import WorkplaceScheduleSerializer, ScheduleExceptionSerializer
+from .workplaces import WorkplaceSerializer
+from .doctor_cards import DoctorCardSerializer
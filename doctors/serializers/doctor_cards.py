@@ -0,0 +1,31 @@
+from rest_framework import serializers
+from doctors.models import Doctor
+from a_base.serializers import (AcademicDegreeSerializer, SpecialtySerializer, MedicalCategorySerializer,
+                                ServiceSerializer, ExperienceLevelSerializer)
+from a_base.serializers.mixins import SparseFieldsetMixin
+from clinics.serializers import ClinicShortSerializer
+
+
+class DoctorCardSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    """
+    Компактная карточка врача для списков: имя, фото, специализации, рейтинг, клиника
+    и ближайший свободный слот.
+    Поля rating и reviews_count ожидают аннотации queryset (см. DoctorViewSet.get_queryset).
+    """
+    name = serializers.CharField(source='user.get_full_name', read_only=True)
+    photo = serializers.ImageField(source='user.profile_picture', read_only=True)
+    specialties = SpecialtySerializer(many=True, read_only=True)
+    rating = serializers.FloatField(read_only=True)
+    reviews_count = serializers.IntegerField(read_only=True)
+    clinic = ClinicShortSerializer(source='primary_clinic', read_only=True)
+
+    class Meta:
+        model = Doctor
+        fields = ['id', 'name', 'photo', 'specialties', 'rating', 'reviews_count', 'clinic', 'next_available_at']
+        # Поля, которые можно добавить к карточке через ?expand=
+        expandable_fields = {
+            'medical_category': (MedicalCategorySerializer, {}),
+            'academic_degree': (AcademicDegreeSerializer, {}),
+            'experience_level': (ExperienceLevelSerializer, {}),
+            'services': (ServiceSerializer, {'many': True}),
+        }
@@ -4,11 +4,11 @@ from a_base.models import Specialty, MedicalCategory, AcademicDegree, Experience
 from a_base.serializers import (AcademicDegreeSerializer, SpecialtySerializer, MedicalCategorySerializer, 
                                 ServiceSerializer, ExperienceLevelSerializer)
 from core.serializers import CustomUserPublicSerializer, CustomUserPrivateSerializer
+from a_base.serializers.fields import TranslatedField
+from a_base.serializers.mixins import SparseFieldsetMixin
 
-from django.utils import translation
-from django.conf import settings
 
-class DoctorSerializer(serializers.ModelSerializer):
+class DoctorSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     user = CustomUserPrivateSerializer()
     specialties = SpecialtySerializer(many=True, read_only=True)
     medical_category = MedicalCategorySerializer(read_only=True)
@@ -16,9 +16,9 @@ class DoctorSerializer(serializers.ModelSerializer):
     experience_level = ExperienceLevelSerializer(read_only=True)
     services = ServiceSerializer(many=True, read_only=True)
 
-    about = serializers.SerializerMethodField()
-    philosophy = serializers.SerializerMethodField()
-    titles_and_merits = serializers.SerializerMethodField()
+    about = TranslatedField()
+    philosophy = TranslatedField()
+    titles_and_merits = TranslatedField()
     about_ru = serializers.CharField(write_only=True, required=True)
     about_tg = serializers.CharField(write_only=True, required=False)
     philosophy_ru = serializers.CharField(write_only=True, required=True)
@@ -26,21 +26,6 @@ class DoctorSerializer(serializers.ModelSerializer):
     titles_and_merits_ru = serializers.CharField(write_only=True, required=True)
     titles_and_merits_tg = serializers.CharField(write_only=True, required=False)
 
-    def get_about(self, obj):
-        lang = translation.get_language()
-        fallback_lang = settings.FALLBACK_LANGUAGES.get(lang, 'ru')
-        return getattr(obj, f'about_{lang}', getattr(obj, f'about_{fallback_lang}', 'Нет перевода'))
-    
-    def get_philosophy(self, obj):
-        lang = translation.get_language()
-        fallback_lang = settings.FALLBACK_LANGUAGES.get(lang, 'ru')
-        return getattr(obj, f'philosophy_{lang}', getattr(obj, f'philosophy_{fallback_lang}', 'Нет перевода'))
-
-    def get_titles_and_merits(self, obj):
-        lang = translation.get_language()
-        fallback_lang = settings.FALLBACK_LANGUAGES.get(lang, 'ru')
-        return getattr(obj, f'titles_and_merits_{lang}', getattr(obj, f'titles_and_merits_{fallback_lang}', 'Нет перевода'))
-
     specialties_ids = serializers.PrimaryKeyRelatedField(
         queryset=Specialty.objects.all(),
         source='specialties',
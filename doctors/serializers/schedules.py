@@ -0,0 +1,47 @@
+from rest_framework import serializers
+from doctors.models import ScheduleException, WorkplaceSchedule
+
+
+class WorkplaceScheduleSerializer(serializers.ModelSerializer):
+    """Рабочий интервал места работы. Интервалы одного дня не пересекаются."""
+
+    class Meta:
+        model = WorkplaceSchedule
+        fields = ['id', 'workplace', 'weekday', 'start_time', 'end_time']
+
+    def validate(self, attrs):
+        workplace = attrs.get('workplace', getattr(self.instance, 'workplace', None))
+        weekday = attrs.get('weekday', getattr(self.instance, 'weekday', None))
+        start_time = attrs.get('start_time', getattr(self.instance, 'start_time', None))
+        end_time = attrs.get('end_time', getattr(self.instance, 'end_time', None))
+        if end_time <= start_time:
+            raise serializers.ValidationError({'end_time': 'Время окончания должно быть позже начала'})
+
+        overlapping = WorkplaceSchedule.objects.filter(
+            workplace=workplace, weekday=weekday, start_time__lt=end_time, end_time__gt=start_time
+        )
+        if self.instance is not None:
+            overlapping = overlapping.exclude(pk=self.instance.pk)
+        if overlapping.exists():
+            raise serializers.ValidationError({'start_time': 'Интервал пересекается с другим интервалом этого дня'})
+        return attrs
+
+
+class ScheduleExceptionSerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = ScheduleException
+        fields = ['id', 'workplace', 'date_from', 'date_to', 'start_time', 'end_time', 'reason']
+
+    def validate(self, attrs):
+        values = {
+            field: attrs.get(field, getattr(self.instance, field, None))
+            for field in ('date_from', 'date_to', 'start_time', 'end_time')
+        }
+        if values['date_to'] < values['date_from']:
+            raise serializers.ValidationError({'date_to': 'Последний день не может быть раньше первого'})
+        if (values['start_time'] is None) != (values['end_time'] is None):
+            raise serializers.ValidationError({'end_time': 'Укажите начало и конец или оставьте оба пустыми'})
+        if values['start_time'] is not None and values['end_time'] <= values['start_time']:
+            raise serializers.ValidationError({'end_time': 'Время окончания должно быть позже начала'})
+        return attrs
@@ -3,11 +3,13 @@ from rest_framework import serializers
 from doctors.serializers import DoctorSerializer
 from clinics.serializers import ClinicSerializer
 from doctors.models import Workplace
+from doctors.serializers.schedules import WorkplaceScheduleSerializer
 
 
 class WorkplaceSerializer(serializers.ModelSerializer):
     clinic = ClinicSerializer()
     doctor = DoctorSerializer()
+    schedule = WorkplaceScheduleSerializer(many=True, read_only=True)
 
     class Meta:
         model = Workplace
@@ -1,7 +1,9 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.contrib.auth.models import Group
-from .models import Doctor
+from appointments.models import Appointment
+from .availability import in_horizon, schedule_refresh
+from .models import Doctor, ScheduleException, Workplace, WorkplaceSchedule
 
 @receiver(post_save, sender=Doctor)
 def add_doctor_to_group(sender, instance, created, **kwargs):
@@ -12,3 +14,31 @@ def add_doctor_to_group(sender, instance, created, **kwargs):
         group, _ = Group.objects.get_or_create(name="Доктор")
         instance.user.groups.add(group)
 
+
+@receiver(post_save, sender=Appointment, dispatch_uid='doctor_next_available_appointment_saved')
+@receiver(post_delete, sender=Appointment, dispatch_uid='doctor_next_available_appointment_deleted')
+def refresh_after_appointment(sender, instance, raw=False, **kwargs):
+    """
+    Запись на прием в пределах горизонта могла занять или освободить ближайший слот врача.
+    Перенос записи с даты в горизонте за его пределы исправит периодический пересчет.
+    """
+    if not raw and in_horizon(instance.appointment_date):
+        schedule_refresh([instance.doctor_id])
+
+
+@receiver(post_save, sender=Workplace, dispatch_uid='doctor_next_available_workplace_saved')
+@receiver(post_delete, sender=Workplace, dispatch_uid='doctor_next_available_workplace_deleted')
+def refresh_after_workplace(sender, instance, raw=False, **kwargs):
+    """Изменилось расписание врача"""
+    if not raw:
+        schedule_refresh([instance.doctor_id])
+
+
+@receiver(post_save, sender=WorkplaceSchedule, dispatch_uid='doctor_next_available_schedule_saved')
+@receiver(post_delete, sender=WorkplaceSchedule, dispatch_uid='doctor_next_available_schedule_deleted')
+@receiver(post_save, sender=ScheduleException, dispatch_uid='doctor_next_available_exception_saved')
+@receiver(post_delete, sender=ScheduleException, dispatch_uid='doctor_next_available_exception_deleted')
+def refresh_after_schedule(sender, instance, raw=False, **kwargs):
+    """Изменились рабочие интервалы или исключения места работы"""
+    if not raw:
+        schedule_refresh(Workplace.objects.filter(pk=instance.workplace_id).values_list('doctor_id', flat=True))
@@ -1,3 +1,8 @@
 from .doctors.test_models import DoctorModelTestCase
 from .doctors.test_serializers import DoctorSerializerTestCase
-from .doctors.test_views import DoctorViewSetTestCase
\ No newline at end of file
+from .doctors.test_views import DoctorViewSetTestCase
+from .importers.test_importers import DoctorImporterTestCase
+from .exporters.test_exporters import DoctorExporterTestCase
+from .ranking.test_ranking import DoctorRankingTestCase
+from .availability.test_availability import DoctorAvailabilityTestCase
+from .workplaces.test_models import WorkplaceScheduleTestCase
\ No newline at end of file
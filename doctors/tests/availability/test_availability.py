@@ -0,0 +1,112 @@
+from datetime import datetime, time, timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from a_base.benchmarks import seed_data
+from a_base.models import AppointmentStatus, CancelReason
+from appointments.booking import book_appointments
+from appointments.models import Appointment
+from appointments.statuses import STATUS_UPCOMING
+from doctors.availability import refresh_next_available
+from doctors.models import Doctor, Workplace
+from doctors.models.workplaces import WEEKDAYS
+from patients.models import Patient
+
+User = get_user_model()
+
+
+class DoctorAvailabilityTestCase(APITestCase):
+    volumes = {'doctors': 3, 'patients': 1, 'clinics': 1, 'appointments': 0, 'messages': 0}
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_data(cls.volumes)
+        cls.staff = User.objects.filter(is_staff=True).first()
+        cls.patient = Patient.objects.get()
+        cls.doctors = list(Doctor.objects.order_by('id'))
+        cls.doctor = cls.doctors[0]
+        # Единственный рабочий день врача - послезавтра с 8 до 10, чтобы результат не зависел от времени запуска
+        cls.day = timezone.localdate() + timedelta(days=2)
+        cls.workplace = cls.doctor.workplaces.get()
+        for weekday in WEEKDAYS:
+            setattr(cls.workplace, f'{weekday}_start', None)
+            setattr(cls.workplace, f'{weekday}_end', None)
+        setattr(cls.workplace, f'{WEEKDAYS[cls.day.weekday()]}_start', time(8))
+        setattr(cls.workplace, f'{WEEKDAYS[cls.day.weekday()]}_end', time(10))
+        cls.workplace.save()
+        refresh_next_available([cls.doctor.pk])
+
+    def slot(self, hour, minute=0, weeks=0):
+        return timezone.make_aware(datetime.combine(self.day + timedelta(weeks=weeks), time(hour, minute)))
+
+    def book(self, hour, minute=0):
+        return Appointment.objects.create(
+            doctor=self.doctor, patient=self.patient, workplace=self.workplace,
+            status=AppointmentStatus.objects.get(name_ru=STATUS_UPCOMING),
+            appointment_date=self.day, start_time=time(hour, minute),
+            end_time=time(hour, minute + 30), phone_number=self.patient.user.phone_number,
+        )
+
+    def assertNextAvailable(self, value):
+        self.doctor.refresh_from_db()
+        self.workplace.refresh_from_db()
+        self.assertEqual(self.doctor.next_available_at, value)
+        self.assertEqual(self.workplace.next_available_at, value)
+
+    def test_appointments_update_next_available(self):
+        """Запись занимает ближайший слот, отмена его освобождает"""
+        self.assertNextAvailable(self.slot(8))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            appointment = self.book(8)
+        self.assertNextAvailable(self.slot(8, 30))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            appointment.cancel(reason=CancelReason.objects.create(name='Передумал'))
+        self.assertNextAvailable(self.slot(8))
+
+    def test_bulk_booking_and_schedule_change(self):
+        items = [{'patient': self.patient.pk, 'appointment_date': self.day, 'start_time': time(8, minute)}
+                 for minute in (0, 30)]
+        with self.captureOnCommitCallbacks(execute=True):
+            book_appointments(self.doctor.pk, items)
+        self.assertNextAvailable(self.slot(9))
+
+        # Рабочий день сокращен, все его слоты заняты: ближайший прием через неделю
+        with self.captureOnCommitCallbacks(execute=True):
+            setattr(self.workplace, f'{WEEKDAYS[self.day.weekday()]}_end', time(9))
+            self.workplace.save()
+        self.assertNextAvailable(self.slot(8, weeks=1))
+
+    def test_list_filters_and_ordering(self):
+        today = timezone.localdate()
+        tomorrow = timezone.make_aware(datetime.combine(today + timedelta(days=1), time(12)))
+        Doctor.objects.filter(pk=self.doctors[1].pk).update(next_available_at=tomorrow)
+        Doctor.objects.filter(pk=self.doctors[2].pk).update(next_available_at=None)
+        self.client.force_authenticate(self.staff)
+        url = reverse('doctor-list')
+
+        response = self.client.get(url, {'available': 'week', 'ordering': 'next_available_at'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([card['id'] for card in response.data], [self.doctors[1].pk, self.doctor.pk])
+
+        response = self.client.get(url, {'available': 'today'})
+        self.assertEqual(response.data, [])
+
+        response = self.client.get(url, {'ordering': 'next_available_at'})
+        self.assertEqual([card['id'] for card in response.data][-1], self.doctors[2].pk)
+
+    def test_refresh_command(self):
+        Doctor.objects.update(next_available_at=None)
+        Workplace.objects.update(next_available_at=None)
+        out = StringIO()
+        call_command('refresh_next_available', '--batch-size', '2', stdout=out)
+
+        self.assertIn('Врачей: 3', out.getvalue())
+        self.assertNextAvailable(self.slot(8))
@@ -241,4 +241,33 @@ class DoctorViewSetTestCase(APITestCase):
         # Редактирование запрещено
         update_data = {'about': 'Попытка изменения'}
         response = self.api_client.patch(self.detail_url, update_data)
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
\ No newline at end of file
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_list_returns_cards(self):
+        """Список врачей отдает компактные карточки без приватных данных"""
+        self.api_client.force_authenticate(user=self.admin)
+
+        response = self.api_client.get(self.list_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        card = next(item for item in response.data if item['id'] == self.doctor1.id)
+        self.assertEqual(
+            set(card),
+            {'id', 'name', 'photo', 'specialties', 'rating', 'reviews_count', 'clinic', 'next_available_at'}
+        )
+        self.assertEqual(card['name'], 'Иванов Доктор')
+        self.assertEqual(card['reviews_count'], 0)
+        self.assertIsNone(card['clinic'])
+
+        # Детальная информация по-прежнему полная
+        response = self.api_client.get(self.detail_url)
+        self.assertIn('user', response.data)
+
+    def test_list_sparse_fieldsets(self):
+        """Параметры fields и expand управляют составом карточки"""
+        self.api_client.force_authenticate(user=self.admin)
+
+        response = self.api_client.get(self.list_url, {'fields': 'id,name'})
+        self.assertEqual(set(response.data[0]), {'id', 'name'})
+
+        response = self.api_client.get(self.list_url, {'fields': 'id', 'expand': 'services'})
+        self.assertEqual(set(response.data[0]), {'id', 'services'})
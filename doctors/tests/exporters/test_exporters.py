@@ -0,0 +1,110 @@
+import csv
+import io
+import os
+import tempfile
+
+import pyarrow.parquet as pq
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from openpyxl import load_workbook
+
+from a_base.models import District, Language, LanguageLevel, Region, Specialty, University
+from clinics.models import Clinic, ClinicType
+from doctors.exporters import HEADERS, iter_rows, write_csv, write_parquet, write_xlsx
+from doctors.models import Doctor, DoctorLanguage, Education, Workplace
+
+User = get_user_model()
+
+
+class DoctorExporterTestCase(TestCase):
+    def setUp(self):
+        region = Region.objects.create(name_ru='Согд')
+        self.district = District.objects.create(name_ru='Худжанд', region=region)
+        self.clinic = Clinic.objects.create(
+            name_ru='Городская больница', clinic_type=ClinicType.objects.create(name_ru='Поликлиника'),
+            district=self.district, address_ru='Адрес'
+        )
+        self.specialty = Specialty.objects.create(name_ru='Кардиология')
+        self.university = University.objects.create(name_ru='ТГМУ', city_ru='Душанбе', country_ru='Таджикистан')
+        self.language = Language.objects.create(name_ru='Русский')
+        self.level = LanguageLevel.objects.create(level_ru='Свободно')
+        for index in range(3):
+            self.create_doctor(index)
+
+    def create_doctor(self, index):
+        user = User.objects.create_user(
+            phone_number=f'+99290000000{index}', password='pass', first_name='Иван', last_name=f'Иванов {index}',
+            date_of_birth='1980-01-01', district=self.district,
+        )
+        doctor = Doctor.objects.create(user=user, about_ru='О себе')
+        doctor.specialties.add(self.specialty)
+        DoctorLanguage.objects.create(doctor=doctor, language=self.language, level=self.level)
+        Workplace.objects.create(doctor=doctor, clinic=self.clinic, position_ru='Кардиолог')
+        Education.objects.create(doctor=doctor, university=self.university, graduation_year=2005)
+        return doctor
+
+    def test_rows_contain_related_data(self):
+        row = dict(zip(HEADERS, next(iter_rows())))
+
+        self.assertEqual(row['Фамилия'], 'Иванов 0')
+        self.assertEqual(row['Район проживания'], 'Худжанд')
+        self.assertEqual(row['Специализации'], 'Кардиология')
+        self.assertEqual(row['Владение языками'], 'Русский (Свободно)')
+        self.assertIn('Городская больница (Поликлиника) | Кардиолог', row['Места работы'])
+        self.assertEqual(row['Образование'], 'ТГМУ|Душанбе| (2005)')
+
+    def test_query_count_does_not_depend_on_doctor_count(self):
+        # Врачи и по одному запросу на каждую prefetch-связь
+        with self.assertNumQueries(6):
+            self.assertEqual(len(list(iter_rows())), 3)
+
+        for index in range(3, 6):
+            self.create_doctor(index)
+        with self.assertNumQueries(6):
+            self.assertEqual(len(list(iter_rows())), 6)
+
+    def test_write_csv_and_xlsx(self):
+        csv_file = io.StringIO()
+        write_csv(csv_file, iter_rows())
+        csv_rows = list(csv.reader(io.StringIO(csv_file.getvalue())))
+        self.assertEqual(csv_rows[0], HEADERS)
+        self.assertEqual(len(csv_rows), 4)
+
+        xlsx_file = io.BytesIO()
+        write_xlsx(xlsx_file, iter_rows())
+        sheet = load_workbook(xlsx_file).active
+        self.assertEqual(sheet.max_row, 4)
+        self.assertEqual(sheet.cell(row=2, column=2).value, 'Иванов 0')
+
+    def test_write_parquet_in_row_groups(self):
+        path = os.path.join(tempfile.mkdtemp(), 'doctors.parquet')
+        write_parquet(path, iter_rows(), chunk_size=2)
+
+        parquet = pq.ParquetFile(path)
+        self.assertEqual(parquet.schema_arrow.names, HEADERS)
+        self.assertEqual(parquet.metadata.num_row_groups, 2)
+        table = parquet.read().to_pylist()
+        self.assertEqual([row['Фамилия'] for row in table], ['Иванов 0', 'Иванов 1', 'Иванов 2'])
+        self.assertEqual(table[0]['ID'], str(Doctor.objects.order_by('id').first().id))
+        self.assertEqual(table[0]['Образование'], 'ТГМУ|Душанбе| (2005)')
+
+    def test_export_command_parquet(self):
+        directory = tempfile.mkdtemp()
+        with override_settings(BASE_DIR=directory):
+            call_command('export_data', filename='doctors.parquet', stdout=io.StringIO())
+
+        self.assertEqual(pq.read_table(os.path.join(directory, 'doctors.parquet')).num_rows, 3)
+
+    def test_admin_streaming_download(self):
+        admin = User.objects.create_superuser(phone_number='+992999999999', password='pass', first_name='Admin',
+                                              date_of_birth='1990-01-01')
+        self.client.force_login(admin)
+
+        response = self.client.get(reverse('admin:doctors_doctor_export'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        content = b''.join(response.streaming_content).decode('utf-8-sig')
+        self.assertEqual(len(list(csv.reader(io.StringIO(content)))), 4)
@@ -0,0 +1,207 @@
+import os
+import tempfile
+
+import pandas as pd
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from a_base.models import (AcademicDegree, District, ExperienceLevel, Gender, Language, LanguageLevel,
+                           MedicalCategory, Region, Service, ServicePlace, Specialty, University)
+from clinics.models import Clinic, ClinicType
+from doctors.importers import COLUMN_MAPPING, ERROR_REASON_COLUMN, DoctorImporter, ImportCheckpoint, to_records
+from doctors.models import Doctor, DoctorImportRecord, DoctorLanguage, Education, Workplace
+
+User = get_user_model()
+
+
+class DoctorImporterTestCase(TestCase):
+    def setUp(self):
+        region = Region.objects.create(name_ru='Согд')
+        self.district = District.objects.create(name_ru='Худжанд', region=region)
+        self.gender = Gender.objects.create(name_ru='Мужской')
+        self.experience_level = ExperienceLevel.objects.create(level_ru='0-3 года', level_tg='0-3 сол')
+        self.category = MedicalCategory.objects.create(name_ru='Высшая категория', name_tg='Категорияи олий')
+        self.degree = AcademicDegree.objects.create(name_ru='Кандидат медицинских наук', name_tg='н.и.т.')
+        self.language = Language.objects.create(name_ru='Русский')
+        self.level = LanguageLevel.objects.create(level_ru='Свободно')
+        place = ServicePlace.objects.create(id=2, name_ru='В клинике')
+        self.service = Service.objects.create(service_place=place, name_ru='Выдача рецепта')
+        ClinicType.objects.create(id=1, name_ru='Поликлиника')
+        self.clinic = Clinic.objects.create(
+            name_ru='Городская больница', clinic_type_id=1, district=self.district, address_ru='Адрес'
+        )
+
+    def make_row(self, **values):
+        row = dict.fromkeys(COLUMN_MAPPING.values())
+        row.update({
+            'last_name_ru': 'Иванов',
+            'first_name_ru': 'Иван',
+            'date_of_birth': '01/02/1980',
+            'gender': 'Мужской',
+            'district': 'Худжанд',
+            'work_phone_number': '+992900000001',
+            'experience_level': '0-3 года',
+            'specialty_ru': 'Кардиология',
+            'specialty_tg': 'Кардиология',
+            'medical_category': 'Высшая категория',
+            'academic_degree': 'н.и.т.;',
+            'university_name_ru': 'ТГМУ',
+            'university_city_ru': 'Душанбе',
+            'university_country_ru': 'Таджикистан',
+            'graduation_year': '2005',
+            'clinic_name_ru': 'Городская больница',
+            'position_ru': 'Кардиолог',
+            'about_ru': 'Опытный врач',
+            'strength_ru': 'Внимательность',
+            'lang_ru': 'Свободно',
+            'Выдача рецепта;2': 'Да',
+        })
+        row.update(values)
+        return row
+
+    def run_import(self, rows):
+        return DoctorImporter(batch_size=2).run(pd.DataFrame(rows, dtype=str))
+
+    def test_import_creates_doctor_with_relations(self):
+        result = self.run_import([self.make_row()])
+
+        doctor = Doctor.objects.select_related('user').get()
+        self.assertEqual(doctor.user.phone_number, '+992900000001')
+        self.assertEqual(doctor.user.gender, self.gender)
+        self.assertFalse(doctor.user.has_usable_password())
+        self.assertEqual(doctor.medical_category, self.category)
+        self.assertEqual(doctor.academic_degree, self.degree)
+        self.assertEqual(doctor.about_ru, 'Опытный врач\n\nМои сильные стороны: Внимательность')
+        self.assertTrue(doctor.user.groups.filter(name='Доктор').exists())
+        self.assertEqual(list(doctor.specialties.values_list('name_ru', flat=True)), ['Кардиология'])
+        self.assertEqual(list(doctor.services.all()), [self.service])
+        self.assertEqual(DoctorLanguage.objects.get(doctor=doctor).level, self.level)
+        self.assertEqual(Workplace.objects.get(doctor=doctor).clinic, self.clinic)
+        self.assertEqual(Education.objects.get(doctor=doctor).university.name, 'ТГМУ')
+        self.assertEqual(result.created['doctors'], 1)
+        self.assertTrue(result.errors.empty)
+
+    def test_invalid_rows_are_reported(self):
+        result = self.run_import([
+            self.make_row(work_phone_number='12345'),
+            self.make_row(work_phone_number='+992900000002', date_of_birth='1980-02-01'),
+            self.make_row(work_phone_number='+992900000003', inn='123'),
+            self.make_row(work_phone_number='+992900000004', gender='Неизвестно'),
+            self.make_row(work_phone_number='+992900000005'),
+            self.make_row(work_phone_number='+992900000005'),
+        ])
+
+        self.assertEqual(list(result.errors[ERROR_REASON_COLUMN]), [
+            'Неверный номер телефона',
+            'Неверная дата рождения',
+            'Неверный ИНН',
+            'Неверный пол',
+            'Номер телефона повторяется в файле',
+        ])
+        self.assertEqual(list(result.errors.index), [0, 1, 2, 3, 5])
+        self.assertIn('Ваш номер телефона для связи с пациентами', result.errors.columns)
+        self.assertEqual(Doctor.objects.count(), 1)
+
+    def test_reimport_updates_existing_records(self):
+        self.run_import([self.make_row(), self.make_row(work_phone_number='+992900000002', clinic_name_ru='Новая клиника')])
+        result = self.run_import([self.make_row(first_name_ru='Пётр', lang_ru='Базовый')])
+
+        self.assertEqual(User.objects.get(phone_number='+992900000001').first_name, 'Пётр')
+        self.assertEqual(result.updated['doctors'], 1)
+        self.assertEqual(Doctor.objects.count(), 2)
+        self.assertEqual(Workplace.objects.count(), 2)
+        self.assertEqual(Education.objects.count(), 2)
+        self.assertEqual(Specialty.objects.count(), 1)
+        self.assertEqual(University.objects.count(), 1)
+        self.assertEqual(Clinic.objects.filter(name_ru='Новая клиника').count(), 1)
+        # Уровень "Базовый" не найден в справочнике, прежний уровень сохраняется
+        self.assertEqual(DoctorLanguage.objects.filter(doctor__user__phone_number='+992900000001').count(), 1)
+
+    def test_inn_of_another_user_is_rejected(self):
+        User.objects.create_user(phone_number='+992911111111', password='pass', first_name='Пациент',
+                                 date_of_birth='1990-01-01', inn='123456789')
+
+        result = self.run_import([self.make_row(inn='123456789')])
+
+        self.assertEqual(list(result.errors[ERROR_REASON_COLUMN]), ['ИНН принадлежит другому пользователю'])
+        self.assertFalse(Doctor.objects.exists())
+
+    def test_unchanged_rows_are_skipped(self):
+        self.run_import([self.make_row(), self.make_row(work_phone_number='+992900000002')])
+
+        with self.assertNumQueries(9):
+            result = self.run_import([self.make_row(), self.make_row(work_phone_number='+992900000002')])
+
+        self.assertEqual(result.skipped, 2)
+        self.assertEqual(result.updated, {})
+
+    def test_changed_rows_update_only_affected_fields(self):
+        self.run_import([self.make_row()])
+        Doctor.objects.update(about_ru='Отредактировано в админке')
+
+        result = self.run_import([self.make_row(first_name_ru='Пётр')])
+
+        doctor = Doctor.objects.select_related('user').get()
+        self.assertEqual(doctor.user.first_name, 'Пётр')
+        self.assertEqual(doctor.about_ru, 'Отредактировано в админке')
+        self.assertEqual(result.updated['users'], 1)
+        self.assertEqual(DoctorImportRecord.objects.get().data['first_name_ru'], 'Пётр')
+
+    def test_changed_fields_are_not_applied_to_other_rows_of_batch(self):
+        first, second = '+992900000001', '+992900000002'
+        self.run_import([self.make_row(), self.make_row(work_phone_number=second)])
+        Doctor.objects.filter(user__phone_number=first).update(about_ru='Отредактировано в админке')
+        User.objects.filter(phone_number=second).update(first_name='Изменено в админке')
+
+        # В одной пачке у первой строки изменилось имя, у второй - описание
+        self.run_import([
+            self.make_row(first_name_ru='Пётр'),
+            self.make_row(work_phone_number=second, about_ru='Новое описание'),
+        ])
+
+        doctors = {doctor.user.phone_number: doctor for doctor in Doctor.objects.select_related('user')}
+        self.assertEqual(doctors[first].user.first_name, 'Пётр')
+        self.assertEqual(doctors[first].about_ru, 'Отредактировано в админке')
+        self.assertEqual(doctors[second].user.first_name, 'Изменено в админке')
+        self.assertEqual(doctors[second].about_ru, 'Новое описание\n\nМои сильные стороны: Внимательность')
+
+    def test_dry_run_reports_diff_without_writing(self):
+        self.run_import([self.make_row()])
+
+        result = DoctorImporter().run(pd.DataFrame([
+            self.make_row(first_name_ru='Пётр'),
+            self.make_row(work_phone_number='+992900000002'),
+        ], dtype=str), dry_run=True)
+
+        self.assertEqual(to_records(result.diff[['key', 'status', 'column', 'old', 'new']]), [
+            {'key': '+992900000001', 'status': 'changed', 'column': 'first_name_ru', 'old': 'Иван', 'new': 'Пётр'},
+            {'key': '+992900000002', 'status': 'new', 'column': None, 'old': None, 'new': None},
+        ])
+        self.assertEqual(User.objects.get().first_name, 'Иван')
+
+    def test_import_resumes_from_checkpoint(self):
+        path = os.path.join(tempfile.mkdtemp(), 'checkpoint.json')
+        rows = pd.DataFrame([self.make_row(work_phone_number=f'+99290000000{index}') for index in range(4)], dtype=str)
+        checkpoint = ImportCheckpoint(path, 'source')
+        checkpoint.save(1)
+
+        DoctorImporter(batch_size=1).run(rows, checkpoint=checkpoint)
+
+        self.assertEqual(sorted(User.objects.values_list('phone_number', flat=True)), ['+992900000002', '+992900000003'])
+        self.assertFalse(os.path.exists(path))
+        # Checkpoint другого файла не применяется
+        ImportCheckpoint(path, 'other').save(3)
+        self.assertIsNone(ImportCheckpoint(path, 'source').load())
+
+    def test_parallel_prepare_matches_single_process(self):
+        rows = [self.make_row(work_phone_number=f'+99290000000{index}') for index in range(6)]
+        rows[1]['gender'] = 'Неизвестно'
+        rows[4]['work_phone_number'] = rows[3]['work_phone_number']
+        df = pd.DataFrame(rows, dtype=str)
+
+        result = DoctorImporter(workers=3).run(df, dry_run=True)
+
+        single = DoctorImporter().run(df, dry_run=True)
+        self.assertEqual(list(result.errors[ERROR_REASON_COLUMN]), ['Неверный пол', 'Номер телефона повторяется в файле'])
+        pd.testing.assert_frame_equal(result.errors, single.errors)
+        pd.testing.assert_frame_equal(result.diff, single.diff)
@@ -0,0 +1,83 @@
+from datetime import datetime, time
+
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from a_base.benchmarks import seed_data
+from a_base.models import AppointmentStatus, Language, LanguageLevel
+from appointments.models import Appointment
+from appointments.statuses import STATUS_UPCOMING
+from doctors.availability import next_free_slots
+from doctors.models import Doctor, DoctorLanguage
+from doctors.ranking import DEFAULT_WEIGHTS, rank_doctors
+
+User = get_user_model()
+
+
+def only_weight(name):
+    return {key: 1.0 if key == name else 0.0 for key in DEFAULT_WEIGHTS}
+
+
+class DoctorRankingTestCase(APITestCase):
+    volumes = {'doctors': 12, 'patients': 4, 'clinics': 3, 'appointments': 150, 'messages': 0}
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_data(cls.volumes)
+        cls.staff = User.objects.filter(is_staff=True).first()
+        cls.doctors = list(Doctor.objects.order_by('id'))
+        cls.language = Language.objects.create(name='Узбекский')
+        DoctorLanguage.objects.create(
+            doctor=cls.doctors[5], language=cls.language, level=LanguageLevel.objects.create(level='Родной')
+        )
+        # Понедельник 8:00 - начало рабочего дня мест работы из генератора
+        cls.monday = timezone.make_aware(datetime(2030, 1, 7, 7, 0))
+
+    def test_scores_sorted_and_limited(self):
+        ranked = rank_doctors(Doctor.objects.all(), location=(38.9, 69.1), limit=5)
+
+        self.assertEqual(len(ranked), 5)
+        scores = [item['score'] for item in ranked]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        self.assertTrue(all(item['distance_km'] is not None for item in ranked))
+
+    def test_language_match_ranks_first(self):
+        with override_settings(DOCTOR_RANKING_WEIGHTS=only_weight('language')):
+            ranked = rank_doctors(Doctor.objects.all(), languages=[self.language.pk], limit=3)
+        # Кандидаты отбираются по языку
+        self.assertEqual([item['doctor'] for item in ranked], [self.doctors[5].pk])
+
+    def test_specialty_filters_candidates(self):
+        specialty = self.doctors[0].specialties.first()
+        ranked = rank_doctors(Doctor.objects.all(), specialties=[specialty.pk], limit=50)
+
+        expected = set(Doctor.objects.filter(specialties=specialty).values_list('id', flat=True))
+        self.assertEqual({item['doctor'] for item in ranked}, expected)
+
+    def test_next_free_slot_skips_booked(self):
+        doctor = self.doctors[0]
+        Appointment.objects.create(
+            doctor=doctor, patient=Appointment.objects.first().patient,
+            status=AppointmentStatus.objects.get(name_ru=STATUS_UPCOMING),
+            appointment_date=self.monday.date(), start_time=time(8), end_time=time(8, 30),
+            phone_number='+992900000000',
+        )
+        slots = next_free_slots([doctor.pk, self.doctors[1].pk], now=self.monday)
+
+        self.assertEqual(slots[doctor.pk][0], datetime(2030, 1, 7, 8, 30))
+        self.assertEqual(slots[self.doctors[1].pk][0], datetime(2030, 1, 7, 8, 0))
+
+    def test_recommended_endpoint(self):
+        self.client.force_authenticate(self.staff)
+        response = self.client.get(reverse('doctor-recommended'), {'limit': 4, 'latitude': 38.9, 'longitude': 69.1})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 4)
+        self.assertEqual({'id', 'name', 'score', 'distance_km', 'next_available_at'} - set(response.data[0]), set())
+
+        response = self.client.get(reverse('doctor-recommended'), {'specialty': 'x'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
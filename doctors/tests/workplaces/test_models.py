@@ -0,0 +1,143 @@
+from datetime import date, datetime, time, timedelta
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from a_base.benchmarks import seed_data
+from appointments.booking import validate_slots
+from doctors.availability import first_free_slot
+from doctors.models import Doctor, ScheduleException, Workplace, WorkplaceSchedule
+from patients.models import Patient
+
+User = get_user_model()
+
+SATURDAY = 5
+
+
+class WorkplaceScheduleTestCase(APITestCase):
+    volumes = {'doctors': 2, 'patients': 1, 'clinics': 2, 'appointments': 0, 'messages': 0}
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_data(cls.volumes)
+        cls.staff = User.objects.filter(is_staff=True).first()
+        cls.doctor, cls.other_doctor = Doctor.objects.order_by('id')
+        cls.workplace = cls.doctor.workplaces.get()
+        # Суббота с перерывом: 9-13 и 17-20
+        for start, end in ((time(9), time(13)), (time(17), time(20))):
+            WorkplaceSchedule.objects.create(workplace=cls.workplace, weekday=SATURDAY, start_time=start, end_time=end)
+        cls.saturday = date(2030, 1, 5)
+
+    def intervals(self, workplace, weekday):
+        return list(workplace.schedule.filter(weekday=weekday).values_list('start_time', 'end_time'))
+
+    def test_schedule_and_columns_stay_in_sync(self):
+        """Интервалы переносятся в столбцы границами дня, изменение столбцов заменяет интервалы дня"""
+        workplace = Workplace.objects.get(pk=self.workplace.pk)
+        self.assertEqual((workplace.saturday_start, workplace.saturday_end), (time(9), time(20)))
+        self.assertEqual(self.intervals(workplace, 0), [(time(8), time(16))])
+
+        # Сохранение без изменения столбцов не трогает прием с перерывом
+        workplace.position = 'Заведующий'
+        workplace.save()
+        self.assertEqual(len(self.intervals(workplace, SATURDAY)), 2)
+
+        workplace.monday_end = time(12)
+        workplace.tuesday_start, workplace.tuesday_end = time(10), time(14)
+        workplace.friday_start = workplace.friday_end = None
+        workplace.save()
+        self.assertEqual(self.intervals(workplace, 0), [(time(8), time(12))])
+        self.assertEqual(self.intervals(workplace, 1), [(time(10), time(14))])
+        self.assertEqual(self.intervals(workplace, 4), [])
+        self.assertEqual(len(self.intervals(workplace, SATURDAY)), 2)
+
+        WorkplaceSchedule.objects.get(workplace=workplace, weekday=1).delete()
+        workplace.refresh_from_db()
+        self.assertIsNone(workplace.working_hours(1))
+
+    def test_exceptions_cut_working_intervals(self):
+        ScheduleException.objects.create(
+            workplace=self.workplace, date_from=self.saturday, date_to=self.saturday,
+            start_time=time(12), end_time=time(18), reason=ScheduleException.Reason.OTHER,
+        )
+        ScheduleException.objects.create(
+            workplace=self.workplace, date_from=self.saturday + timedelta(days=7),
+            date_to=self.saturday + timedelta(days=14), reason=ScheduleException.Reason.VACATION,
+        )
+        workplace = Workplace.objects.prefetch_related('schedule', 'schedule_exceptions').get(pk=self.workplace.pk)
+
+        self.assertEqual(workplace.working_intervals(self.saturday), [(time(9), time(12)), (time(18), time(20))])
+        self.assertEqual(workplace.working_intervals(self.saturday + timedelta(days=7)), [])
+        self.assertEqual(workplace.working_intervals(self.saturday - timedelta(days=7)),
+                         [(time(9), time(13)), (time(17), time(20))])
+
+        # Первый свободный слот после перерыва
+        busy = [(time(9), time(12))]
+        self.assertEqual(
+            first_free_slot(workplace, self.saturday, busy, datetime(2030, 1, 1)), datetime(2030, 1, 5, 18, 0)
+        )
+
+    def test_booking_respects_break(self):
+        patient = Patient.objects.get()
+        slots = [
+            {'index': index, 'patient': patient.pk, 'appointment_date': self.saturday, 'start_time': start}
+            for index, start in enumerate((time(12, 30), time(13, 30), time(17)))
+        ]
+        valid, failed = validate_slots(self.doctor.pk, slots, now=timezone.make_aware(datetime(2030, 1, 1)))
+
+        self.assertEqual([slot['index'] for slot in valid], [0, 2])
+        self.assertEqual(failed[0]['errors'], {'start_time': ['Прием вне рабочего времени 09:00-13:00, 17:00-20:00']})
+
+    def test_doctor_and_clinic_filters(self):
+        self.client.force_authenticate(self.staff)
+
+        response = self.client.get(reverse('doctor-list'), {'work_weekday': SATURDAY, 'works_after': '18:00'})
+        self.assertEqual([card['id'] for card in response.data], [self.doctor.pk])
+
+        response = self.client.get(reverse('doctor-list'), {'work_weekday': SATURDAY, 'works_after': '20:00'})
+        self.assertEqual(response.data, [])
+
+        # В перерыве с 13 до 17 врач не принимает
+        response = self.client.get(
+            reverse('doctor-list'), {'work_weekday': SATURDAY, 'works_after': '13:30', 'works_before': '16:30'}
+        )
+        self.assertEqual(response.data, [])
+
+        response = self.client.get(reverse('doctor-list'), {'works_before': '08:30'})
+        self.assertEqual({card['id'] for card in response.data}, {self.doctor.pk, self.other_doctor.pk})
+
+        response = self.client.get(reverse('clinic-list'), {'work_weekday': SATURDAY})
+        self.assertEqual([clinic['id'] for clinic in response.data], [self.workplace.clinic_id])
+
+        ScheduleException.objects.create(
+            workplace=self.workplace, date_from=self.saturday, date_to=self.saturday,
+            reason=ScheduleException.Reason.HOLIDAY,
+        )
+        response = self.client.get(reverse('doctor-list'), {'work_date': self.saturday.isoformat()})
+        self.assertEqual(response.data, [])
+        response = self.client.get(reverse('doctor-list'), {'work_date': (self.saturday + timedelta(days=7)).isoformat()})
+        self.assertEqual([card['id'] for card in response.data], [self.doctor.pk])
+
+    def test_schedule_api(self):
+        self.client.force_authenticate(self.staff)
+        url = reverse('workplace-schedule-list')
+
+        response = self.client.post(url, {
+            'workplace': self.workplace.pk, 'weekday': SATURDAY, 'start_time': '12:00', 'end_time': '14:00'
+        })
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.post(url, {
+            'workplace': self.workplace.pk, 'weekday': 6, 'start_time': '10:00', 'end_time': '14:00'
+        })
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.workplace.refresh_from_db()
+        self.assertEqual(self.workplace.working_hours(6), (time(10), time(14)))
+
+        response = self.client.post(reverse('schedule-exception-list'), {
+            'workplace': self.workplace.pk, 'date_from': '2030-01-10', 'date_to': '2030-01-01', 'reason': 'vacation'
+        })
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
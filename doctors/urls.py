@@ -1,10 +1,13 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import DoctorViewSet, WorkplaceViewSet, EducationViewSet
+from .views import (DoctorViewSet, WorkplaceViewSet, EducationViewSet, WorkplaceScheduleViewSet,
+                    ScheduleExceptionViewSet)
 
 router = DefaultRouter()
 router.register(r'doctors', DoctorViewSet, basename='doctor')
 router.register(r'workplaces', WorkplaceViewSet, basename='workplace')
+router.register(r'workplace-schedules', WorkplaceScheduleViewSet, basename='workplace-schedule')
+router.register(r'schedule-exceptions', ScheduleExceptionViewSet, basename='schedule-exception')
 router.register(r'educations', EducationViewSet, basename='education')
 
 urlpatterns = [
@@ -1,3 +1,4 @@
 from .doctors import DoctorViewSet
 from .workplaces import WorkplaceViewSet
-from .educations import EducationViewSet
\ No newline at end of file
+from .educations import EducationViewSet
+from .schedules import WorkplaceScheduleViewSet, ScheduleExceptionViewSet
\ No newline at end of file
@@ -1,29 +1,81 @@
 # doctors/views/doctor.py
 from rest_framework import viewsets, status
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.permissions import IsAuthenticated
+from django.db.models import Avg, Count, IntegerField, OuterRef, Prefetch, Subquery, Value
+from django.db.models.functions import Coalesce
 
-from doctors.models import Doctor
-from doctors.serializers import DoctorSerializer, DoctorUpdateSerializer
+from doctors.models import Doctor, Workplace
+from appointments.models import Review
+from doctors.serializers import DoctorSerializer, DoctorUpdateSerializer, DoctorCardSerializer
+from a_base.serializers.mixins import parse_fields_param
 from doctors.filters import DoctorFilter
 from doctors.permissions import IsDoctorOwnerOrReadOnly
+from a_base.views.mixins import DeferTranslationsMixin
+from doctors.ranking import district_location, rank_doctors
 
-class DoctorViewSet(viewsets.ModelViewSet):
+# Максимальное количество врачей в подборке
+RECOMMENDED_MAX_LIMIT = 50
+
+class DoctorViewSet(DeferTranslationsMixin, viewsets.ModelViewSet):
     queryset = Doctor.objects.all()
     serializer_class = DoctorSerializer
     permission_classes = [IsAuthenticated, IsDoctorOwnerOrReadOnly]
     filter_backends = [DjangoFilterBackend]
     filterset_class = DoctorFilter
 
+    # Связи, которые нужно загрузить для полей карточки из ?expand=
+    card_expand_related = {
+        'medical_category': ('medical_category', None),
+        'academic_degree': ('academic_degree', None),
+        'experience_level': ('experience_level', None),
+        'services': (None, 'services__service_place'),
+    }
+
     def get_serializer_class(self):
+        if self.action in ['list', 'recommended']:
+            return DoctorCardSerializer
         if self.action in ['update', 'partial_update']:
             return DoctorUpdateSerializer
         return DoctorSerializer
 
+    def get_card_queryset(self, queryset):
+        """
+        Загружает только то, что нужно карточкам врачей: пользователя без приватных полей,
+        специализации, первую клинику и рейтинг по опубликованным отзывам.
+        Рейтинг считается подзапросами, чтобы фильтры по связям "многие ко многим" его не искажали.
+        """
+        expand = parse_fields_param(self.request.query_params.get('expand', ''))
+        expanded = [self.card_expand_related[name] for name in expand & set(self.card_expand_related)]
+        select = [related for related, _ in expanded if related]
+        prefetch = [related for _, related in expanded if related]
+
+        reviews = Review.objects.filter(
+            doctor=OuterRef('pk'), is_published=True
+        ).values('doctor')
+
+        return queryset.select_related('user', *select).only(
+            'id', 'created_at', 'next_available_at', 'user__first_name', 'user__last_name',
+            'user__middle_name', 'user__profile_picture', *select,
+        ).prefetch_related(
+            'specialties',
+            Prefetch('workplaces', queryset=Workplace.objects.select_related('clinic').order_by('id')),
+            *prefetch,
+        ).annotate(
+            rating=Subquery(reviews.annotate(value=Avg('rating')).values('value')),
+            reviews_count=Coalesce(
+                Subquery(reviews.annotate(value=Count('id')).values('value')),
+                Value(0), output_field=IntegerField()
+            ),
+        )
+
     def get_queryset(self):
         queryset = super().get_queryset()
+        if self.action == 'list':
+            queryset = self.get_card_queryset(queryset)
         
         # Для администраторов возвращаем все записи
         if self.request.user.is_staff:
@@ -60,4 +112,50 @@ class DoctorViewSet(viewsets.ModelViewSet):
             return Doctor.objects.none()
         else:
             # Для других типов подписок (если будут добавлены)
-            return Doctor.objects.none()
\ No newline at end of file
+            return Doctor.objects.none()
+
+    def get_id_list_param(self, name):
+        try:
+            return [int(value) for value in self.request.query_params.getlist(name) if value]
+        except ValueError:
+            raise ValidationError({name: 'Ожидаются id'})
+
+    def get_patient_location(self):
+        """Координаты из ?latitude=&longitude= или центр района проживания пользователя"""
+        params = self.request.query_params
+        if params.get('latitude') and params.get('longitude'):
+            try:
+                return float(params['latitude']), float(params['longitude'])
+            except ValueError:
+                raise ValidationError({'latitude': 'Ожидаются координаты'})
+        return district_location(self.request.user.district_id)
+
+    @action(detail=False, methods=['get'])
+    def recommended(self, request):
+        """
+        Лучшие врачи для пациента по рейтингу, числу отзывов, расстоянию до клиники, ближайшему свободному
+        слоту и совпадению специализаций и языков (см. doctors.ranking).
+        Параметры: ?specialty= и ?language= (можно несколько), ?latitude=&longitude=, ?limit= (до 50).
+        """
+        try:
+            limit = min(int(request.query_params.get('limit', 10)), RECOMMENDED_MAX_LIMIT)
+        except ValueError:
+            raise ValidationError({'limit': 'Ожидается число'})
+        if limit < 1:
+            raise ValidationError({'limit': 'Ожидается положительное число'})
+
+        ranked = rank_doctors(
+            self.get_queryset(),
+            specialties=self.get_id_list_param('specialty'),
+            languages=self.get_id_list_param('language'),
+            location=self.get_patient_location(),
+            limit=limit,
+        )
+        doctors = self.get_card_queryset(Doctor.objects.filter(id__in=[item['doctor'] for item in ranked]))
+        cards = {card['id']: card for card in self.get_serializer(doctors, many=True).data}
+        results = []
+        for item in ranked:
+            doctor_id = item.pop('doctor')
+            if doctor_id in cards:
+                results.append({**cards[doctor_id], **item})
+        return Response(results)
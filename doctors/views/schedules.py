@@ -0,0 +1,21 @@
+from rest_framework import viewsets
+from django_filters.rest_framework import DjangoFilterBackend
+
+from doctors.models import ScheduleException, WorkplaceSchedule
+from doctors.serializers import ScheduleExceptionSerializer, WorkplaceScheduleSerializer
+
+
+class WorkplaceScheduleViewSet(viewsets.ModelViewSet):
+    """Рабочие интервалы мест работы. Изменения переносятся в столбцы расписания Workplace."""
+    queryset = WorkplaceSchedule.objects.all()
+    serializer_class = WorkplaceScheduleSerializer
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ['workplace', 'weekday']
+
+
+class ScheduleExceptionViewSet(viewsets.ModelViewSet):
+    """Праздники, отпуска и другие периоды без приема"""
+    queryset = ScheduleException.objects.all()
+    serializer_class = ScheduleExceptionSerializer
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ['workplace', 'reason']
@@ -4,5 +4,5 @@ from doctors.models import Workplace
 from doctors.serializers import WorkplaceSerializer
 
 class WorkplaceViewSet(viewsets.ModelViewSet):
-    queryset = Workplace.objects.all()
+    queryset = Workplace.objects.prefetch_related('schedule')
     serializer_class = WorkplaceSerializer
@@ -1 +1 @@
-from .patients import PatientPublicSerializer, PatientPrivateSerializer
\ No newline at end of file
+from .patients import PatientPublicSerializer, PatientPrivateSerializer, PatientCardSerializer
\ No newline at end of file
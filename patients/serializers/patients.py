@@ -17,6 +17,16 @@ class PatientPublicSerializer(serializers.ModelSerializer):
         ]
 
 
+class PatientCardSerializer(serializers.ModelSerializer):
+    """Компактная карточка пациента для списков: имя и фото. Ожидает select_related('user')."""
+    name = serializers.CharField(source='user.get_full_name', read_only=True)
+    photo = serializers.ImageField(source='user.profile_picture', read_only=True)
+
+    class Meta:
+        model = Patient
+        fields = ['id', 'name', 'photo']
+
+
 class PatientPrivateSerializer(serializers.ModelSerializer):
     user = CustomUserPrivateSerializer()
     social_status = SocialStatusSerializer(read_only=True)
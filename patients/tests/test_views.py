@@ -260,7 +260,8 @@ class PatientAPIViewTestCase(APITestCase):
         access_token = response.data['access']
         response = self.api_client.get(self.doctor_list, HTTP_AUTHORIZATION=f'Bearer {access_token}', HTTP_ACCEPT_LANGUAGE='tg')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data[0]['user']['last_name'], self.doctor_dushanbe.user.last_name)
+        self.assertEqual(response.data[0]['id'], self.doctor_dushanbe.id)
+        self.assertEqual(response.data[0]['name'], self.doctor_dushanbe.user.get_full_name)
 
     def test_get_own_user_object(self):
         """Пользователь получает только свой профиль пациента"""
@@ -96,6 +96,12 @@ SMSAERO_API_KEY = os.getenv("SMSAERO_API_KEY")
 SMSAERO_EMAIL = os.getenv("SMSAERO_EMAIL")
 SMSAERO_FROM = os.getenv("SMSAERO_FROM")
 
+# Каналы напоминаний о приемах (push, sms, email), см. appointments.reminders
+APPOINTMENT_REMINDER_CHANNELS = os.getenv('APPOINTMENT_REMINDER_CHANNELS', 'push').split(',')
+
+# Сколько минут пациент из листа ожидания может подтвердить предложенный слот, см. appointments.waitlist
+WAITLIST_HOLD_MINUTES = int(os.getenv('WAITLIST_HOLD_MINUTES', 15))
+
 # ==================================================
 # Настройки REST Framework
 # ==================================================
@@ -154,20 +160,65 @@ DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL")
 # ==================================================
 
 MIDDLEWARE = [
+    'a_base.instrumentation.InstrumentationMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    'django.middleware.locale.LocaleMiddleware',
+    'a_base.middleware.RequestLanguageMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
-    'django.middleware.cache.UpdateCacheMiddleware',
     'django.middleware.common.CommonMiddleware',
-    'django.middleware.cache.FetchFromCacheMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
-CACHE_MIDDLEWARE_SECONDS = 0  # Отключаем кэширование
+# ==================================================
+# Инструментация запросов (метрики и логи)
+# ==================================================
+
+# Включать только там, где нужны метрики (например, на staging)
+INSTRUMENTATION_ENABLED = os.getenv('INSTRUMENTATION_ENABLED', 'False') == 'True'
+# Сколько одинаковых SQL-запросов за один HTTP-запрос считать признаком N+1
+INSTRUMENTATION_N_PLUS_ONE_THRESHOLD = int(os.getenv('INSTRUMENTATION_N_PLUS_ONE_THRESHOLD', 5))
+# Токен для доступа к /metrics/ (если не задан, эндпоинт доступен только сотрудникам)
+INSTRUMENTATION_METRICS_TOKEN = os.getenv('INSTRUMENTATION_METRICS_TOKEN')
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'rating.instrumentation': {
+            'handlers': ['console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+    },
+}
+
+# ==================================================
+# Настройки кэша
+# ==================================================
+
+# Кэш общий для всех процессов: версии ключей сбрасываются сигналами в том процессе, где изменились
+# данные (воркер, команда управления), и остальные процессы должны видеть новую версию.
+# По умолчанию - таблица в базе данных (python manage.py createcachetable).
+# Для Redis: CACHE_BACKEND=django.core.cache.backends.redis.RedisCache, CACHE_LOCATION=redis://host:6379/0
+# (нужен пакет redis). Локальный кэш процесса (LocMemCache) подходит только для одного процесса.
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.db.DatabaseCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', 'django_cache'),
+    }
+}
+
+# Время жизни закэшированных ответов справочников (в секундах).
+# Кэш дополнительно сбрасывается при изменении записей справочника.
+CATALOG_CACHE_TIMEOUT = int(os.getenv('CATALOG_CACHE_TIMEOUT', 60 * 60))
 
 # ==================================================
 # Настройки URL и шаблонов
@@ -1,6 +1,7 @@
 from django.contrib import admin
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 from django.urls import path, include
+from a_base.views import metrics_view
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -17,4 +18,5 @@ urlpatterns = [
     path('api/', include("clinics.urls")),
 
     path('notifications/', include("notifications.urls")),
+    path('metrics/', metrics_view, name='metrics'),
 ]